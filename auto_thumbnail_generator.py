@@ -9,17 +9,39 @@
 
 import os
 import re
-import requests
 import yaml
 from pathlib import Path
 from PIL import Image, ImageDraw, ImageFont, ImageFilter, ImageEnhance
-import io
 import json
+import shutil
+import tempfile
 import time
 from datetime import datetime
 from typing import List, Dict, Optional, Tuple
 import hashlib
 
+import image_pipeline
+from changed_posts import changed_posts
+from image_library import DEFAULT_LIBRARY_DIR, StockLibrary
+from image_palette import extract_palette, hex_to_rgb, overlay_scheme
+from image_placeholders import PlaceholderStore
+from memory_budget import DEFAULT_BUDGET_MB, MB, MemoryBudget, MemoryMonitor, estimate_image_bytes
+from pipeline_executor import Pipeline, Stage
+from smart_crop import smart_process_image
+
+# 이미지 검색 백엔드: local(_stock_images/ 로컬 라이브러리), unsplash(source.unsplash.com)
+IMAGE_PROVIDERS = ('local', 'unsplash')
+DEFAULT_PROVIDERS = 'local,unsplash'
+
+
+def parse_providers(value: str) -> List[str]:
+    """'local,unsplash' 형식의 검색 백엔드 목록 (앞에서부터 조회)"""
+    providers = [name.strip().lower() for name in value.split(',') if name.strip()]
+    unknown = [name for name in providers if name not in IMAGE_PROVIDERS]
+    if unknown or not providers:
+        raise ValueError(f"지원하지 않는 이미지 검색 백엔드입니다: {value} (가능: {', '.join(IMAGE_PROVIDERS)})")
+    return providers
+
 
 class AutoThumbnailGenerator:
     """포스트 키워드 기반 자동 썸네일 생성기"""
@@ -37,12 +59,42 @@ class AutoThumbnailGenerator:
         # 캐시 파일 경로
         self.cache_file = self.cache_dir / "keyword_cache.json"
         self.image_cache_file = self.cache_dir / "image_cache.json"
+        self.palette_cache_file = self.cache_dir / "palette_cache.json"
+        self.source_cache_dir = self.cache_dir / "sources"
+        self.source_cache_file = self.cache_dir / "source_cache.json"  # 원본 사본의 URL/검증자 (git 제외)
+        self.source_cache_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_ttl = 86400  # 24시간
         
         # 키워드 매핑 로드
         self.keyword_mapping = self._load_keyword_mapping()
         
         # 이미지 캐시 로드
         self.image_cache = self._load_image_cache()
+        self.palette_cache = self._load_palette_cache()
+        self.source_cache = self._load_source_cache()
+        
+        # 저화질 플레이스홀더 (_data/placeholders.json, index.html 카드에서 인라인)
+        self.placeholders = PlaceholderStore(self.workspace_path / "_data" / "placeholders.json")
+        
+        # 다운로드/인코딩 설정
+        self.http_headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        }
+        self.output_codec = 'webp'
+        self.smart_crop = False  # True: 중앙 대신 엣지/엔트로피 점수가 가장 높은 영역으로 크롭
+        
+        # 이미지 검색 백엔드 (앞에서부터 조회해 후보를 채움, 환경 변수 THUMBNAIL_PROVIDERS/THUMBNAIL_STOCK_DIR)
+        self.image_providers = parse_providers(os.environ.get('THUMBNAIL_PROVIDERS', DEFAULT_PROVIDERS))
+        self.stock_dir = Path(os.environ.get('THUMBNAIL_STOCK_DIR', self.workspace_path / DEFAULT_LIBRARY_DIR))
+        self._stock_library: Optional[StockLibrary] = None
+        
+        # 일괄 처리 파이프라인 (render_workers 가 0 이면 포스트를 하나씩 순서대로 처리)
+        self.render_workers = 0
+        self.fetch_workers = 8
+        self.queue_size = 4
+        self.memory_budget_mb = DEFAULT_BUDGET_MB  # 동시에 처리 중인 이미지의 추정 메모리 합 한도
+        self._budget: Optional[MemoryBudget] = None
+        self._monitor: Optional[MemoryMonitor] = None
         
         # 색상 팔레트
         self.color_schemes = {
@@ -119,6 +171,32 @@ class AutoThumbnailGenerator:
         
         return {}
 
+    def _load_palette_cache(self) -> Dict:
+        """원본 해시별 대표 색 팔레트 캐시 로드"""
+        if self.palette_cache_file.exists():
+            try:
+                with open(self.palette_cache_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except Exception as e:
+                print(f"⚠️ 팔레트 캐시 파일 로드 실패: {e}")
+        
+        return {}
+
+    def _load_source_cache(self) -> Dict:
+        """원본 이미지 사본의 URL 해시별 검증자(ETag/Last-Modified) 캐시 로드"""
+        source_cache = {}
+        if self.source_cache_file.exists():
+            try:
+                with open(self.source_cache_file, 'r', encoding='utf-8') as f:
+                    source_cache = json.load(f)
+            except Exception as e:
+                print(f"⚠️ 원본 캐시 파일 로드 실패: {e}")
+        
+        # 예전에는 image_cache.json(git 추적)에 source_<해시> 키로 저장했음
+        for key in [key for key in self.image_cache if key.startswith('source_')]:
+            source_cache.setdefault(key[len('source_'):], self.image_cache.pop(key))
+        return source_cache
+
     def _save_caches(self):
         """캐시 파일들 저장"""
         try:
@@ -127,6 +205,14 @@ class AutoThumbnailGenerator:
             
             with open(self.image_cache_file, 'w', encoding='utf-8') as f:
                 json.dump(self.image_cache, f, ensure_ascii=False, indent=2)
+            
+            with open(self.palette_cache_file, 'w', encoding='utf-8') as f:
+                json.dump(self.palette_cache, f, ensure_ascii=False, indent=2)
+            
+            with open(self.source_cache_file, 'w', encoding='utf-8') as f:
+                json.dump(self.source_cache, f, ensure_ascii=False, indent=2)
+            
+            self.placeholders.save()
                 
         except Exception as e:
             print(f"⚠️ 캐시 저장 실패: {e}")
@@ -340,7 +426,7 @@ class AutoThumbnailGenerator:
             # 캐시 확인
             if cache_key in self.image_cache:
                 cached_data = self.image_cache[cache_key]
-                if time.time() - cached_data['timestamp'] < 86400:  # 24시간 캐시
+                if time.time() - cached_data['timestamp'] < self.cache_ttl:  # 24시간 캐시
                     images.extend(cached_data['images'][:2])
                     continue
             
@@ -377,32 +463,86 @@ class AutoThumbnailGenerator:
         
         return images[:count]
 
+    def load_stock_library(self) -> StockLibrary:
+        """로컬 스톡 이미지 라이브러리 (처음 부를 때 색인 갱신)
+
+        스레드 안전하지 않으므로 파이프라인은 prepare 스레드를 띄우기 전에 한 번 불러 둡니다.
+        """
+        if self._stock_library is None:
+            self._stock_library = StockLibrary(self.stock_dir, self.cache_dir / "stock_index.json").scan()
+            if self._stock_library.analysed or self._stock_library.skipped:
+                print(f"📚 스톡 이미지 색인: {len(self._stock_library)}장 "
+                      f"(새로 분석 {self._stock_library.analysed}장, 건너뜀 {len(self._stock_library.skipped)}장)")
+        return self._stock_library
+
+    def search_images(self, keywords: List[str], count: int = 5) -> List[Dict]:
+        """설정된 검색 백엔드를 순서대로 조회해 후보 이미지 목록 구성 (search_unsplash_images 와 같은 형식)"""
+        images = []
+        for provider in self.image_providers:
+            if provider == 'local':
+                images.extend(self.load_stock_library().search(keywords, count - len(images)))
+            else:
+                images.extend(self.search_unsplash_images(keywords, count - len(images)))
+            if len(images) >= count:
+                break
+        return images[:count]
+
+    def _open_source(self, url: str):
+        """원본 이미지 스트림 열기 (로컬 사본 + ETag/Last-Modified 조건부 재검증)
+
+        - TTL 이내: 네트워크 요청 없이 로컬 사본 사용
+        - TTL 만료: If-None-Match/If-Modified-Since로 재검증, 304면 로컬 사본 재사용
+        - 200 응답: 본문과 검증자를 저장해 다음 재검증에 사용
+        - 로컬 스톡 이미지 경로: 파일을 그대로 엶
+        """
+        if not url.startswith(('http://', 'https://')):
+            return open(url, 'rb')
+        
+        url_hash = hashlib.md5(url.encode()).hexdigest()
+        local_path = self.source_cache_dir / f"{url_hash}.bin"
+        entry = self.source_cache.get(url_hash)
+        
+        if entry and local_path.exists():
+            if time.time() - entry['timestamp'] < self.cache_ttl:
+                return open(local_path, 'rb')
+            validators = entry.get('validators')
+        else:
+            validators = None
+        
+        response_info = {}
+        try:
+            stream = image_pipeline.fetch_stream(url, headers=self.http_headers, validators=validators,
+                                                 response_info=response_info)
+        except image_pipeline.NotModified:
+            print(f"♻️ 원본 이미지 변경 없음 (304), 로컬 사본 사용: {url}")
+            entry['timestamp'] = time.time()
+            return open(local_path, 'rb')
+        
+        # 검증자가 있는 응답만 로컬에 보관 (없으면 재검증할 방법이 없음)
+        if response_info.get('etag') or response_info.get('last_modified'):
+            # 같은 URL 을 여러 fetch 스레드가 동시에 받을 수 있으므로 임시 파일 이름은 매번 고유하게
+            with tempfile.NamedTemporaryFile(dir=self.source_cache_dir, suffix='.tmp', delete=False) as f:
+                shutil.copyfileobj(stream, f)
+            Path(f.name).replace(local_path)
+            stream.seek(0)
+            self.source_cache[url_hash] = {
+                'url': url,
+                'validators': response_info,
+                'timestamp': time.time()
+            }
+        
+        return stream
+
     def download_and_process_image(self, image_info: Dict, output_path: Path, 
                                  metadata: Dict) -> bool:
         """이미지 다운로드 및 처리"""
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            
-            response = requests.get(image_info['url'], headers=headers, timeout=30)
-            response.raise_for_status()
-            
-            # 이미지 열기
-            img = Image.open(io.BytesIO(response.content))
-            
-            # RGB로 변환
-            if img.mode != 'RGB':
-                img = img.convert('RGB')
-            
-            # 크기 조정 (1200x630)
-            img = self._resize_and_crop(img, (1200, 630))
-            
-            # 오버레이 추가
-            img = self._add_overlay(img, metadata)
-            
-            # WebP로 저장
-            img.save(output_path, 'WEBP', quality=85, optimize=True)
+            # 스트리밍 다운로드 → RGB 변환 → 크기 조정 (1200x630) → 오버레이 → WebP 저장
+            with self._open_source(image_info['url']) as stream:
+                source_hash = image_pipeline.stream_digest(stream)
+                palette_key = self._palette_key(source_hash)
+                self.palette_cache[palette_key] = self._render_photo(
+                    stream, metadata, output_path, self.palette_cache.get(palette_key))
             print(f"✅ 이미지 처리 완료: {output_path}")
             return True
             
@@ -410,35 +550,44 @@ class AutoThumbnailGenerator:
             print(f"❌ 이미지 다운로드/처리 실패: {e}")
             return False
 
-    def _resize_and_crop(self, img: Image.Image, size: Tuple[int, int]) -> Image.Image:
-        """이미지 크기 조정 및 크롭"""
-        img_ratio = img.width / img.height
-        target_ratio = size[0] / size[1]
-        
-        if img_ratio > target_ratio:
-            # 이미지가 더 넓음
-            new_height = size[1]
-            new_width = int(new_height * img_ratio)
-            img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-            left = (new_width - size[0]) // 2
-            img = img.crop((left, 0, left + size[0], size[1]))
-        else:
-            # 이미지가 더 높음
-            new_width = size[0]
-            new_height = int(new_width / img_ratio)
-            img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-            top = (new_height - size[1]) // 2
-            img = img.crop((0, top, size[0], top + size[1]))
+    def _render_photo(self, source, metadata: Dict, output_path: Path, palette: Optional[Dict] = None) -> Dict:
+        """원본(스트림/바이트) → 크롭 → 대표 색 오버레이 → 저장. 사용한 팔레트 반환"""
+        src = image_pipeline.open_image(source)
+        img = self._resize_and_crop(src, (1200, 630))
+        if img is not src:
+            src.close()  # 디코딩된 원본은 리사이즈 직후 해제
+        
+        # 오버레이 추가 (색상은 크롭된 이미지의 대표 색으로 선택)
+        palette = palette or extract_palette(img)
+        composed = self._add_overlay(img, metadata, palette)
+        img.close()
         
-        return img
+        # WebP로 저장
+        try:
+            image_pipeline.save_image(composed, output_path, codec=self.output_codec)
+        finally:
+            composed.close()
+        return palette
+
+    def _resize_and_crop(self, img: Image.Image, size: Tuple[int, int]) -> Image.Image:
+        """이미지 크기 조정 및 크롭 (공통 이미지 파이프라인 사용)"""
+        if self.smart_crop:
+            return smart_process_image(img, size)
+        return image_pipeline.process_image(img, size)
+
+    def _palette_key(self, source_hash: str) -> str:
+        """대표 색 팔레트 캐시 키 (원본 해시 + 출력 크기 + 크롭 방식)"""
+        return f"{source_hash}:1200x630{':smart' if self.smart_crop else ''}"
 
-    def _add_overlay(self, img: Image.Image, metadata: Dict) -> Image.Image:
+    def _add_overlay(self, img: Image.Image, metadata: Dict, palette: Optional[Dict] = None) -> Image.Image:
         """이미지에 텍스트 오버레이 추가"""
         overlay = Image.new('RGBA', img.size, (0, 0, 0, 0))
         draw = ImageDraw.Draw(overlay)
         
         # 색상 스키마 선택
-        scheme = self._select_color_scheme(metadata)
+        scheme = self._select_color_scheme(metadata, palette)
+        text_rgb = hex_to_rgb(scheme['text'])
+        shadow_rgb = (255, 255, 255) if sum(text_rgb) < 384 else (0, 0, 0)
         
         # 제목 추출
         title = metadata.get('title', '블로그 포스트')
@@ -447,10 +596,11 @@ class AutoThumbnailGenerator:
         
         # 하단 그라데이션 배경
         gradient_height = 200
+        max_alpha = scheme.get('overlay_alpha', 150)
         for i in range(gradient_height):
-            alpha = int(150 * (i / gradient_height))
+            alpha = int(max_alpha * (i / gradient_height))
             y = img.height - gradient_height + i
-            color = tuple(list(self._hex_to_rgb(scheme['primary'])) + [alpha])
+            color = tuple(list(hex_to_rgb(scheme['primary'])) + [alpha])
             draw.line([(0, y), (img.width, y)], fill=color)
         
         # 한글 지원 폰트 로드 시도
@@ -498,10 +648,10 @@ class AutoThumbnailGenerator:
             for offset in [(3, 3), (2, 2), (1, 1)]:
                 shadow_alpha = 100 - (offset[0] * 20)
                 draw.text((x + offset[0], y + offset[1]), line, font=title_font, 
-                         fill=(0, 0, 0, shadow_alpha))
+                         fill=shadow_rgb + (shadow_alpha,))
             
             # 메인 텍스트 (더 선명하게)
-            draw.text((x, y), line, font=title_font, fill=(255, 255, 255, 255))
+            draw.text((x, y), line, font=title_font, fill=text_rgb + (255,))
         
         # 카테고리/태그 표시
         categories = metadata.get('categories', [])
@@ -512,11 +662,16 @@ class AutoThumbnailGenerator:
                 category_text = categories
                 
             draw.text((50, img.height - 40), category_text, 
-                     font=category_font, fill=tuple(list(self._hex_to_rgb(scheme['secondary'])) + [255]))
+                     font=category_font, fill=tuple(list(hex_to_rgb(scheme['secondary'])) + [255]))
         
-        # 오버레이 합성
-        img = Image.alpha_composite(img.convert('RGBA'), overlay)
-        return img.convert('RGB')
+        # 오버레이 합성 (RGBA 중간 이미지는 바로 해제)
+        base = img.convert('RGBA')
+        composed = Image.alpha_composite(base, overlay)
+        base.close()
+        overlay.close()
+        result = composed.convert('RGB')
+        composed.close()
+        return result
 
     def _wrap_text(self, text: str, font, max_width: int) -> List[str]:
         """텍스트를 여러 줄로 래핑 (한글 지원)"""
@@ -579,7 +734,13 @@ class AutoThumbnailGenerator:
         """한글 문자인지 확인"""
         return '\uac00' <= char <= '\ud7af' or '\u3131' <= char <= '\u318e'
 
-    def _select_color_scheme(self, metadata: Dict) -> Dict:
+    def _select_color_scheme(self, metadata: Dict, palette: Optional[Dict] = None) -> Dict:
+        """색상 스키마 선택 (팔레트가 있으면 이미지 대표 색 기준, 없으면 메타데이터 기준)"""
+        if palette:
+            return overlay_scheme(palette, self._keyword_color_scheme(metadata))
+        return self._keyword_color_scheme(metadata)
+
+    def _keyword_color_scheme(self, metadata: Dict) -> Dict:
         """메타데이터를 기반으로 색상 스키마 선택"""
         categories = metadata.get('categories', [])
         tags = metadata.get('tags', [])
@@ -612,11 +773,6 @@ class AutoThumbnailGenerator:
         
         return self.color_schemes['default']
 
-    def _hex_to_rgb(self, hex_color: str) -> Tuple[int, int, int]:
-        """HEX 색상을 RGB로 변환"""
-        hex_color = hex_color.lstrip('#')
-        return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-
     def create_fallback_image(self, metadata: Dict, output_path: Path) -> bool:
         """키워드 기반 이미지 검색 실패 시 폴백 이미지 생성"""
         try:
@@ -624,13 +780,13 @@ class AutoThumbnailGenerator:
             scheme = self._select_color_scheme(metadata)
             
             # 그라데이션 배경 생성
-            img = Image.new('RGB', size, self._hex_to_rgb(scheme['primary']))
+            img = Image.new('RGB', size, hex_to_rgb(scheme['primary']))
             
             # 그라데이션 효과
             for i in range(size[1]):
                 alpha = i / size[1]
-                primary_rgb = self._hex_to_rgb(scheme['primary'])
-                secondary_rgb = self._hex_to_rgb(scheme['gradient'][1])
+                primary_rgb = hex_to_rgb(scheme['primary'])
+                secondary_rgb = hex_to_rgb(scheme['gradient'][1])
                 
                 blended = tuple(int(primary_rgb[j] * (1 - alpha) + secondary_rgb[j] * alpha) for j in range(3))
                 
@@ -641,20 +797,20 @@ class AutoThumbnailGenerator:
             draw = ImageDraw.Draw(img)
             
             # 상단 장식 바
-            draw.rectangle([0, 0, size[0], 8], fill=self._hex_to_rgb(scheme['secondary']))
+            draw.rectangle([0, 0, size[0], 8], fill=hex_to_rgb(scheme['secondary']))
             
             # 하단 장식 바
-            draw.rectangle([0, size[1]-8, size[0], size[1]], fill=self._hex_to_rgb(scheme['accent']))
+            draw.rectangle([0, size[1]-8, size[0], size[1]], fill=hex_to_rgb(scheme['accent']))
             
             # 기하학적 패턴
             for i in range(0, size[0], 100):
-                draw.line([(i, 0), (i + 50, 50)], fill=self._hex_to_rgb(scheme['accent']), width=1)
+                draw.line([(i, 0), (i + 50, 50)], fill=hex_to_rgb(scheme['accent']), width=1)
             
             # 오버레이 추가
             img = self._add_overlay(img, metadata)
             
             # 저장
-            img.save(output_path, 'WEBP', quality=85, optimize=True)
+            image_pipeline.save_image(img, output_path, codec=self.output_codec)
             print(f"✅ 폴백 이미지 생성 완료: {output_path}")
             return True
             
@@ -683,6 +839,8 @@ class AutoThumbnailGenerator:
         # 이미 존재하는 경우 건너뛰기 (덮어쓰기 원하면 삭제 후 실행)
         if output_path.exists():
             print(f"ℹ️ 썸네일이 이미 존재합니다: {output_path}")
+            if post_file not in self.placeholders and self.placeholders.record(post_file, output_path):
+                self.placeholders.save()
             return True
         
         print(f"🎨 썸네일 생성 중: {metadata.get('title', post_file)}")
@@ -692,7 +850,7 @@ class AutoThumbnailGenerator:
         print(f"🔍 검색 키워드: {keywords}")
         
         # 이미지 검색
-        images = self.search_unsplash_images(keywords)
+        images = self.search_images(keywords)
         
         # 이미지 다운로드 및 처리 시도
         success = False
@@ -709,6 +867,7 @@ class AutoThumbnailGenerator:
         
         if success:
             print(f"✅ 썸네일 생성 완료: {output_path}")
+            self.placeholders.record(post_file, output_path)
         else:
             print(f"❌ 썸네일 생성 실패: {post_file}")
         
@@ -717,6 +876,132 @@ class AutoThumbnailGenerator:
         
         return success
 
+    def generate_thumbnails(self, post_files: List[str]) -> int:
+        """여러 포스트의 썸네일 생성 → 성공 개수
+
+        render_workers 가 0 이면 포스트를 하나씩 처리하고, 아니면 단계별 파이프라인으로 처리합니다.
+        """
+        with MemoryMonitor() as self._monitor:
+            if not self.render_workers:
+                success_count = 0
+                for post_file in post_files:
+                    success_count += self.generate_thumbnail_for_post(post_file)
+                    self._monitor.sample()
+            else:
+                success_count = self._run_pipeline(post_files)
+        self._monitor = None
+        return success_count
+
+    def _run_pipeline(self, post_files: List[str]) -> int:
+        """prepare → fetch → render(프로세스) → finish 파이프라인 (메모리 한도 안에서 동시 처리)"""
+        self._budget = MemoryBudget(self.memory_budget_mb * MB)
+        if 'local' in self.image_providers:
+            self.load_stock_library()  # prepare 스레드들이 동시에 색인을 만들지 않도록 미리 한 번
+        pipeline = Pipeline([
+            Stage('prepare', self._prepare_job, workers=2),
+            Stage('fetch', self._fetch_job, workers=self.fetch_workers),
+            Stage('render', _render_in_worker, workers=self.render_workers, kind='process',
+                  initializer=_init_render_worker,
+                  initargs=(str(self.workspace_path), self.smart_crop, self.output_codec)),
+            Stage('finish', self._finish_job),
+        ], queue_size=self.queue_size, on_discard=self._release_job)
+        results = pipeline.run(post_files)
+        self._save_caches()
+        pipeline.report()
+        self._budget.report()
+        self._budget = None
+        return sum(1 for result in results if result['success'])
+
+    def _release_job(self, job) -> None:
+        """작업이 예약한 메모리 반환 (완료/버림/실패 모두)"""
+        if isinstance(job, dict) and job.get('reserved') and self._budget:
+            self._budget.release(job.pop('reserved'))
+
+    def _prepare_job(self, post_file: str) -> Optional[Dict]:
+        """파이프라인 1단계 (I/O): 메타데이터, 검색 키워드, 이미지 후보 준비"""
+        post_path = self.posts_dir / post_file
+        if not post_path.exists():
+            print(f"❌ 포스트 파일을 찾을 수 없습니다: {post_path}")
+            return None
+        
+        metadata = self.extract_post_metadata(post_path)
+        if not metadata:
+            print(f"❌ 메타데이터를 추출할 수 없습니다: {post_file}")
+            return None
+        
+        output_path = self.images_dir / post_file.replace('.md', '.webp')
+        job = {'post_file': post_file, 'output_path': str(output_path), 'metadata': metadata,
+               'exists': output_path.exists(), 'images': [], 'source': None, 'palette': None}
+        if not job['exists']:
+            job['images'] = self.search_images(self.generate_search_keywords(metadata))
+        return job
+
+    def _fetch_job(self, job: Dict) -> Dict:
+        """파이프라인 2단계 (I/O): 후보 이미지를 차례로 받아 처음 성공한 원본 바이트를 담음
+
+        본문은 스풀 임시 파일(1MB 초과분은 디스크)이나 로컬 파일에 있으므로, 메모리로 읽기 전에
+        헤더로 추정한 메모리를 예약합니다. 한도가 차면 앞선 작업이 끝날 때까지 읽지 않고 기다립니다.
+        """
+        for image_info in job['images']:
+            try:
+                with self._open_source(image_info['url']) as stream:
+                    source_hash = image_pipeline.stream_digest(stream)
+                    if self._budget:
+                        job['reserved'] = self._budget.acquire(estimate_image_bytes(stream))
+                    job['source'] = stream.read()
+            except Exception as e:
+                self._release_job(job)
+                print(f"⚠️ 이미지 다운로드 실패 ({image_info['keyword']}): {e}")
+                continue
+            job['palette_key'] = self._palette_key(source_hash)
+            job['palette'] = self.palette_cache.get(job['palette_key'])
+            if self._monitor:
+                self._monitor.sample()
+            break
+        return job
+
+    def render_job(self, job: Dict) -> Dict:
+        """파이프라인 3단계 (CPU, 워커 프로세스): 디코딩 → 크롭 → 오버레이 → 인코딩/저장
+
+        원본 바이트는 결과에서 빼고 돌려줍니다.
+        """
+        result = {key: value for key, value in job.items() if key != 'source'}
+        if job['exists']:
+            result['success'] = True
+            return result
+        
+        output_path = Path(job['output_path'])
+        if job['source'] is not None:
+            try:
+                result['palette'] = self._render_photo(job['source'], job['metadata'], output_path, job['palette'])
+                result['success'] = True
+                return result
+            except Exception as e:
+                print(f"❌ 이미지 처리 실패 ({job['post_file']}): {e}")
+        
+        print(f"⚠️ 사용할 수 있는 이미지가 없어 폴백 이미지 생성: {job['post_file']}")
+        result['palette'] = None
+        result['success'] = self.create_fallback_image(job['metadata'], output_path)
+        return result
+
+    def _finish_job(self, result: Dict) -> Dict:
+        """파이프라인 4단계: 예약 메모리 반환, 팔레트 캐시/플레이스홀더 기록"""
+        self._release_job(result)
+        post_file, output_path = result['post_file'], Path(result['output_path'])
+        if result.get('palette') and result.get('palette_key'):
+            self.palette_cache[result['palette_key']] = result['palette']
+        
+        if result['exists']:
+            print(f"ℹ️ 썸네일이 이미 존재합니다: {output_path}")
+            if post_file not in self.placeholders:
+                self.placeholders.record(post_file, output_path)
+        elif result['success']:
+            print(f"✅ 썸네일 생성 완료: {output_path}")
+            self.placeholders.record(post_file, output_path)
+        else:
+            print(f"❌ 썸네일 생성 실패: {post_file}")
+        return result
+
     def generate_thumbnails_for_recent_posts(self, days: int = 30) -> List[str]:
         """최근 포스트들의 썸네일 생성"""
         from datetime import datetime, timedelta
@@ -741,15 +1026,24 @@ class AutoThumbnailGenerator:
         
         print(f"📅 최근 {days}일 간의 포스트 {len(recent_posts)}개 발견")
         
-        success_count = 0
-        for post_file in recent_posts:
-            if self.generate_thumbnail_for_post(post_file):
-                success_count += 1
+        success_count = self.generate_thumbnails(recent_posts)
         
         print(f"✅ 총 {success_count}/{len(recent_posts)}개 썸네일 생성 완료")
         
         return recent_posts
 
+    def generate_thumbnails_for_changed_posts(self, since: Optional[str] = None) -> List[str]:
+        """git 기준 ref 이후 변경/스테이징/추가된 포스트들의 썸네일 생성"""
+        changed = sorted((path.name for path in changed_posts(self.posts_dir, since)), reverse=True)
+
+        print(f"🔀 {since or 'HEAD'} 이후 변경된 포스트 {len(changed)}개 발견")
+
+        success_count = self.generate_thumbnails(changed)
+
+        print(f"✅ 총 {success_count}/{len(changed)}개 썸네일 생성 완료")
+
+        return changed
+
     def generate_thumbnail_for_current_post(self) -> bool:
         """현재 편집 중인 포스트의 썸네일 생성"""
         # 가장 최근 수정된 포스트 파일 찾기
@@ -770,6 +1064,21 @@ class AutoThumbnailGenerator:
             return False
 
 
+# 파이프라인 render 단계의 워커 프로세스별 생성기 (프로세스마다 한 번 초기화)
+_render_generator: Optional[AutoThumbnailGenerator] = None
+
+
+def _init_render_worker(workspace_path: str, smart_crop: bool, output_codec: str):
+    global _render_generator
+    _render_generator = AutoThumbnailGenerator(workspace_path)
+    _render_generator.smart_crop = smart_crop
+    _render_generator.output_codec = output_codec
+
+
+def _render_in_worker(job: Dict) -> Dict:
+    return _render_generator.render_job(job)
+
+
 def main():
     """메인 실행 함수"""
     import argparse
@@ -778,19 +1087,48 @@ def main():
     parser.add_argument('--post', '-p', help='특정 포스트 파일명 (예: 2025-08-14-example.md)')
     parser.add_argument('--recent', '-r', type=int, default=7, help='최근 N일간의 포스트 처리 (기본값: 7)')
     parser.add_argument('--current', '-c', action='store_true', help='현재 편집 중인 포스트 처리')
+    parser.add_argument('--since', metavar='REF', help='git 기준 ref 이후 변경/스테이징/추가된 포스트만 처리 (예: HEAD, origin/main)')
     parser.add_argument('--workspace', '-w', default='.', help='작업 공간 경로 (기본값: 현재 디렉토리)')
+    parser.add_argument('--smart-crop', action='store_true', help='중앙 크롭 대신 피사체(엣지/엔트로피) 중심으로 크롭')
+    parser.add_argument('--memory-budget', type=int, default=DEFAULT_BUDGET_MB, metavar='MB',
+                        help=f'--workers 사용 시 동시에 처리 중인 이미지의 추정 메모리 합 한도 (기본값: {DEFAULT_BUDGET_MB}MB)')
+    parser.add_argument('--providers', default=os.environ.get('THUMBNAIL_PROVIDERS', DEFAULT_PROVIDERS),
+                        help=f"이미지 검색 백엔드 순서 (가능: {', '.join(IMAGE_PROVIDERS)}, 기본값: THUMBNAIL_PROVIDERS 또는 {DEFAULT_PROVIDERS})")
+    parser.add_argument('--stock-dir', help=f'로컬 스톡 이미지 디렉토리 (기본값: THUMBNAIL_STOCK_DIR 또는 작업 공간의 {DEFAULT_LIBRARY_DIR})')
+    parser.add_argument('--workers', type=int, default=0,
+                        help='여러 포스트 처리 시 렌더링 프로세스 수 (다운로드/렌더링을 단계별 파이프라인으로 겹쳐 처리, 기본값: 0=순차)')
     
     args = parser.parse_args()
     
+    if args.memory_budget <= 0:
+        parser.error('--memory-budget 는 0 보다 커야 합니다')
+    try:
+        providers = parse_providers(args.providers)
+    except ValueError as e:
+        parser.error(str(e))
+    
     # 현재 스크립트가 있는 디렉토리를 기본 작업공간으로 설정
     if args.workspace == '.':
         args.workspace = os.path.dirname(os.path.abspath(__file__))
     
     generator = AutoThumbnailGenerator(args.workspace)
+    generator.smart_crop = args.smart_crop
+    generator.render_workers = max(0, args.workers)
+    generator.memory_budget_mb = args.memory_budget
+    generator.image_providers = providers
+    if args.stock_dir:
+        generator.stock_dir = Path(args.stock_dir)
     
     if args.post:
         # 특정 포스트 처리
         generator.generate_thumbnail_for_post(args.post)
+    elif args.since:
+        # git 기준 변경된 포스트 처리
+        try:
+            generator.generate_thumbnails_for_changed_posts(args.since)
+        except ValueError as e:
+            print(f"❌ {e}")
+            return 1
     elif args.current:
         # 현재 편집 중인 포스트 처리
         generator.generate_thumbnail_for_current_post()
@@ -800,4 +1138,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    exit(main() or 0)
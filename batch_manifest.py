@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+매니페스트 기반 일괄 처리 유틸리티
+
+download_blog_images.py, create_blog_images.py 가 사용하는
+JSONL/YAML 매니페스트 로더와 재시작 가능한 체크포인트, 워커 풀 실행기입니다.
+
+매니페스트 형식 (JSONL: 한 줄에 항목 하나 / YAML: 항목 리스트 또는 {entries: [...]}):
+    {"post": "2025-07-20-yolo-v10-complete-guide.md", "urls": ["https://...", "https://..."]}
+"""
+
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import yaml
+
+
+def load_manifest(manifest_path: Path) -> List[Dict]:
+    """JSONL 또는 YAML 매니페스트 로드 (각 항목은 'post' 키 필수)"""
+    manifest_path = Path(manifest_path)
+    if not manifest_path.exists():
+        raise FileNotFoundError(f"매니페스트를 찾을 수 없습니다: {manifest_path}")
+
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        if manifest_path.suffix in ('.yml', '.yaml'):
+            data = yaml.safe_load(f) or []
+            entries = data.get('entries', []) if isinstance(data, dict) else data
+        else:
+            entries = [json.loads(line) for line in f if line.strip() and not line.lstrip().startswith('#')]
+
+    for i, entry in enumerate(entries, 1):
+        if not isinstance(entry, dict) or not entry.get('post'):
+            raise ValueError(f"매니페스트 {i}번째 항목에 'post'가 없습니다: {entry}")
+
+    return entries
+
+
+class Checkpoint:
+    """완료된 항목을 한 줄씩 추가 기록하는 체크포인트 파일
+
+    기록은 항목마다 즉시 flush/fsync 되므로 중간에 중단되어도
+    이미 끝난 항목은 다음 실행에서 건너뜁니다.
+    """
+
+    def __init__(self, checkpoint_path: Path):
+        self.checkpoint_path = Path(checkpoint_path)
+        self.checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+        self.completed = self._load()
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, Dict]:
+        """체크포인트 파일에서 완료 항목 로드 (잘린 마지막 줄은 무시)"""
+        completed = {}
+        if self.checkpoint_path.exists():
+            with open(self.checkpoint_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    completed[record['key']] = record
+        return completed
+
+    def is_done(self, key: str) -> bool:
+        return key in self.completed
+
+    def mark_done(self, key: str, **info):
+        """항목 완료 기록"""
+        record = {'key': key, **info}
+        with self._lock:
+            with open(self.checkpoint_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+            self.completed[key] = record
+
+    def reset(self):
+        """체크포인트 초기화"""
+        with self._lock:
+            if self.checkpoint_path.exists():
+                self.checkpoint_path.unlink()
+            self.completed = {}
+
+
+def default_checkpoint_path(workspace_path: Path, manifest_path: Path) -> Path:
+    """매니페스트별 기본 체크포인트 경로 (.thumbnail_cache/<이름>.checkpoint.jsonl)"""
+    return Path(workspace_path) / ".thumbnail_cache" / f"{Path(manifest_path).stem}.checkpoint.jsonl"
+
+
+def run_manifest(entries: List[Dict], worker: Callable[[Dict], bool], checkpoint: Optional[Checkpoint] = None,
+                 workers: int = 4) -> Dict[str, int]:
+    """매니페스트 항목을 워커 풀에서 처리하고 성공한 항목을 체크포인트에 기록"""
+    pending = [entry for entry in entries if not (checkpoint and checkpoint.is_done(entry['post']))]
+    skipped = len(entries) - len(pending)
+    if skipped:
+        print(f"⏭️ 체크포인트에 완료 기록된 {skipped}개 항목 건너뜀")
+
+    succeeded = 0
+    failed = 0
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        futures = {executor.submit(worker, entry): entry for entry in pending}
+        for future in as_completed(futures):
+            entry = futures[future]
+            try:
+                ok = future.result()
+            except Exception as e:
+                print(f"❌ 처리 중 오류 ({entry['post']}): {e}")
+                ok = False
+
+            if ok:
+                succeeded += 1
+                if checkpoint:
+                    checkpoint.mark_done(entry['post'])
+            else:
+                failed += 1
+
+    print("-" * 50)
+    print(f"✅ 완료 {succeeded}개, 실패 {failed}개, 건너뜀 {skipped}개 (전체 {len(entries)}개)")
+    return {'succeeded': succeeded, 'failed': failed, 'skipped': skipped}
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+이미지 파이프라인 벤치마크
+
+합성 원본 이미지(JPEG/PNG, 여러 해상도)로 기존 "resize → crop" 방식과
+image_pipeline 의 draft + resize(box, reducing_gap) 방식을 비교하고,
+출력 코덱별 인코딩 시간과 파일 크기를 측정합니다.
+끝으로 로컬 HTTP 서버로 fetch_stream 의 헤더 사전 검사를 확인합니다
+(큰 ICC 프로파일이 붙은 JPEG은 통과, 이미지가 아닌 본문은 거부).
+
+사용법:
+    python benchmark_image_pipeline.py
+    python benchmark_image_pipeline.py --repeat 10 --codecs webp jpeg
+"""
+
+import io
+import os
+import time
+import threading
+import statistics
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Tuple
+
+from PIL import Image, ImageDraw
+
+import image_pipeline
+
+
+SOURCES = [
+    ('JPEG', (4000, 3000)),
+    ('JPEG', (1920, 1080)),
+    ('JPEG', (1080, 1920)),
+    ('PNG', (2400, 1600)),
+]
+
+
+def make_source(fmt: str, size: Tuple[int, int]) -> bytes:
+    """그라데이션과 도형이 들어간 합성 원본 이미지 생성"""
+    img = Image.linear_gradient('L').resize(size).convert('RGB')
+    draw = ImageDraw.Draw(img)
+    for i in range(0, size[0], max(1, size[0] // 20)):
+        draw.ellipse([i, i // 2, i + size[0] // 10, i // 2 + size[1] // 10], fill=(i % 255, 120, 200))
+
+    buffer = io.BytesIO()
+    if fmt == 'PNG':
+        img.convert('RGBA').save(buffer, 'PNG')
+    else:
+        img.save(buffer, 'JPEG', quality=90)
+    return buffer.getvalue()
+
+
+def legacy_convert(data: bytes, size: Tuple[int, int]) -> Image.Image:
+    """기존 스크립트들의 변환 방식 (전체 디코딩 → 리사이즈 → 크롭)"""
+    img = Image.open(io.BytesIO(data))
+    if img.mode != 'RGB':
+        img = img.convert('RGB')
+
+    img_ratio = img.width / img.height
+    target_ratio = size[0] / size[1]
+    if img_ratio > target_ratio:
+        new_height = size[1]
+        new_width = int(new_height * img_ratio)
+        img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
+        left = (new_width - size[0]) // 2
+        return img.crop((left, 0, left + size[0], size[1]))
+
+    new_width = size[0]
+    new_height = int(new_width / img_ratio)
+    img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
+    top = (new_height - size[1]) // 2
+    return img.crop((0, top, size[0], top + size[1]))
+
+
+def pipeline_convert(reducing_gap):
+    """image_pipeline 변환 함수 생성"""
+    def convert(data: bytes, size: Tuple[int, int]) -> Image.Image:
+        img = image_pipeline.open_image(data)
+        return image_pipeline.process_image(img, size, reducing_gap=reducing_gap)
+    return convert
+
+
+def measure(func: Callable, repeat: int) -> List[float]:
+    """repeat 회 실행 시간(ms) 측정"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def benchmark_convert(repeat: int, size: Tuple[int, int]) -> None:
+    """변환 방식별 처리 시간 비교"""
+    variants: Dict[str, Callable] = {
+        'legacy': legacy_convert,
+        'pipeline (gap=None)': pipeline_convert(None),
+        'pipeline (gap=2.0)': pipeline_convert(2.0),
+        'pipeline (gap=3.0)': pipeline_convert(3.0),
+    }
+
+    print(f"\n📐 변환 벤치마크 (목표 {size[0]}x{size[1]}, {repeat}회 반복, 중앙값/최소 ms)")
+    print(f"{'원본':<18} {'방식':<22} {'median':>9} {'min':>9} {'속도비':>7}")
+    print("-" * 70)
+
+    for fmt, src_size in SOURCES:
+        data = make_source(fmt, src_size)
+        label = f"{fmt} {src_size[0]}x{src_size[1]}"
+        baseline = None
+
+        for name, func in variants.items():
+            timings = measure(lambda: func(data, size), repeat)
+            median = statistics.median(timings)
+            if baseline is None:
+                baseline = median
+            print(f"{label:<18} {name:<22} {median:>9.1f} {min(timings):>9.1f} {baseline / median:>6.2f}x")
+        print()
+
+
+def benchmark_encode(repeat: int, size: Tuple[int, int], codecs: List[str]) -> None:
+    """출력 코덱별 인코딩 시간과 크기 비교"""
+    data = make_source('JPEG', (4000, 3000))
+    img = image_pipeline.process_image(image_pipeline.open_image(data), size)
+
+    print(f"💾 인코딩 벤치마크 ({size[0]}x{size[1]}, {repeat}회 반복)")
+    print(f"{'코덱':<8} {'median ms':>10} {'bytes':>10}")
+    print("-" * 30)
+
+    for codec in codecs:
+        spec = image_pipeline.CODECS[codec]
+        buffer = io.BytesIO()
+
+        def encode():
+            buffer.seek(0)
+            buffer.truncate()
+            img.save(buffer, spec['format'], **spec['options'])
+
+        try:
+            timings = measure(encode, repeat)
+        except (KeyError, OSError) as e:
+            print(f"{codec:<8} {'지원 안 됨':>10} ({e})")
+            continue
+        print(f"{codec:<8} {statistics.median(timings):>10.1f} {buffer.tell():>10,}")
+
+
+def check_fetch_probe() -> bool:
+    """fetch_stream 헤더 사전 검사 회귀 확인 (실패가 있으면 False)
+
+    APPn 세그먼트가 PROBE_BYTES 보다 큰 JPEG도 거부되지 않아야 합니다.
+    """
+    icc_jpeg = io.BytesIO()
+    Image.new('RGB', (1200, 800), (200, 80, 40)).save(icc_jpeg, 'JPEG', icc_profile=os.urandom(200 * 1024))
+    bodies = {
+        '/large-icc.jpg': ('image/jpeg', icc_jpeg.getvalue()),
+        '/plain.jpg': ('image/jpeg', make_source('JPEG', (1920, 1080))),
+        '/not-image.jpg': ('image/jpeg', b'<html>' + b'x' * (256 * 1024)),
+    }
+    # (경로, 기대 결과: 크기 또는 None=거부)
+    cases = [('/large-icc.jpg', (1200, 800)), ('/plain.jpg', (1920, 1080)), ('/not-image.jpg', None)]
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            content_type, body = bodies[self.path]
+            self.send_response(200)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+
+    print("\n🔎 다운로드 헤더 검사 확인")
+    ok = True
+    try:
+        for path, expected in cases:
+            try:
+                with image_pipeline.fetch_stream(base + path) as stream:
+                    with Image.open(stream) as img:
+                        result = img.size
+            except image_pipeline.DownloadRejected as e:
+                result = None
+                detail = str(e)
+            else:
+                detail = f"{result[0]}x{result[1]}"
+
+            passed = result == expected
+            ok = ok and passed
+            print(f"{'✅' if passed else '❌'} {path:<16} {'거부' if result is None else '통과'} ({detail})")
+    finally:
+        server.shutdown()
+        server.server_close()
+    return ok
+
+
+def main():
+    """메인 실행 함수"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='이미지 파이프라인 벤치마크')
+    parser.add_argument('--repeat', '-n', type=int, default=5, help='측정 반복 횟수 (기본값: 5)')
+    parser.add_argument('--codecs', nargs='+', default=list(image_pipeline.CODECS),
+                        choices=list(image_pipeline.CODECS), help='비교할 출력 코덱')
+    args = parser.parse_args()
+
+    size = image_pipeline.DEFAULT_SIZE
+    benchmark_convert(args.repeat, size)
+    benchmark_encode(args.repeat, size, args.codecs)
+    return 0 if check_fetch_probe() else 1
+
+
+if __name__ == "__main__":
+    exit(main())
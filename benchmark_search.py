@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+사이트 검색 페이로드/지연 벤치마크
+
+_posts 에서 검색 데이터를 직접 만들어 방문자가 검색에 치르는 비용을 잽니다:
+    - legacy   예전 search.json (Liquid truncatewords: 200) 과 같은 단일 파일 + default.html 의 부분 문자열 필터
+    - sharded  build_search_index.py 의 샤딩 역색인 + default.html 클라이언트 로직의 Python 이식
+               (--shard-bytes 로 샤드 크기를 바꿔 여러 형식을 비교)
+
+포맷별로 첫 화면에서 받는 바이트(원본/gzip/brotli), JSON 파싱 시간,
+고정 검색어 집합(태그에서 뽑은 한글/영문 단어)의 쿼리당 p50/p99 를 출력합니다.
+검색어마다 결과 URL 집합을 legacy 와 비교해, legacy 결과가 하나라도 빠지면(재현율 감소) 종료 코드 1 을 돌려줍니다.
+sharded 는 태그도 색인하고 한글 검색어를 bigram AND 로 찾으므로 legacy 보다 결과가 많을 수는 있습니다.
+파싱 시간은 Python json.loads 기준이라 브라우저 JSON.parse 와 절대값은 다르지만 포맷 간 비율 비교에 씁니다.
+
+사용법:
+    python benchmark_search.py
+    python benchmark_search.py --repeat 20 --shard-bytes 4096 8192 16384
+    python benchmark_search.py --queries 서버리스 django "aws lambda"
+"""
+
+import gzip
+import json
+import math
+import re
+import statistics
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import build_search_index as index
+
+DEFAULT_AUTHOR = 'updaun'  # _config.yml defaults.author
+QUERIES_PER_SCRIPT = 20
+HANGUL_PATTERN = re.compile(r'[가-힣]')
+
+
+def legacy_payload(docs: List[Dict]) -> str:
+    """예전 search.json 과 같은 필드/순서의 JSON"""
+    return json.dumps([{
+        'title': doc['title'],
+        'url': doc['url'],
+        'date': doc['date'],
+        'categories': doc['categories'],
+        'tags': doc['tags'],
+        'excerpt': doc['excerpt'],
+        'content': doc['content'],
+        'author': doc['author'] or DEFAULT_AUTHOR,
+        'image': doc['image'],
+        'readTime': f"{doc['words'] // 200 + 1}분 읽기",
+    } for doc in docs], ensure_ascii=False, indent=2)
+
+
+def legacy_search(data: List[Dict], query: str) -> List[Dict]:
+    """default.html 의 예전 performSearch 필터 이식 (질의 전체를 부분 문자열로 비교)"""
+    q = query.lower().strip()
+    if not q:
+        return []
+    return [post for post in data
+            if q in post['title'].lower()
+            or q in post['content'].lower()
+            or q in post['excerpt'].lower()
+            or any(q in category.lower() for category in post.get('categories') or [])]
+
+
+class ShardedClient:
+    """default.html 검색 클라이언트의 Python 이식
+
+    files 는 {파일 이름: JSON 문자열}. 받은 파일과 파싱 시간을 기록해 첫 검색 비용을 잽니다.
+    """
+
+    def __init__(self, files: Dict[str, str]):
+        self.files = files
+        self.fetched: List[str] = []
+        self.parse_ms = 0.0
+        self.shards: Dict[int, Dict[str, List[int]]] = {}
+        self.docs: Optional[List[Dict]] = None
+        self.manifest = self._load(index.MANIFEST_NAME)
+
+    def _load(self, name: str):
+        payload = self.files[name]
+        start = time.perf_counter()
+        data = json.loads(payload)
+        self.parse_ms += (time.perf_counter() - start) * 1000
+        self.fetched.append(name)
+        return data
+
+    def shards_for_term(self, term: str) -> List[int]:
+        bounds = self.manifest['bounds']
+        lo, hi = 0, len(bounds) - 1
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if bounds[mid] <= term:
+                lo = mid
+            else:
+                hi = mid - 1
+        shards = [lo]
+        i = lo + 1
+        while i < len(bounds) and bounds[i].startswith(term):
+            shards.append(i)
+            i += 1
+        return shards
+
+    def _shard(self, i: int) -> Dict[str, List[int]]:
+        if i not in self.shards:
+            self.shards[i] = self._load(self.manifest['shards'][i])
+        return self.shards[i]
+
+    def search(self, query: str) -> List[Dict]:
+        terms = index.tokenize(query, query=True)
+        if not terms:
+            return []
+        if self.docs is None:
+            self.docs = self._load(self.manifest['docs'])
+
+        matched = None
+        for term in terms:
+            ids = set()
+            for i in self.shards_for_term(term):
+                for key, gaps in self._shard(i).items():
+                    if key.startswith(term):
+                        ids.update(index.delta_decode(gaps))
+            matched = ids if matched is None else matched & ids
+            if not matched:
+                break
+        return [self.docs[doc_id] for doc_id in sorted(matched)]
+
+
+def tag_queries(docs: List[Dict], per_script: int = QUERIES_PER_SCRIPT) -> List[str]:
+    """태그를 단어로 나눠 많이 쓰인 순서대로 한글/영문 검색어를 per_script 개씩 (항상 같은 순서)"""
+    counts = Counter(word for doc in docs for tag in set(doc['tags'])
+                     for word in re.split(r'[-_\s]+', tag.lower()) if len(word) > 1)
+    ranked = sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+    korean = [word for word, _ in ranked if HANGUL_PATTERN.search(word)][:per_script]
+    english = [word for word, _ in ranked if not HANGUL_PATTERN.search(word)][:per_script]
+    return korean + english
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """nearest-rank 백분위수"""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+def compressed_sizes(payload: str) -> Tuple[int, int, Optional[int]]:
+    """(원본, gzip -9, brotli q11) 바이트. brotli 가 없으면 None"""
+    data = payload.encode('utf-8')
+    try:
+        import brotli
+        br = len(brotli.compress(data, mode=brotli.MODE_TEXT, quality=11))
+    except ImportError:
+        br = None
+    return len(data), len(gzip.compress(data, compresslevel=9, mtime=0)), br
+
+
+def measure(func: Callable, repeat: int) -> List[float]:
+    """repeat 회 실행 시간(ms) 측정"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def bench_legacy(docs: List[Dict], queries: List[str], repeat: int) -> Dict:
+    payload = legacy_payload(docs)
+    parse = measure(lambda: json.loads(payload), repeat)
+    data = json.loads(payload)
+
+    warm, results = [], []
+    for query in queries:
+        warm.extend(measure(lambda: legacy_search(data, query), repeat))
+        results.append({post['url'] for post in legacy_search(data, query)})
+
+    # 첫 검색 전에 파일 전체를 받아 파싱해야 하므로 첫 검색 비용 = 전체 + 파싱 + 필터
+    size = compressed_sizes(payload)
+    return {
+        'first_bytes': [size] * len(queries),
+        'parse_ms': statistics.median(parse),
+        'cold': [statistics.median(parse) + statistics.median(measure(lambda: legacy_search(data, q), repeat))
+                 for q in queries],
+        'warm': warm,
+        'results': results,
+        'total': size,
+    }
+
+
+def bench_sharded(docs: List[Dict], queries: List[str], repeat: int, shard_bytes: int) -> Dict:
+    files, _ = index.build_index_files(docs, shard_bytes)
+    sizes = {name: compressed_sizes(payload) for name, payload in files.items()}
+
+    def fetched_size(names: List[str]) -> Tuple[int, int, Optional[int]]:
+        totals = [sizes[name] for name in names]
+        br = None if any(size[2] is None for size in totals) else sum(size[2] for size in totals)
+        return sum(size[0] for size in totals), sum(size[1] for size in totals), br
+
+    first_bytes, cold, warm, results, parse = [], [], [], [], []
+    for query in queries:
+        # 첫 검색: manifest 부터 새로 받는 클라이언트
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            client = ShardedClient(files)
+            found = client.search(query)
+            timings.append((time.perf_counter() - start) * 1000)
+        cold.append(statistics.median(timings))
+        parse.append(client.parse_ms)
+        first_bytes.append(fetched_size(client.fetched))
+        results.append({doc['url'] for doc in found})
+        # 이미 받은 샤드로 다시 검색
+        warm.extend(measure(lambda: client.search(query), repeat))
+
+    return {
+        'first_bytes': first_bytes,
+        'parse_ms': statistics.median(parse),
+        'cold': cold,
+        'warm': warm,
+        'results': results,
+        'total': fetched_size(list(files)),
+        'files': len(files),
+    }
+
+
+def _kb(value: Optional[float]) -> str:
+    return '-' if value is None else f"{value / 1024:,.1f}"
+
+
+def report(name: str, stats: Dict) -> None:
+    """포맷 하나의 결과 한 줄"""
+    first = stats['first_bytes']
+    gz = [size[1] for size in first]
+    br = None if any(size[2] is None for size in first) else [size[2] for size in first]
+    print(f"{name:<16} {_kb(stats['total'][0]):>9} {_kb(stats['total'][1]):>8} {_kb(stats['total'][2]):>8}"
+          f" {_kb(percentile(gz, 50)):>9} {_kb(percentile(gz, 99)):>8}"
+          f" {_kb(br and percentile(br, 50)):>8}"
+          f" {stats['parse_ms']:>8.2f}"
+          f" {percentile(stats['cold'], 50):>8.2f} {percentile(stats['cold'], 99):>8.2f}"
+          f" {percentile(stats['warm'], 50):>8.3f} {percentile(stats['warm'], 99):>8.3f}"
+          f" {statistics.mean(len(urls) for urls in stats['results']):>7.1f}")
+
+
+def main():
+    """메인 실행 함수"""
+    import argparse
+    import os
+
+    workspace = os.path.dirname(os.path.abspath(__file__))
+
+    parser = argparse.ArgumentParser(description='사이트 검색 페이로드/지연 벤치마크')
+    parser.add_argument('--posts', default=os.path.join(workspace, '_posts'), help='포스트 디렉토리 (기본값: _posts)')
+    parser.add_argument('--repeat', '-n', type=int, default=5, help='측정 반복 횟수 (기본값: 5)')
+    parser.add_argument('--shard-bytes', type=int, nargs='+', default=[index.SHARD_BYTES],
+                        help=f'비교할 샤드 크기 목록 (기본값: {index.SHARD_BYTES})')
+    parser.add_argument('--queries', nargs='+', default=None,
+                        help=f'검색어 목록 (기본값: 태그에서 한글/영문 {QUERIES_PER_SCRIPT}개씩)')
+    args = parser.parse_args()
+
+    if args.repeat <= 0 or any(size <= 0 for size in args.shard_bytes):
+        parser.error('--repeat, --shard-bytes 는 0 보다 커야 합니다')
+
+    docs = index.load_posts(Path(args.posts))
+    queries = args.queries or tag_queries(docs)
+
+    print(f"🔎 포스트 {len(docs)}개, 검색어 {len(queries)}개, {args.repeat}회 반복")
+    print(f"   검색어: {', '.join(queries)}\n")
+    print(f"{'':<16} {'전체 KB (raw / gzip / br)':>27} {'첫 검색 KB (gz p50/p99, br p50)':>28}"
+          f" {'parse':>8} {'첫 검색 ms':>17} {'재검색 ms':>17} {'결과':>7}")
+    print(f"{'포맷':<16} {'raw':>9} {'gzip':>8} {'br':>8} {'p50':>9} {'p99':>8} {'br':>8}"
+          f" {'ms':>8} {'p50':>8} {'p99':>8} {'p50':>8} {'p99':>8} {'평균':>7}")
+    print("-" * 118)
+
+    results = {'legacy': bench_legacy(docs, queries, args.repeat)}
+    report('legacy', results['legacy'])
+    for shard_bytes in args.shard_bytes:
+        name = f"sharded {shard_bytes // 1024}K" if shard_bytes % 1024 == 0 else f"sharded {shard_bytes}B"
+        results[name] = bench_sharded(docs, queries, args.repeat, shard_bytes)
+        report(name, results[name])
+
+    # 재현율 확인: legacy 결과가 모두 들어 있어야 함
+    legacy_sets = results['legacy']['results']
+    failed = False
+    for name, stats in results.items():
+        if name == 'legacy':
+            continue
+        missing = [f"{q}({len(a - b)}개 누락)" for q, a, b in zip(queries, legacy_sets, stats['results']) if a - b]
+        extra = sum(len(b - a) for a, b in zip(legacy_sets, stats['results']))
+        if missing:
+            failed = True
+            print(f"\n❌ {name}: legacy 결과가 빠진 검색어 {', '.join(missing)}")
+        else:
+            print(f"\n✅ {name}: 모든 검색어가 legacy 결과를 포함 (태그/한글 bigram 으로 추가된 결과 {extra}개)")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    exit(main())
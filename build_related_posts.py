@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+내용 유사도 기반 관련 포스트 생성 (MinHash + LSH)
+
+포스트마다 태그/카테고리/제목 용어와 본문의 TF-IDF 상위 용어로 특징 집합을 만들고
+MinHash 서명을 LSH 밴드로 버킷팅해 후보 쌍만 비교합니다 (전체 쌍 비교 없이 거의 선형).
+후보는 특징 집합의 Jaccard 유사도로 정렬해 포스트마다 상위 k 개를 _data/related.json 에 씁니다.
+
+_layouts/post.html 은 site.data.related[page.path] 를 바로 읽으므로
+페이지마다 site.related_posts 를 Liquid 로 거르는 비용이 없습니다.
+후보가 k 개보다 적은 포스트는 예전 규칙(같은 첫 카테고리의 최신 포스트)으로 채웁니다.
+
+_data/related.json 은 커밋하지 않는 생성물입니다. 새 포스트가 기존 포스트의 관련 포스트에도
+바로 반영되도록 Pages 워크플로(.github/workflows/pages.yml)가 jekyll build 직전에 매번 다시 만듭니다.
+파일이 없으면(로컬 jekyll serve) post.html 은 모든 포스트에 카테고리 기준 목록을 보여 줍니다.
+
+사용법:
+    python build_related_posts.py
+    python build_related_posts.py --top 4 --bands 64 --rows 2
+"""
+
+import hashlib
+import json
+import math
+import os
+import re
+from collections import Counter, defaultdict
+from itertools import combinations
+from pathlib import Path
+from typing import Dict, FrozenSet, List, Set, Tuple
+
+import numpy as np
+
+import build_search_index as index
+
+OUTPUT_PATH = Path('_data/related.json')
+TOP_K = 3
+# 이 블로그의 3번째 이웃 Jaccard 중앙값이 약 0.13 이라 임계값 ≈ 0.09 가 되도록 128 x 2
+NUM_BANDS = 128
+ROWS_PER_BAND = 2
+CONTENT_TERMS = 20
+EXCERPT_WORDS = 15
+SEED = 42
+
+MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+MAX_HASH = np.uint64((1 << 32) - 1)
+TAG_SPLIT_PATTERN = re.compile(r'[-_\s]+')
+
+
+def _hash32(feature: str) -> int:
+    return int.from_bytes(hashlib.blake2b(feature.encode('utf-8'), digest_size=4).digest(), 'little')
+
+
+def post_features(docs: List[Dict], content_terms: int = CONTENT_TERMS) -> List[FrozenSet[str]]:
+    """포스트별 특징 집합: 태그/카테고리(원문과 단어), 제목 용어, 본문 TF-IDF 상위 용어"""
+    # 한 글자 용어(조사/어미 음절, 숫자)는 거의 모든 글에 있어 유사도를 흐리므로 제외
+    def terms(text: str) -> List[str]:
+        return [term for term in index.tokenize(text) if len(term) > 1]
+
+    term_counts = [Counter(terms(doc['content'])) for doc in docs]
+    df = Counter(term for counts in term_counts for term in counts)
+    n = len(docs)
+
+    features = []
+    for doc, counts in zip(docs, term_counts):
+        items: Set[str] = set()
+        for prefix, values in (('tag', doc['tags']), ('cat', doc['categories'])):
+            for value in values:
+                value = value.lower()
+                items.add(f'{prefix}:{value}')
+                items.update(f'kw:{word}' for word in TAG_SPLIT_PATTERN.split(value) if len(word) > 1)
+        items.update(f'kw:{term}' for term in terms(doc['title']))
+
+        # 거의 모든 글에 나오는 용어(df 가 큰 용어)는 점수가 낮아 자연히 빠짐
+        scored = sorted(counts.items(), key=lambda item: (-item[1] * math.log(n / df[item[0]]), item[0]))
+        items.update(f'kw:{term}' for term, _ in scored[:content_terms])
+        features.append(frozenset(items))
+    return features
+
+
+def minhash_signatures(features: List[FrozenSet[str]], num_perm: int, seed: int = SEED) -> np.ndarray:
+    """(포스트 수, num_perm) MinHash 서명. 해시 순열은 (a·x + b) mod p"""
+    rng = np.random.RandomState(seed)
+    a = rng.randint(1, MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+    b = rng.randint(0, MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+
+    signatures = np.full((len(features), num_perm), MAX_HASH, dtype=np.uint64)
+    for i, items in enumerate(features):
+        if not items:
+            continue
+        hashes = np.fromiter((_hash32(item) for item in sorted(items)), dtype=np.uint64, count=len(items))
+        # uint64 곱셈 오버플로는 의도된 랩어라운드 (datasketch 와 같은 방식)
+        with np.errstate(over='ignore'):
+            permuted = np.bitwise_and((np.outer(hashes, a) + b) % MERSENNE_PRIME, MAX_HASH)
+        signatures[i] = permuted.min(axis=0)
+    return signatures
+
+
+def lsh_candidates(signatures: np.ndarray, bands: int, rows: int) -> Set[Tuple[int, int]]:
+    """밴드별 서명 조각이 같은 포스트 쌍 (Jaccard 약 (1/bands)^(1/rows) 이상이면 높은 확률로 포함)"""
+    candidates: Set[Tuple[int, int]] = set()
+    for band in range(bands):
+        buckets: Dict[bytes, List[int]] = defaultdict(list)
+        chunk = signatures[:, band * rows:(band + 1) * rows]
+        for i, row in enumerate(chunk):
+            buckets[row.tobytes()].append(i)
+        for members in buckets.values():
+            if len(members) > 1:
+                candidates.update(combinations(members, 2))
+    return candidates
+
+
+def jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    return len(a & b) / len(a | b) if a or b else 0.0
+
+
+def related_posts(docs: List[Dict], top: int = TOP_K, bands: int = NUM_BANDS,
+                  rows: int = ROWS_PER_BAND) -> Dict[str, List[Dict]]:
+    """{page.path: [관련 포스트 정보 ...]} (docs 는 최신순)"""
+    features = post_features(docs)
+    signatures = minhash_signatures(features, bands * rows)
+
+    neighbours: Dict[int, List[Tuple[float, int]]] = defaultdict(list)
+    for i, j in lsh_candidates(signatures, bands, rows):
+        score = jaccard(features[i], features[j])
+        if score > 0:
+            neighbours[i].append((score, j))
+            neighbours[j].append((score, i))
+
+    related = {}
+    for i, doc in enumerate(docs):
+        # 유사도 내림차순, 같으면 최신 글 우선 (docs 가 최신순이므로 번호가 작은 쪽)
+        ranked = [j for _, j in sorted(neighbours[i], key=lambda item: (-item[0], item[1]))][:top]
+        if len(ranked) < top and doc['categories']:
+            first = doc['categories'][0]
+            ranked += [j for j, other in enumerate(docs)
+                       if j != i and j not in ranked and first in other['categories']][:top - len(ranked)]
+        related[f"_posts/{doc['file']}"] = [{
+            'title': docs[j]['title'],
+            'url': docs[j]['url'],
+            'date': docs[j]['posted'].strftime('%Y-%m-%d'),
+            'excerpt': index.truncate_words(docs[j]['excerpt'], EXCERPT_WORDS),
+        } for j in ranked]
+    return dict(sorted(related.items()))
+
+
+def main():
+    """메인 실행 함수"""
+    import argparse
+
+    workspace = os.path.dirname(os.path.abspath(__file__))
+
+    parser = argparse.ArgumentParser(description='MinHash/LSH 관련 포스트 데이터 생성')
+    parser.add_argument('--posts', default=os.path.join(workspace, '_posts'), help='포스트 디렉토리 (기본값: _posts)')
+    parser.add_argument('--output', default=os.path.join(workspace, OUTPUT_PATH),
+                        help=f'출력 파일 (기본값: {OUTPUT_PATH})')
+    parser.add_argument('--top', type=int, default=TOP_K, help=f'포스트당 관련 포스트 수 (기본값: {TOP_K})')
+    parser.add_argument('--bands', type=int, default=NUM_BANDS, help=f'LSH 밴드 수 (기본값: {NUM_BANDS})')
+    parser.add_argument('--rows', type=int, default=ROWS_PER_BAND, help=f'밴드당 행 수 (기본값: {ROWS_PER_BAND})')
+    args = parser.parse_args()
+
+    if min(args.top, args.bands, args.rows) <= 0:
+        parser.error('--top, --bands, --rows 는 0 보다 커야 합니다')
+
+    # 관련도는 본문 전체로 판단 (검색 색인처럼 앞 200 단어로 자르지 않음)
+    docs = index.load_posts(Path(args.posts), content_words=0)
+    related = related_posts(docs, args.top, args.bands, args.rows)
+
+    output = Path(args.output)
+    payload = json.dumps(related, ensure_ascii=False, indent=2) + '\n'
+    if output.exists() and output.read_text(encoding='utf-8') == payload:
+        print(f"✅ 변경 없음: {output}")
+        return 0
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(payload, encoding='utf-8')
+    threshold = (1 / args.bands) ** (1 / args.rows)
+    print(f"✅ 포스트 {len(related)}개의 관련 포스트 저장 (LSH 임계 Jaccard ≈ {threshold:.2f}) → {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
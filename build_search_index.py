@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+"""
+사이트 검색용 샤딩 역색인 빌더
+
+Liquid 로 모든 포스트 본문을 한 파일에 넣던 search.json 대신, 포스트를 Python 으로 토큰화해
+다음 파일을 assets/search/ 에 씁니다:
+
+    manifest.json        문서 테이블/샤드 파일 이름과 각 샤드의 첫 용어 (매 검색 전 한 번만 받음)
+    docs-<hash>.json     결과 표시용 문서 테이블 (제목/URL/날짜/카테고리/요약)
+    terms-<hash>.json    용어 → 문서 번호 간격(delta) 목록. 정렬된 용어를 SHARD_BYTES 크기로 잘라 나눈 샤드
+    *.json.gz, *.json.br 각 파일을 최대 압축률로 미리 압축한 사본 (gzip_static/brotli_static 용)
+
+토큰화:
+    - 한글 어절은 음절 bigram + 마지막 음절로 색인 → 어절 중간의 부분 문자열 검색도 찾음
+      (검색어 "리스" 는 "서버리스를" 의 bigram 으로 매칭)
+    - 영문/숫자 단어는 모든 접미사로 색인하고 검색어를 접두어로 매칭 → 예전 search.json 의
+      부분 문자열 검색과 같은 결과 (검색어 "ai" 는 "email", "openai" 의 접미사 "ail", "ai" 로 매칭)
+
+샤드는 정렬된 용어 구간이라 같은 접두어를 가진 용어는 연속된 샤드에 모입니다.
+클라이언트(_layouts/default.html)는 manifest 의 첫 용어 목록으로 검색어 접두어가 걸친 샤드만 받습니다.
+파일 이름에 내용 해시가 들어가므로 바뀌지 않은 샤드는 브라우저 캐시를 그대로 씁니다.
+
+assets/search/ 는 커밋하지 않는 생성물입니다. Pages 워크플로(.github/workflows/pages.yml)가
+jekyll build 직전에 이 스크립트를 실행하므로 새 포스트는 배포할 때마다 색인됩니다.
+로컬에서 jekyll serve 로 검색을 확인하려면 먼저 한 번 실행하세요.
+
+사용법:
+    python build_search_index.py
+    python build_search_index.py --shard-bytes 16384 --content-words 0   # 본문 전체 색인
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import re
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import quote
+
+import yaml
+
+INDEX_DIR = Path('assets/search')
+MANIFEST_NAME = 'manifest.json'
+INDEX_VERSION = 3
+
+SHARD_BYTES = 8 * 1024
+CONTENT_WORDS = 200
+EXCERPT_WORDS = 30
+
+PERMALINK = '/:categories/:year/:month/:day/:title/'
+SITE_TZ = timezone(timedelta(hours=9))  # _config.yml timezone: Asia/Seoul
+URL_SAFE = "-._~!$&'()*+,;=:@/"  # Jekyll URL.escape_path 이 그대로 두는 문자
+
+FRONT_MATTER_PATTERN = re.compile(r'\A---\s*\n(.*?)\n---\s*\n', re.DOTALL)
+FILENAME_PATTERN = re.compile(r'^(\d{4})-(\d{2})-(\d{2})-(.+)$')
+TERM_PATTERN = re.compile(r'[0-9a-z]+|[가-힣]+')
+
+# strip_html 전 단계에서 마크다운 문법만 걷어내는 규칙 (순서대로 적용)
+MARKDOWN_RULES = [
+    (re.compile(r'\{%-?.*?-?%\}|\{\{.*?\}\}', re.DOTALL), ' '),  # Liquid 태그
+    (re.compile(r'<!--.*?-->', re.DOTALL), ' '),
+    (re.compile(r'<[^>]+>'), ' '),                                # HTML 태그
+    (re.compile(r'!?\[([^\]]*)\]\([^)]*\)'), r'\1'),              # 링크/이미지 → 텍스트
+    (re.compile(r'^\s{0,3}(?:```|~~~).*$', re.MULTILINE), ' '),   # 펜스 줄 (내용은 유지)
+    (re.compile(r'^\s{0,3}(?:#{1,6}|>|[-*+]|\d+\.)\s+', re.MULTILINE), ''),
+    (re.compile(r'[*_`|]+'), ' '),
+]
+
+
+def _is_hangul(word: str) -> bool:
+    return '가' <= word[0] <= '힣'
+
+
+def tokenize(text: str, query: bool = False) -> List[str]:
+    """색인 용어 목록 (클라이언트 tokenizeQuery 와 같은 규칙)
+
+    한글 어절은 음절 bigram 에 마지막 음절을 더해, 한 글자 검색어도 어느 위치든 어떤 용어의 접두어가 되게 합니다.
+    영문/숫자 단어는 모든 접미사를 색인해, 검색어가 단어 중간에 있어도 어떤 용어의 접두어가 되게 합니다.
+    query=True 면 검색어용으로 중복 없이, 영문은 단어 그대로, 두 글자 이상 한글은 bigram 만 돌려줍니다.
+    """
+    terms = []
+    for word in TERM_PATTERN.findall(text.lower()):
+        if not _is_hangul(word):
+            if query:
+                terms.append(word)
+            else:
+                terms.extend(word[i:] for i in range(len(word)))
+        elif len(word) == 1:
+            terms.append(word)
+        else:
+            terms.extend(word[i:i + 2] for i in range(len(word) - 1))
+            if not query:
+                terms.append(word[-1])
+    return list(dict.fromkeys(terms)) if query else terms
+
+
+def strip_markdown(text: str) -> str:
+    """마크다운/HTML/Liquid 문법을 걷어낸 평문 (Jekyll strip_html 결과와 비슷하게)"""
+    for pattern, repl in MARKDOWN_RULES:
+        text = pattern.sub(repl, text)
+    return text
+
+
+def truncate_words(text: str, words: int) -> str:
+    """Liquid truncatewords 와 같은 동작 (words=0 이면 자르지 않음)"""
+    parts = text.split()
+    if not words or len(parts) <= words:
+        return ' '.join(parts)
+    return ' '.join(parts[:words]) + '...'
+
+
+def _as_list(value) -> List[str]:
+    """Jekyll 처럼 문자열 카테고리/태그는 공백으로 나눈 목록으로"""
+    if not value:
+        return []
+    if isinstance(value, str):
+        return value.split()
+    return [str(item) for item in value]
+
+
+def _post_date(value, fallback: date) -> datetime:
+    """front matter date → 사이트 타임존 기준 datetime"""
+    if isinstance(value, datetime):
+        return value.astimezone(SITE_TZ) if value.tzinfo else value.replace(tzinfo=SITE_TZ)
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day, tzinfo=SITE_TZ)
+    if isinstance(value, str):
+        try:
+            return _post_date(datetime.strptime(value.strip(), '%Y-%m-%d %H:%M:%S %z'), fallback)
+        except ValueError:
+            pass
+    return datetime(fallback.year, fallback.month, fallback.day, tzinfo=SITE_TZ)
+
+
+def post_url(metadata: Dict, categories: List[str], posted: datetime, slug: str) -> str:
+    """_config.yml permalink 규칙으로 포스트 URL 계산 (front matter permalink 우선)"""
+    if metadata.get('permalink'):
+        return quote(str(metadata['permalink']), safe=URL_SAFE)
+
+    seen = []
+    for category in categories:
+        if category.lower() not in seen:
+            seen.append(category.lower())
+    url = (PERMALINK
+           .replace(':categories', '/'.join(seen))
+           .replace(':year', f'{posted.year:04d}')
+           .replace(':month', f'{posted.month:02d}')
+           .replace(':day', f'{posted.day:02d}')
+           .replace(':title', str(metadata.get('slug') or slug)))
+    return quote(re.sub(r'/{2,}', '/', url), safe=URL_SAFE)
+
+
+def load_post(post_path: Path, content_words: int = CONTENT_WORDS) -> Optional[Dict]:
+    """포스트 파일 → 색인용 문서 (front matter 가 없거나 published: false 면 None)"""
+    text = post_path.read_text(encoding='utf-8')
+    match = FRONT_MATTER_PATTERN.match(text)
+    name = FILENAME_PATTERN.match(post_path.stem)
+    if not match or not name:
+        return None
+
+    metadata = yaml.safe_load(match.group(1)) or {}
+    if metadata.get('published') is False:
+        return None
+
+    body = text[match.end():]
+    year, month, day, slug = name.groups()
+    posted = _post_date(metadata.get('date'), date(int(year), int(month), int(day)))
+    categories = _as_list(metadata.get('categories') or metadata.get('category'))
+    plain = strip_markdown(body)
+
+    # Jekyll excerpt: front matter excerpt, 없으면 첫 문단
+    excerpt = metadata.get('excerpt') or strip_markdown(body.strip().split('\n\n', 1)[0])
+
+    return {
+        'file': post_path.name,
+        'title': str(metadata.get('title') or slug),
+        'url': post_url(metadata, categories, posted, slug),
+        'date': posted.strftime('%Y.%m.%d'),
+        'categories': categories,
+        'tags': _as_list(metadata.get('tags')),
+        'excerpt': truncate_words(str(excerpt), EXCERPT_WORDS),
+        'content': truncate_words(plain, content_words),
+        'author': metadata.get('author'),
+        'image': metadata.get('image'),
+        'words': len(plain.split()),
+        'posted': posted,
+    }
+
+
+def load_posts(posts_dir: Path, content_words: int = CONTENT_WORDS,
+               now: Optional[datetime] = None) -> List[Dict]:
+    """site.posts 와 같은 순서(최신순)의 문서 목록. 미래 날짜 포스트는 Jekyll 처럼 제외"""
+    now = now or datetime.now(SITE_TZ)
+    docs = []
+    for post_path in sorted(Path(posts_dir).glob('*.md')):
+        doc = load_post(post_path, content_words)
+        if doc and doc['posted'] <= now:
+            docs.append(doc)
+    docs.sort(key=lambda doc: doc['posted'], reverse=True)
+    return docs
+
+
+def build_postings(docs: List[Dict]) -> Dict[str, List[int]]:
+    """용어 → 오름차순 문서 번호 목록 (제목/카테고리/태그/요약/본문 전부 색인)"""
+    postings: Dict[str, List[int]] = {}
+    for doc_id, doc in enumerate(docs):
+        fields = [doc['title'], doc['excerpt'], doc['content'], *doc['categories'], *doc['tags']]
+        for term in set(tokenize(' '.join(fields))):
+            postings.setdefault(term, []).append(doc_id)
+    return dict(sorted(postings.items()))
+
+
+def delta_encode(ids: List[int]) -> List[int]:
+    """오름차순 문서 번호 → 첫 번호와 이후 간격 목록 (JSON 자릿수 절약)"""
+    return [doc_id - prev for prev, doc_id in zip([0] + ids, ids)]
+
+
+def delta_decode(gaps: List[int]) -> List[int]:
+    ids, doc_id = [], 0
+    for gap in gaps:
+        doc_id += gap
+        ids.append(doc_id)
+    return ids
+
+
+def _dumps(data) -> str:
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+
+
+def shard_postings(postings: Dict[str, List[int]], shard_bytes: int = SHARD_BYTES) -> List[Dict[str, List[int]]]:
+    """정렬된 용어를 순서대로 채워 shard_bytes 를 넘기 직전에 자른 샤드 목록"""
+    shards: List[Dict[str, List[int]]] = []
+    current: Dict[str, List[int]] = {}
+    size = 0
+    for term, ids in postings.items():
+        entry = len(_dumps({term: ids}).encode('utf-8'))
+        if current and size + entry > shard_bytes:
+            shards.append(current)
+            current, size = {}, 0
+        current[term] = ids
+        size += entry
+    if current or not shards:
+        shards.append(current)
+    return shards
+
+
+def _hashed_name(prefix: str, payload: str) -> str:
+    return f"{prefix}-{hashlib.sha256(payload.encode('utf-8')).hexdigest()[:10]}.json"
+
+
+def _write_if_changed(path: Path, payload: bytes) -> bool:
+    if path.exists() and path.read_bytes() == payload:
+        return False
+    path.write_bytes(payload)
+    return True
+
+
+def compress_variants(name: str, payload: bytes) -> Dict[str, bytes]:
+    """name.gz / name.br 사본 (최대 압축률, 같은 입력이면 같은 바이트)"""
+    try:
+        import brotli
+    except ImportError:
+        raise RuntimeError("brotli가 설치되어 있지 않습니다: pip install brotli")
+
+    return {
+        f'{name}.gz': gzip.compress(payload, compresslevel=9, mtime=0),
+        f'{name}.br': brotli.compress(payload, mode=brotli.MODE_TEXT, quality=11, lgwin=24),
+    }
+
+
+def doc_table(docs: Iterable[Dict]) -> List[Dict]:
+    """검색 결과 표시에 필요한 필드만 남긴 문서 테이블"""
+    fields = ('title', 'url', 'date', 'categories', 'excerpt')
+    return [{field: doc[field] for field in fields} for doc in docs]
+
+
+def build_index_files(docs: List[Dict], shard_bytes: int = SHARD_BYTES) -> Tuple[Dict[str, str], int]:
+    """문서 테이블/샤드/manifest 내용 → ({파일 이름: JSON}, 용어 수). 디스크에는 쓰지 않음"""
+    files: Dict[str, str] = {}
+    docs_payload = _dumps(doc_table(docs))
+    docs_name = _hashed_name('docs', docs_payload)
+    files[docs_name] = docs_payload
+
+    postings = build_postings(docs)
+    bounds, shard_names = [], []
+    encoded = {term: delta_encode(ids) for term, ids in postings.items()}
+    for shard in shard_postings(encoded, shard_bytes):
+        payload = _dumps(shard)
+        name = _hashed_name('terms', payload)
+        files[name] = payload
+        # 첫 샤드는 빈 문자열에서 시작해 모든 검색어가 어느 샤드에든 속하게 함
+        bounds.append(next(iter(shard), '') if shard_names else '')
+        shard_names.append(name)
+
+    manifest = {
+        'version': INDEX_VERSION,
+        'docs': docs_name,
+        'count': len(docs),
+        'bounds': bounds,
+        'shards': shard_names,
+    }
+    files[MANIFEST_NAME] = _dumps(manifest)
+    return files, len(postings)
+
+
+def write_index(docs: List[Dict], output_dir: Path, shard_bytes: int = SHARD_BYTES) -> Dict:
+    """문서 테이블/샤드/manifest 를 쓰고 쓰지 않게 된 이전 파일은 지움 → 빌드 리포트"""
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    files, term_count = build_index_files(docs, shard_bytes)
+    outputs: Dict[str, bytes] = {}
+    for name, payload in files.items():
+        data = payload.encode('utf-8')
+        outputs[name] = data
+        outputs.update(compress_variants(name, data))
+
+    written = [name for name, data in outputs.items() if _write_if_changed(output_dir / name, data)]
+    removed = []
+    for stale in output_dir.glob('*.json*'):
+        if stale.name not in outputs:
+            stale.unlink()
+            removed.append(stale.name)
+
+    return {
+        'docs': len(docs),
+        'terms': term_count,
+        'shards': len(files) - 2,
+        'bytes': {name: len(data) for name, data in outputs.items()},
+        'written': written,
+        'removed': removed,
+    }
+
+
+def main():
+    """메인 실행 함수"""
+    import argparse
+
+    workspace = os.path.dirname(os.path.abspath(__file__))
+
+    parser = argparse.ArgumentParser(description='포스트 검색용 샤딩 역색인 생성')
+    parser.add_argument('--posts', default=os.path.join(workspace, '_posts'), help='포스트 디렉토리 (기본값: _posts)')
+    parser.add_argument('--output-dir', default=os.path.join(workspace, INDEX_DIR),
+                        help=f'색인 출력 디렉토리 (기본값: {INDEX_DIR})')
+    parser.add_argument('--shard-bytes', type=int, default=SHARD_BYTES,
+                        help=f'샤드 하나의 목표 크기 (바이트, 기본값: {SHARD_BYTES})')
+    parser.add_argument('--content-words', type=int, default=CONTENT_WORDS,
+                        help=f'본문에서 색인할 앞부분 단어 수, 0 이면 전체 (기본값: {CONTENT_WORDS})')
+    args = parser.parse_args()
+
+    if args.shard_bytes <= 0:
+        parser.error('--shard-bytes 는 0 보다 커야 합니다')
+
+    docs = load_posts(Path(args.posts), args.content_words)
+    try:
+        report = write_index(docs, Path(args.output_dir), args.shard_bytes)
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        return 1
+
+    sizes = report['bytes']
+
+    def total(prefix: str, suffix: str = '') -> int:
+        return sum(size for name, size in sizes.items()
+                   if name.startswith(prefix) and name.endswith('.json' + suffix))
+
+    print(f"📚 문서 {report['docs']}개, 용어 {report['terms']}개 → 샤드 {report['shards']}개")
+    for label, prefix in (('manifest', 'manifest'), ('문서 테이블', 'docs-'), ('샤드 합계', 'terms-')):
+        print(f"   {label:<8} {total(prefix):>9,}B  gzip {total(prefix, '.gz'):>8,}B  brotli {total(prefix, '.br'):>8,}B")
+    print(f"✅ {len(report['written'])}개 파일 갱신, {len(report['removed'])}개 이전 파일 삭제 → {args.output_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+git 기반 변경 포스트 선택기
+
+기준 ref 이후 바뀐 파일을 git 으로 찾아 후처리 도구들이 바뀐 포스트만 처리하게 합니다.
+다음을 모두 합칩니다:
+    - git diff --name-only <ref>          ref 이후 커밋 + 작업 트리 변경 (스테이징 포함)
+    - git diff --name-only --cached <ref> 스테이징만 되고 작업 트리에서 지운 경우 등
+    - git ls-files --others --exclude-standard   아직 추적되지 않은 새 파일
+삭제된 파일은 제외합니다.
+
+fix_django_templates.py, auto_thumbnail_generator.py, fix_thumbnail_matching.py 의 --since 옵션이 사용합니다.
+
+사용법:
+    python changed_posts.py --since origin/main
+    python changed_posts.py --since HEAD~3 --paths assets/img/posts
+"""
+
+import subprocess
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+DEFAULT_REF = 'HEAD'
+POST_SUFFIXES = ('.md', '.markdown')
+
+
+def _git(workspace: Path, *args: str) -> str:
+    """git 명령 실행 → 표준 출력 (실패 시 ValueError)"""
+    try:
+        result = subprocess.run(['git', *args], cwd=workspace, capture_output=True, check=True)
+    except FileNotFoundError:
+        raise ValueError("git 명령을 찾을 수 없습니다")
+    except subprocess.CalledProcessError as e:
+        message = e.stderr.decode('utf-8', 'replace').strip()
+        raise ValueError(f"git {' '.join(args[:2])} 실패: {message}")
+    return result.stdout.decode('utf-8')
+
+
+def _names(output: str) -> List[str]:
+    """-z 출력 → 경로 목록"""
+    return [item for item in output.split('\0') if item]
+
+
+def git_changed_paths(workspace: Path, since: Optional[str] = None, pathspecs: Iterable[str] = ()) -> List[Path]:
+    """ref 이후 변경/추가된 파일 (인덱스와 추적되지 않은 파일 포함)의 절대 경로 목록"""
+    workspace = Path(workspace).resolve()
+    ref = since or DEFAULT_REF
+    pathspecs = [str(p) for p in pathspecs]
+
+    toplevel = Path(_git(workspace, 'rev-parse', '--show-toplevel').strip())
+    try:
+        _git(workspace, 'rev-parse', '--verify', '--quiet', f'{ref}^{{commit}}')
+    except ValueError:
+        # ref 오타를 diff 의 모호한 오류 대신 명확한 메시지로 알림
+        raise ValueError(f"기준 ref 를 찾을 수 없습니다: {ref}")
+
+    names = set()
+    diff_args = ['diff', '--name-only', '-z', '--diff-filter=ACMR']
+    names.update(_names(_git(workspace, *diff_args, ref, '--', *pathspecs)))
+    names.update(_names(_git(workspace, *diff_args, '--cached', ref, '--', *pathspecs)))
+    # ls-files 는 현재 디렉토리 기준 경로를 출력하므로 저장소 루트에서 실행
+    untracked = _names(_git(toplevel, 'ls-files', '--others', '--exclude-standard', '-z', '--',
+                            *[str((workspace / p).resolve().relative_to(toplevel)) for p in pathspecs]))
+    names.update(untracked)
+
+    return sorted(path for path in (toplevel / name for name in names) if path.is_file())
+
+
+def changed_posts(posts_dir: Path, since: Optional[str] = None) -> List[Path]:
+    """posts_dir 안에서 ref 이후 바뀐 포스트 파일 목록"""
+    posts_dir = Path(posts_dir).resolve()
+    return [path for path in git_changed_paths(posts_dir, since, [posts_dir])
+            if path.suffix in POST_SUFFIXES]
+
+
+def main():
+    """변경 파일 목록 출력 (pre-commit/CI 에서 다른 도구에 넘길 때 사용)"""
+    import argparse
+    import os
+
+    workspace = os.path.dirname(os.path.abspath(__file__))
+
+    parser = argparse.ArgumentParser(description='git 기준 ref 이후 변경된 포스트 목록')
+    parser.add_argument('--since', default=DEFAULT_REF, help=f'기준 ref (기본값: {DEFAULT_REF})')
+    parser.add_argument('--paths', nargs='+', default=[os.path.join(workspace, '_posts')],
+                        help='검사할 경로 (기본값: _posts)')
+    args = parser.parse_args()
+
+    try:
+        paths = git_changed_paths(workspace, args.since, [os.path.abspath(p) for p in args.paths])
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+
+    for path in paths:
+        print(path)
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+웹 최적화 차트 내보내기
+
+matplotlib Figure를 웹 게시용으로 저장합니다.
+
+- SVG: 텍스트는 <text>로 유지(svg.fonttype=none), 경로 단순화 적용
+- WebP: 실제 표시 너비(기본 800px)로 렌더링 후 바이트 예산에 맞춰 품질 선택
+- auto: SVG가 예산 안이면 SVG, 넘으면 WebP
+- 기존 300dpi PNG 대비 절감량 보고
+"""
+
+import io
+from pathlib import Path
+from typing import Dict, Optional
+
+EXPORT_FORMATS = ('png', 'svg', 'webp', 'auto')
+
+DEFAULT_DISPLAY_WIDTH = 800
+DEFAULT_PNG_DPI = 300
+WEBP_QUALITIES = (90, 85, 80, 75, 70, 60, 50)
+
+SVG_RC = {
+    'svg.fonttype': 'none',          # 글자를 경로로 바꾸지 않고 텍스트로 유지
+    'svg.hashsalt': 'updaun-charts',  # 실행마다 같은 id 생성 (재현 가능한 출력)
+    'path.simplify': True,
+    'path.simplify_threshold': 0.5,
+}
+
+
+def render_png(fig, dpi: int = DEFAULT_PNG_DPI, **savefig_kwargs) -> bytes:
+    """기존 방식의 고해상도 PNG 렌더링"""
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='png', dpi=dpi, bbox_inches='tight', **savefig_kwargs)
+    return buffer.getvalue()
+
+
+def render_svg(fig, **savefig_kwargs) -> bytes:
+    """텍스트 유지 + 경로 단순화 SVG 렌더링"""
+    import matplotlib
+
+    buffer = io.BytesIO()
+    with matplotlib.rc_context(SVG_RC):
+        fig.savefig(buffer, format='svg', bbox_inches='tight', metadata={'Date': None}, **savefig_kwargs)
+    return buffer.getvalue()
+
+
+def render_webp(fig, display_width: int = DEFAULT_DISPLAY_WIDTH, budget: Optional[int] = None,
+                scale: float = 1.0, **savefig_kwargs) -> Dict:
+    """표시 해상도 WebP 렌더링 → {'data', 'quality'}
+
+    차트는 단색 면이 많아 무손실이 더 작은 경우가 많으므로 무손실을 먼저 시도하고,
+    예산을 넘으면 손실 압축 품질을 낮춰 가며 예산 안에 드는 첫 결과를 사용합니다.
+    """
+    from PIL import Image
+
+    target_width = int(display_width * scale)
+    dpi = target_width / fig.get_size_inches()[0]
+
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='png', dpi=dpi, bbox_inches='tight', **savefig_kwargs)
+    buffer.seek(0)
+    img = Image.open(buffer)
+    img.load()
+    if img.width > target_width:
+        # bbox_inches='tight' 로 너비가 달라질 수 있어 표시 너비에 맞춤
+        height = round(img.height * target_width / img.width)
+        img = img.resize((target_width, height), Image.Resampling.LANCZOS)
+    if img.mode not in ('RGB', 'RGBA'):
+        img = img.convert('RGBA')
+
+    def encode(**options) -> bytes:
+        out = io.BytesIO()
+        img.save(out, 'WEBP', **options)
+        return out.getvalue()
+
+    candidates = [(encode(lossless=True, quality=100, method=6), 'lossless')]
+    if budget is None or len(candidates[0][0]) <= budget:
+        return {'data': candidates[0][0], 'quality': 'lossless'}
+
+    for quality in WEBP_QUALITIES:
+        data = encode(quality=quality, method=6)
+        if len(data) <= budget:
+            return {'data': data, 'quality': quality}
+        candidates.append((data, quality))
+
+    data, quality = min(candidates, key=lambda item: len(item[0]))
+    print(f"⚠️ WebP가 예산 {budget:,} bytes를 넘습니다 (최소 {len(data):,} bytes, 품질 {quality})")
+    return {'data': data, 'quality': quality}
+
+
+def export_figure(fig, output_stem: Path, format: str = 'auto', budget: Optional[int] = None,
+                  display_width: int = DEFAULT_DISPLAY_WIDTH, scale: float = 1.0,
+                  png_dpi: int = DEFAULT_PNG_DPI, compare_png: bool = True, **savefig_kwargs) -> Dict:
+    """Figure를 지정 형식으로 저장하고 보고서 반환
+
+    output_stem: 확장자를 뺀 출력 경로 (형식에 맞는 확장자가 붙음)
+    """
+    if format not in EXPORT_FORMATS:
+        raise ValueError(f"지원하지 않는 형식입니다: {format} (가능: {', '.join(EXPORT_FORMATS)})")
+
+    output_stem = Path(output_stem)
+    png_data = render_png(fig, dpi=png_dpi, **savefig_kwargs) if (format == 'png' or compare_png) else None
+
+    report = {'format': format, 'quality': None, 'budget': budget,
+              'png_bytes': len(png_data) if png_data is not None else None}
+
+    if format == 'png':
+        data, suffix = png_data, '.png'
+    else:
+        data = None
+        if format in ('svg', 'auto'):
+            svg_data = render_svg(fig, **savefig_kwargs)
+            if format == 'svg' or budget is None or len(svg_data) <= budget:
+                data, suffix = svg_data, '.svg'
+                report['format'] = 'svg'
+        if data is None:
+            webp = render_webp(fig, display_width=display_width, budget=budget, scale=scale, **savefig_kwargs)
+            data, suffix = webp['data'], '.webp'
+            report['format'] = 'webp'
+            report['quality'] = webp['quality']
+
+    output_path = output_stem.with_suffix(suffix)
+    output_path.write_bytes(data)
+
+    report['path'] = output_path
+    report['bytes'] = len(data)
+    return report
+
+
+def format_report(report: Dict) -> str:
+    """내보내기 결과 한 줄 요약 (PNG 대비 절감량 포함)"""
+    detail = report['format']
+    if report.get('quality') is not None:
+        detail += f" q={report['quality']}"
+    line = f"{report['path'].name} [{detail}] {report['bytes'] / 1024:.1f} KB"
+
+    if report.get('budget') and report['bytes'] > report['budget']:
+        line += f" (예산 {report['budget'] / 1024:.0f} KB 초과)"
+
+    png_bytes = report.get('png_bytes')
+    if png_bytes and report['format'] != 'png':
+        saved = png_bytes - report['bytes']
+        line += f", PNG {png_bytes / 1024:.1f} KB 대비 {saved / 1024:.1f} KB 절감 ({saved / png_bytes * 100:.0f}%)"
+    return line
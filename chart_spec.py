@@ -0,0 +1,580 @@
+#!/usr/bin/env python3
+"""
+선언형 차트 스펙 렌더러
+
+YAML/JSON 차트 스펙(차트 종류, 시리즈, 팔레트, 주석)을 matplotlib으로 그리고
+chart_export 로 웹용 파일을 저장합니다. 스펙 디렉토리를 한 번에 처리하며,
+matplotlib import, 폰트/스타일 설정, Figure 객체는 워커마다 한 번만 준비해 차트 사이에 재사용합니다.
+
+스펙 형식 (예: _charts/aws-ri/size-flexibility.yml):
+    name: size-flexibility            # --only 에서 쓰는 이름 (기본값: 파일 이름)
+    output: size-flexibility-matrix   # 확장자를 뺀 출력 파일 이름
+    figure: {size: [12, 8], layout: [1, 1]}
+    export: {format: auto, budget: 80000}
+    data:   {...}                     # 이름 붙은 값/리스트/딕셔너리/레코드 리스트
+    derived:                          # data 로부터 계산되는 값
+      unused: {op: subtract, args: [100, utilization]}
+    panels:                           # layout 순서대로 그려질 패널
+      - type: barh                    # line | bar | barh | pie | canvas
+        series: [{y: size, color: blue, labels: {text: "{value} units"}}]
+        annotations: [{type: vline, x: 4, color: orange}]
+
+문자열 값은 data 이름을 참조하고, 색상은 palette 이름 또는 matplotlib 색상 문자열을 씁니다.
+data_file(스펙 파일 기준 상대 경로의 JSON/YAML, 예: cur_ingest.py 집계 결과)을 주면
+그 값을 data 아래에 깔고, 스펙의 data 가 같은 이름을 덮어씁니다.
+디렉토리의 _defaults.yml 은 모든 스펙에 먼저 합쳐집니다 (팔레트, 스타일, 내보내기 설정 공유).
+
+사용법:
+    python chart_spec.py _charts/aws-ri -o assets/images/aws-ri
+    python chart_spec.py _charts/aws-ri --only hero --format webp --force
+"""
+
+import os
+import json
+import time
+import hashlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import yaml
+
+import chart_export
+
+PANEL_TYPES = ('line', 'bar', 'barh', 'pie', 'canvas')
+ANNOTATION_TYPES = ('hline', 'vline', 'text', 'box', 'rects', 'point_labels')
+DERIVED_OPS = ('add', 'subtract', 'multiply', 'divide', 'percent', 'max', 'min', 'sum')
+SPEC_SUFFIXES = ('.yml', '.yaml', '.json')
+DEFAULTS_FILE = '_defaults.yml'
+
+DEFAULT_STYLE = {
+    'font_family': 'DejaVu Sans',
+    'dpi': 300,
+}
+
+_BINARY_OPS = {
+    'add': lambda a, b: a + b,
+    'subtract': lambda a, b: a - b,
+    'multiply': lambda a, b: a * b,
+    'divide': lambda a, b: a / b,
+    'percent': lambda a, b: a / b * 100,
+    'max': max,
+    'min': min,
+}
+
+
+def _merge(base: Dict, override: Dict) -> Dict:
+    """딕셔너리 재귀 병합 (override 우선)"""
+    merged = dict(base)
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def validate_spec(spec: Dict, source: str = '') -> None:
+    """스펙 구조 검사 (잘못된 경우 ValueError)"""
+    panels = spec.get('panels')
+    if not panels:
+        raise ValueError(f"{source}: 'panels' 가 비어 있습니다")
+
+    rows, cols = spec.get('figure', {}).get('layout', [1, 1])
+    if len(panels) > rows * cols:
+        raise ValueError(f"{source}: 패널 {len(panels)}개가 layout {rows}x{cols} 보다 많습니다")
+
+    for i, panel in enumerate(panels, 1):
+        if panel.get('type') not in PANEL_TYPES:
+            raise ValueError(f"{source}: {i}번째 패널의 type 이 잘못되었습니다: {panel.get('type')} "
+                             f"(가능: {', '.join(PANEL_TYPES)})")
+        for annotation in panel.get('annotations', []):
+            if annotation.get('type') not in ANNOTATION_TYPES:
+                raise ValueError(f"{source}: {i}번째 패널의 주석 type 이 잘못되었습니다: {annotation.get('type')}")
+
+    for name, rule in spec.get('derived', {}).items():
+        if rule.get('op') not in DERIVED_OPS:
+            raise ValueError(f"{source}: derived '{name}' 의 op 가 잘못되었습니다: {rule.get('op')}")
+
+
+def load_spec(spec_path: Path, defaults: Optional[Dict] = None) -> Dict:
+    """스펙 파일 하나 로드 (JSON 도 YAML 파서로 읽음)"""
+    spec_path = Path(spec_path)
+    with open(spec_path, 'r', encoding='utf-8') as f:
+        spec = yaml.safe_load(f) or {}
+    if not isinstance(spec, dict):
+        raise ValueError(f"{spec_path}: 스펙은 매핑이어야 합니다")
+
+    spec = _merge(defaults or {}, spec)
+    if spec.get('data_file'):
+        # 파일 내용을 스펙에 합쳐 두므로 렌더 캐시 키에 데이터 변경이 반영됨
+        data_path = (spec_path.parent / spec['data_file']).resolve()
+        if not data_path.exists():
+            raise FileNotFoundError(f"{spec_path}: data_file 을 찾을 수 없습니다: {data_path}")
+        with open(data_path, 'r', encoding='utf-8') as f:
+            file_data = yaml.safe_load(f) or {}
+        spec['data'] = {**file_data, **spec.get('data', {})}
+    spec.setdefault('name', spec_path.stem)
+    spec.setdefault('output', spec['name'])
+    validate_spec(spec, str(spec_path))
+    return spec
+
+
+def load_spec_dir(spec_dir: Path) -> List[Dict]:
+    """디렉토리의 모든 스펙 로드 ('_' 로 시작하는 파일 제외, _defaults.yml 은 공통 설정)"""
+    spec_dir = Path(spec_dir)
+    if not spec_dir.is_dir():
+        raise FileNotFoundError(f"차트 스펙 디렉토리를 찾을 수 없습니다: {spec_dir}")
+
+    defaults = {}
+    defaults_path = spec_dir / DEFAULTS_FILE
+    if defaults_path.exists():
+        with open(defaults_path, 'r', encoding='utf-8') as f:
+            defaults = yaml.safe_load(f) or {}
+
+    paths = sorted(p for p in spec_dir.iterdir()
+                   if p.suffix in SPEC_SUFFIXES and not p.name.startswith('_'))
+    specs = [load_spec(path, defaults) for path in paths]
+
+    names = [spec['name'] for spec in specs]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"{spec_dir}: 차트 이름이 중복됩니다: {', '.join(duplicates)}")
+    return specs
+
+
+def _elementwise(func, a, b):
+    """리스트/스칼라 조합에 이항 연산 적용 (스칼라는 브로드캐스트)"""
+    if isinstance(a, list) and isinstance(b, list):
+        return [func(x, y) for x, y in zip(a, b)]
+    if isinstance(a, list):
+        return [func(x, b) for x in a]
+    if isinstance(b, list):
+        return [func(a, y) for y in b]
+    return func(a, b)
+
+
+def resolve_data(spec: Dict) -> Dict:
+    """data 에 derived 값을 정의 순서대로 계산해 추가"""
+    data = dict(spec.get('data', {}))
+    for name, rule in spec.get('derived', {}).items():
+        args = [_lookup(data, arg) for arg in rule.get('args', [])]
+        if rule['op'] == 'sum':
+            data[name] = sum(args[0])
+            continue
+        result = args[0]
+        for arg in args[1:]:
+            result = _elementwise(_BINARY_OPS[rule['op']], result, arg)
+        data[name] = result
+    return data
+
+
+def _lookup(data: Dict, ref):
+    """문자열이면 data 참조, 아니면 리터럴 값"""
+    if isinstance(ref, str):
+        if ref not in data:
+            raise ValueError(f"data 에 '{ref}' 가 없습니다")
+        return data[ref]
+    return ref
+
+
+def _split(options: Dict, keys) -> Dict:
+    """스펙 항목에서 구조 키를 뺀 나머지 (matplotlib 텍스트/도형 인자로 전달)"""
+    return {key: value for key, value in options.items() if key not in keys}
+
+
+class ChartRenderer:
+    """스타일/폰트/Figure 를 한 번 준비해 두고 여러 스펙을 연속 렌더링"""
+
+    def __init__(self, style: Optional[Dict] = None):
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+        from matplotlib import font_manager, patches
+
+        self.plt = plt
+        self.patches = patches
+        self.font_manager = font_manager
+        self.style = dict(DEFAULT_STYLE)
+        self.palette = {}
+        self._apply_style(style or {})
+        self.fig = plt.figure()
+
+    def _apply_style(self, style: Dict) -> None:
+        """폰트 설정이 바뀐 경우에만 rcParams 갱신 (폰트 탐색 결과는 font_manager 가 캐시)"""
+        style = {**DEFAULT_STYLE, **style}
+        if getattr(self, '_font_family', None) != style['font_family']:
+            self.plt.rcParams['font.family'] = style['font_family']
+            self.plt.rcParams['axes.unicode_minus'] = False
+            self.font_manager.findfont(style['font_family'])
+            self._font_family = style['font_family']
+        self.style = style
+
+    def _color(self, value):
+        """팔레트 이름이면 색상 값으로 변환"""
+        if isinstance(value, list):
+            return [self._color(v) for v in value]
+        return self.palette.get(value, value) if isinstance(value, str) else value
+
+    def _text_kwargs(self, options: Dict, keys) -> Dict:
+        kwargs = _split(options, keys)
+        if 'color' in kwargs:
+            kwargs['color'] = self._color(kwargs['color'])
+        return kwargs
+
+    def render(self, spec: Dict):
+        """스펙을 재사용 Figure 에 그려서 반환"""
+        self._apply_style(spec.get('style', {}))
+        self.palette = spec.get('palette', {})
+        data = resolve_data(spec)
+
+        figure = spec.get('figure', {})
+        fig = self.fig
+        fig.clear()
+        fig.set_size_inches(figure.get('size', [12, 6]))
+        fig.set_facecolor(self._color(figure.get('facecolor', 'white')))
+
+        rows, cols = figure.get('layout', [1, 1])
+        axes = fig.subplots(rows, cols, squeeze=False).ravel()
+        for ax, panel in zip(axes, spec['panels']):
+            getattr(self, f"_draw_{panel['type']}")(ax, panel, data)
+            self._decorate(ax, panel, data)
+        for ax in axes[len(spec['panels']):]:
+            ax.set_visible(False)
+
+        fig.tight_layout()
+        return fig
+
+    def export(self, spec: Dict, output_dir: Path, format: Optional[str] = None) -> Dict:
+        """스펙 렌더링 후 chart_export 로 저장 → 내보내기 보고서"""
+        fig = self.render(spec)
+        return chart_export.export_figure(fig, Path(output_dir) / spec['output'],
+                                          png_dpi=self.style['dpi'], **export_options(spec, format))
+
+    def _draw_line(self, ax, panel: Dict, data: Dict) -> None:
+        x = _lookup(data, panel['x'])
+        for fill in panel.get('fills', []):
+            ax.fill_between(x, _lookup(data, fill['y1']), _lookup(data, fill.get('y2', 0)),
+                            color=self._color(fill.get('color')), alpha=fill.get('alpha', 0.3),
+                            label=fill.get('label'))
+        for series in panel.get('series', []):
+            ax.plot(x, _lookup(data, series['y']), color=self._color(series.get('color')),
+                    marker=series.get('marker', 'o'), linestyle=series.get('linestyle', '-'),
+                    linewidth=series.get('linewidth', 3), markersize=series.get('markersize', 8),
+                    label=series.get('label'))
+
+    def _draw_bar(self, ax, panel: Dict, data: Dict, horizontal: bool = False) -> None:
+        """막대 차트 (시리즈가 여러 개면 묶음 막대)
+
+        카테고리는 categories(참조/리스트), 딕셔너리 시리즈의 키,
+        또는 records + category 필드에서 가져옵니다.
+        """
+        records = _lookup(data, panel['records']) if 'records' in panel else None
+        categories = _lookup(data, panel['categories']) if 'categories' in panel else None
+        if records is not None:
+            categories = [record[panel.get('category', 'name')] for record in records]
+
+        series_list = panel.get('series', [])
+        count = len(series_list)
+        width = panel.get('width', 0.8 if count == 1 else 0.8 / count)
+        draw = ax.barh if horizontal else ax.bar
+
+        for j, series in enumerate(series_list):
+            if records is not None:
+                values = [record[series['y']] for record in records]
+                contexts = records
+            else:
+                values = _lookup(data, series['y'])
+                if isinstance(values, dict):
+                    categories = list(values.keys())
+                    values = list(values.values())
+                contexts = [{} for _ in values]
+
+            colors = self._color(series.get('colors') or [series.get('color')] * len(values))
+            for category, color in series.get('highlight', {}).items():
+                if category in categories:
+                    colors[categories.index(category)] = self._color(color)
+
+            offset = (j - (count - 1) / 2) * width
+            positions = [i + offset for i in range(len(values))]
+            bars = draw(positions, values, width, color=colors, alpha=series.get('alpha', 1.0),
+                        label=series.get('label'))
+
+            labels = series.get('labels')
+            if labels:
+                kwargs = self._text_kwargs(labels, ('text', 'offset'))
+                for i, (bar, value) in enumerate(zip(bars, values)):
+                    text = labels['text'].format(**{**data, **contexts[i], 'value': value,
+                                                    'category': categories[i], 'index': i})
+                    if horizontal:
+                        ax.text(bar.get_width() + labels.get('offset', 0), bar.get_y() + bar.get_height() / 2,
+                                text, **{'va': 'center', **kwargs})
+                    else:
+                        ax.text(bar.get_x() + bar.get_width() / 2, bar.get_height() + labels.get('offset', 0),
+                                text, **{'ha': 'center', 'va': 'bottom', **kwargs})
+
+        if categories is not None:
+            ticks = list(range(len(categories)))
+            if horizontal:
+                ax.set_yticks(ticks)
+                ax.set_yticklabels(categories)
+            else:
+                ax.set_xticks(ticks)
+                ax.set_xticklabels(categories)
+
+    def _draw_barh(self, ax, panel: Dict, data: Dict) -> None:
+        self._draw_bar(ax, panel, data, horizontal=True)
+
+    def _draw_pie(self, ax, panel: Dict, data: Dict) -> None:
+        """파이 차트 (hole 을 주면 가운데를 비운 게이지)"""
+        values = [_lookup(data, value) for value in panel['values']]
+        labels = [label.format(**data) for label in panel['labels']] if 'labels' in panel else None
+        ax.pie(values, labels=labels, colors=self._color(panel.get('colors')),
+               startangle=panel.get('startangle', 90), counterclock=panel.get('counterclock', True),
+               textprops=panel.get('textprops'))
+
+        if panel.get('hole'):
+            ax.add_artist(self.patches.Circle((0, 0), panel['hole'], color='white'))
+        center = panel.get('center_text')
+        if center:
+            ax.text(0, 0, center['text'].format(**data),
+                    **{'ha': 'center', 'va': 'center', **self._text_kwargs(center, ('text',))})
+
+    def _draw_canvas(self, ax, panel: Dict, data: Dict) -> None:
+        """축 없는 자유 배치 패널 (도형/텍스트는 annotations 로 그림)"""
+        ax.set_xlim(panel.get('xlim', [0, 10]))
+        ax.set_ylim(panel.get('ylim', [0, 6]))
+        if panel.get('facecolor'):
+            ax.set_facecolor(self._color(panel['facecolor']))
+        ax.set_xticks([])
+        ax.set_yticks([])
+        for spine in ax.spines.values():
+            spine.set_visible(False)
+
+    def _decorate(self, ax, panel: Dict, data: Dict) -> None:
+        """제목/축 이름/범례/격자와 주석"""
+        for annotation in panel.get('annotations', []):
+            getattr(self, f"_annotate_{annotation['type']}")(ax, annotation, data)
+
+        if panel.get('title'):
+            ax.set_title(panel['title'], fontsize=panel.get('title_size', 14), fontweight='bold')
+        if panel.get('xlabel'):
+            ax.set_xlabel(panel['xlabel'], fontsize=panel.get('label_size'))
+        if panel.get('ylabel'):
+            ax.set_ylabel(panel['ylabel'], fontsize=panel.get('label_size'))
+        if panel.get('xrotation'):
+            ax.tick_params(axis='x', rotation=panel['xrotation'])
+
+        grid = panel.get('grid')
+        if grid:
+            ax.grid(True, alpha=0.3, axis=grid if grid in ('x', 'y') else 'both')
+        if panel.get('legend'):
+            ax.legend(fontsize=panel.get('legend_size'))
+
+    def _annotate_hline(self, ax, annotation: Dict, data: Dict) -> None:
+        ax.axhline(y=_lookup(data, annotation['y']), **self._text_kwargs(annotation, ('type', 'y')))
+
+    def _annotate_vline(self, ax, annotation: Dict, data: Dict) -> None:
+        ax.axvline(x=_lookup(data, annotation['x']), **self._text_kwargs(annotation, ('type', 'x')))
+
+    def _annotate_text(self, ax, annotation: Dict, data: Dict) -> None:
+        ax.text(_lookup(data, annotation['x']), _lookup(data, annotation['y']),
+                annotation['text'].format(**data), **self._text_kwargs(annotation, ('type', 'x', 'y', 'text')))
+
+    def _annotate_box(self, ax, annotation: Dict, data: Dict) -> None:
+        ax.add_patch(self.patches.FancyBboxPatch(
+            annotation['xy'], annotation['width'], annotation['height'],
+            boxstyle=annotation.get('boxstyle', 'round,pad=0.1'),
+            facecolor=self._color(annotation.get('color')), edgecolor='none'))
+
+    def _annotate_rects(self, ax, annotation: Dict, data: Dict) -> None:
+        """x 위치를 중심으로 하는 사각형 막대들 (canvas 패널용)"""
+        heights = _lookup(data, annotation['heights'])
+        colors = self._color(annotation.get('colors') or [annotation.get('color')] * len(heights))
+        width = annotation.get('width', 0.6)
+        for x, height, color in zip(_lookup(data, annotation['x']), heights, colors):
+            ax.add_patch(self.patches.Rectangle((x - width / 2, annotation.get('bottom', 0)), width, height,
+                                                facecolor=color, alpha=annotation.get('alpha', 1.0)))
+
+    def _annotate_point_labels(self, ax, annotation: Dict, data: Dict) -> None:
+        """점마다 텍스트 표시 (x 기본값은 카테고리 위치 0..n-1, 스칼라 y 는 모든 점에 적용)"""
+        values = _lookup(data, annotation.get('values', annotation['y']))
+        ys = _lookup(data, annotation['y'])
+        ys = ys if isinstance(ys, list) else [ys] * len(values)
+        xs = _lookup(data, annotation['x']) if 'x' in annotation else list(range(len(values)))
+        kwargs = self._text_kwargs(annotation, ('type', 'x', 'y', 'dy', 'values', 'text'))
+
+        for i, (x, y, value) in enumerate(zip(xs, ys, values)):
+            text = annotation.get('text', '{value}').format(**{**data, 'value': value, 'index': i})
+            ax.text(x, y + annotation.get('dy', 0), text, **{'ha': 'center', **kwargs})
+
+
+def export_options(spec: Dict, format: Optional[str] = None) -> Dict:
+    """스펙의 내보내기 설정 → export_figure 인자 (format 이 주어지면 스펙의 형식을 덮어씀)"""
+    options = dict(spec.get('export', {}))
+    savefig_kwargs = options.pop('savefig', {})
+    if format:
+        options['format'] = format
+    return {**options, **savefig_kwargs}
+
+
+def _matplotlib_version():
+    """matplotlib 버전 (import 없이 패키지 메타데이터에서 조회)"""
+    from importlib.metadata import version, PackageNotFoundError
+    try:
+        return version('matplotlib')
+    except PackageNotFoundError:
+        return 'unknown'
+
+
+def _engine_fingerprint() -> str:
+    """렌더러/내보내기 코드 해시 (코드가 바뀌면 모든 차트 다시 렌더링)"""
+    digest = hashlib.sha256()
+    for module_file in (__file__, chart_export.__file__):
+        digest.update(Path(module_file).read_bytes())
+    return digest.hexdigest()
+
+
+def spec_cache_key(spec: Dict, format: Optional[str] = None) -> str:
+    """스펙 내용 + 형식 + 렌더러 코드 + matplotlib 버전으로 캐시 키 계산"""
+    payload = {
+        'spec': spec,
+        'format': format,
+        'engine': _engine_fingerprint(),
+        'matplotlib': _matplotlib_version(),
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, ensure_ascii=False).encode()).hexdigest()
+
+
+def _load_render_cache(cache_file: Path) -> dict:
+    if cache_file and cache_file.exists():
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"⚠️ 렌더 캐시 로드 실패: {e}")
+    return {}
+
+
+def _save_render_cache(cache_file: Path, cache: dict):
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(cache_file, 'w', encoding='utf-8') as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+
+
+_worker_renderer = None
+
+
+def _init_worker():
+    """워커 프로세스마다 렌더러(matplotlib import, 폰트, Figure)를 한 번만 준비"""
+    global _worker_renderer
+    _worker_renderer = ChartRenderer()
+
+
+def _render_in_worker(spec: Dict, output_dir: str, format: Optional[str]):
+    start = time.perf_counter()
+    report = _worker_renderer.export(spec, Path(output_dir), format)
+    return spec['name'], report, time.perf_counter() - start
+
+
+def render_specs(specs: List[Dict], output_dir: Path, workers: Optional[int] = None, cache_file: Path = None,
+                 force: bool = False, format: Optional[str] = None):
+    """스펙들을 일괄 렌더링하고 차트별 소요 시간과 내보내기 결과 출력
+
+    workers 가 1이면 현재 프로세스에서 렌더러 하나로 모두 그리고,
+    2 이상이면 프로세스 풀의 워커마다 렌더러를 하나씩 만들어 재사용합니다.
+    workers 를 생략하면 다시 그릴 차트 수와 CPU 수 중 작은 값을 씁니다.
+    cache_file이 주어지면 캐시 키가 바뀐(또는 출력 파일이 없는) 차트만 다시 렌더링합니다.
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    cache = _load_render_cache(cache_file) if cache_file else {}
+    keys = {spec['name']: spec_cache_key(spec, format) for spec in specs}
+
+    pending = []
+    for spec in specs:
+        # 형식이 auto 면 확장자가 렌더링 결과에 따라 정해지므로 캐시에 실제 출력 파일명을 기록
+        entry = cache.get(str(output_dir / spec['output'])) or {}
+        output_path = output_dir / entry.get('output', spec['output'])
+        if not force and entry.get('key') == keys[spec['name']] and output_path.is_file():
+            print(f"⏭️ {output_path.name} (변경 없음, 건너뜀)")
+            continue
+        pending.append(spec)
+
+    if not pending:
+        print("\n✅ 모든 차트가 최신 상태입니다.")
+        return []
+
+    workers = max(1, min(workers or os.cpu_count() or 1, len(pending)))
+    start = time.perf_counter()
+    results = []
+
+    def record(name, report, elapsed):
+        results.append((name, elapsed))
+        cache[str(output_dir / report['path'].stem)] = {'key': keys[name], 'output': report['path'].name}
+        print(f"✓ {chart_export.format_report(report)} ({elapsed:.2f}s)")
+
+    if workers == 1:
+        renderer = ChartRenderer()
+        for spec in pending:
+            chart_start = time.perf_counter()
+            try:
+                report = renderer.export(spec, output_dir, format)
+                record(spec['name'], report, time.perf_counter() - chart_start)
+            except Exception as e:
+                print(f"❌ {spec['name']} 렌더링 실패: {e}")
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+            futures = {executor.submit(_render_in_worker, spec, str(output_dir), format): spec['name']
+                       for spec in pending}
+            for future in as_completed(futures):
+                try:
+                    record(*future.result())
+                except Exception as e:
+                    print(f"❌ {futures[future]} 렌더링 실패: {e}")
+
+    if cache_file:
+        _save_render_cache(cache_file, cache)
+
+    wall = time.perf_counter() - start
+    total = sum(elapsed for _, elapsed in results)
+    print(f"\n⏱️ 전체 {wall:.2f}s (차트별 합계 {total:.2f}s, 워커 {workers}개)")
+    return results
+
+
+def main():
+    """메인 실행 함수"""
+    import argparse
+
+    workspace = os.path.dirname(os.path.abspath(__file__))
+
+    parser = argparse.ArgumentParser(description='YAML/JSON 차트 스펙 일괄 렌더링')
+    parser.add_argument('spec_dir', help='차트 스펙 디렉토리 (예: _charts/aws-ri)')
+    parser.add_argument('--output-dir', '-o', default=None,
+                        help='출력 디렉토리 (기본값: assets/images/<스펙 디렉토리 이름>)')
+    parser.add_argument('--only', nargs='+', help='지정한 이름의 차트만 렌더링')
+    parser.add_argument('--workers', type=int, default=None, help='워커 프로세스 수 (기본값: 차트 수와 CPU 수 중 작은 값)')
+    parser.add_argument('--force', action='store_true', help='렌더 캐시를 무시하고 모두 다시 렌더링')
+    parser.add_argument('--format', choices=chart_export.EXPORT_FORMATS, default=None,
+                        help='모든 차트의 출력 형식 (기본값: 스펙의 export.format)')
+    args = parser.parse_args()
+
+    spec_dir = Path(args.spec_dir)
+    specs = load_spec_dir(spec_dir)
+    if args.only:
+        unknown = set(args.only) - {spec['name'] for spec in specs}
+        if unknown:
+            parser.error(f"알 수 없는 차트입니다: {', '.join(sorted(unknown))}")
+        specs = [spec for spec in specs if spec['name'] in args.only]
+
+    output_dir = Path(args.output_dir or os.path.join(workspace, 'assets', 'images', spec_dir.resolve().name))
+    cache_file = Path(workspace) / '.thumbnail_cache' / 'chart_render_cache.json'
+
+    print(f"Rendering {len(specs)} chart spec(s) from {spec_dir}...")
+    render_specs(specs, output_dir, args.workers, cache_file=cache_file, force=args.force, format=args.format)
+    print(f"\nAll images saved to: {output_dir}")
+
+
+if __name__ == "__main__":
+    main()
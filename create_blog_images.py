@@ -6,56 +6,13 @@
 from PIL import Image, ImageDraw, ImageFont
 import os
 import re
-import requests
 from pathlib import Path
-import io
 
-def download_and_convert_image(url, output_path, size=(1200, 630)):
-    """웹에서 이미지를 다운로드하고 webp로 변환"""
-    try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        
-        response = requests.get(url, headers=headers, timeout=30)
-        response.raise_for_status()
-        
-        # 이미지 열기
-        img = Image.open(io.BytesIO(response.content))
-        
-        # RGB로 변환 (RGBA나 다른 형식일 경우)
-        if img.mode != 'RGB':
-            img = img.convert('RGB')
-        
-        # 크기 조정 (비율 유지하며 크롭)
-        img_ratio = img.width / img.height
-        target_ratio = size[0] / size[1]
-        
-        if img_ratio > target_ratio:
-            # 이미지가 더 넓음 - 높이를 맞추고 좌우 크롭
-            new_height = size[1]
-            new_width = int(new_height * img_ratio)
-            img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-            # 중앙에서 크롭
-            left = (new_width - size[0]) // 2
-            img = img.crop((left, 0, left + size[0], size[1]))
-        else:
-            # 이미지가 더 높음 - 너비를 맞추고 상하 크롭
-            new_width = size[0]
-            new_height = int(new_width / img_ratio)
-            img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-            # 중앙에서 크롭
-            top = (new_height - size[1]) // 2
-            img = img.crop((0, top, size[0], top + size[1]))
-        
-        # WebP로 저장
-        img.save(output_path, 'WEBP', quality=85, optimize=True)
-        print(f"✅ 이미지 다운로드 및 변환 완료: {output_path}")
-        return True
-        
-    except Exception as e:
-        print(f"❌ 이미지 다운로드 실패 ({url}): {e}")
-        return False
+from batch_manifest import Checkpoint, default_checkpoint_path, load_manifest, run_manifest
+from image_pipeline import save_image
+
+
+def create_blog_image(title, categories, output_path, size=(1200, 630)):
     """블로그 포스트용 대표이미지 생성"""
     
     # 색상 팔레트 (카테고리별)
@@ -212,7 +169,7 @@ def download_and_convert_image(url, output_path, size=(1200, 630)):
     draw.text((cat_x, cat_y), category_text, font=category_font, fill=colors['accent'])
     
     # WebP로 저장
-    img.save(output_path, 'WEBP', quality=85, optimize=True)
+    save_image(img, output_path, codec='webp')
     print(f"✅ 이미지 생성 완료: {output_path}")
 
 def extract_post_info(file_path):
@@ -240,44 +197,63 @@ def extract_post_info(file_path):
     
     return title, categories
 
+def render_post_image(entry, posts_dir, images_dir):
+    """매니페스트 항목 하나의 대표이미지 생성"""
+    post_file = entry['post']
+    post_path = posts_dir / post_file
+    if not post_path.exists():
+        print(f"❌ 파일을 찾을 수 없습니다: {post_path}")
+        return False
+    
+    # 포스트 정보 추출 (매니페스트 값이 있으면 우선)
+    title, categories = extract_post_info(post_path)
+    title = entry.get('title') or title
+    categories = entry.get('categories') or categories
+    if not title:
+        print(f"❌ 제목을 추출할 수 없습니다: {post_file}")
+        return False
+    
+    # 출력 파일명 생성
+    image_name = post_file.replace('.md', '.webp')
+    output_path = images_dir / image_name
+    
+    print(f"🎨 이미지 생성 중: {title}")
+    print(f"📂 카테고리: {categories}")
+    
+    # 이미지 생성
+    create_blog_image(title, categories, str(output_path), size=tuple(entry.get('size', (1200, 630))))
+    return True
+
 def main():
-    """최근 포스트들의 대표이미지 생성"""
-    posts_dir = Path("/home/lleague/projects/updaun.github.io/_posts")
-    images_dir = Path("/home/lleague/projects/updaun.github.io/assets/img/posts")
+    """매니페스트에 나열된 포스트들의 대표이미지 생성"""
+    import argparse
+    
+    workspace = os.path.dirname(os.path.abspath(__file__))
+    
+    parser = argparse.ArgumentParser(description='블로그 포스트 대표이미지 생성')
+    parser.add_argument('--manifest', '-m', default=os.path.join(workspace, '_manifests', 'create_blog_images.yml'),
+                        help='포스트/렌더링 설정 매니페스트 (JSONL 또는 YAML)')
+    parser.add_argument('--workspace', '-w', default=workspace, help='작업 공간 경로 (기본값: 스크립트 디렉토리)')
+    parser.add_argument('--workers', type=int, default=4, help='동시에 처리할 포스트 수 (기본값: 4)')
+    parser.add_argument('--checkpoint', help='체크포인트 파일 (기본값: .thumbnail_cache/<매니페스트>.checkpoint.jsonl)')
+    parser.add_argument('--reset', action='store_true', help='체크포인트를 지우고 처음부터 다시 처리')
+    args = parser.parse_args()
+    
+    posts_dir = Path(args.workspace) / "_posts"
+    images_dir = Path(args.workspace) / "assets" / "img" / "posts"
     
     # 이미지 디렉토리 생성
     images_dir.mkdir(parents=True, exist_ok=True)
     
-    # 최근 포스트들 (2025년 7월 이후)
-    recent_posts = [
-        "2025-07-23-aws-sqs-to-stepfunctions-delayed-push-messaging.md",
-        "2025-07-22-firebase-admin-python-messaging-guide.md", 
-        "2025-07-20-yolo-v10-complete-guide.md"
-    ]
-    
-    for post_file in recent_posts:
-        post_path = posts_dir / post_file
-        if not post_path.exists():
-            print(f"❌ 파일을 찾을 수 없습니다: {post_path}")
-            continue
-        
-        # 포스트 정보 추출
-        title, categories = extract_post_info(post_path)
-        if not title:
-            print(f"❌ 제목을 추출할 수 없습니다: {post_file}")
-            continue
-        
-        # 출력 파일명 생성
-        image_name = post_file.replace('.md', '.webp')
-        output_path = images_dir / image_name
-        
-        print(f"🎨 이미지 생성 중: {title}")
-        print(f"📂 카테고리: {categories}")
-        
-        # 이미지 생성
-        create_blog_image(title, categories, str(output_path))
-        
-        print("-" * 50)
+    entries = load_manifest(Path(args.manifest))
+    checkpoint = Checkpoint(Path(args.checkpoint) if args.checkpoint
+                            else default_checkpoint_path(args.workspace, args.manifest))
+    if args.reset:
+        checkpoint.reset()
+    
+    result = run_manifest(entries, lambda entry: render_post_image(entry, posts_dir, images_dir),
+                          checkpoint, workers=args.workers)
+    return 1 if result['failed'] else 0
 
 if __name__ == "__main__":
-    main()
+    exit(main())
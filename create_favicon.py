@@ -2,96 +2,181 @@
 """
 Favicon 생성 스크립트
 사이트의 보라색 테마에 맞는 favicon을 생성합니다.
+
+고해상도 마스터 아이콘을 메모리에서 한 번만 그린 뒤
+모든 PNG/ICO/apple-touch/maskable 크기로 축소해 한 번에 저장하고,
+manifest.json 의 icons 목록을 결과에 맞춰 갱신합니다.
+마스터 해시가 이전 빌드와 같고 출력이 모두 있으면 빌드를 건너뜁니다.
 """
 
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw
+import hashlib
+import json
 import os
+from pathlib import Path
+
+# 사이트 테마 색상
+primary_color = "#8b7ab8"
+light_color = "#b8a9d9"
+dark_color = "#6b5b95"
+background_color = "#ffffff"
+
+MASTER_SIZE = 1024
+
+ICO_SIZES = [16, 32, 48]
+PWA_SIZES = [72, 96, 128, 144, 152, 192, 384, 512]
+MASKABLE_SIZES = [192, 512]
+APPLE_TOUCH_SIZE = 180
+FAVICON_PNG_SIZE = 32
+
+
+def render_master(size=MASTER_SIZE):
+    """마스터 아이콘 렌더링 (투명 배경, 동심원 3개)"""
+    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
+
+    # 원형 배경
+    margin = size // 8
+    draw.ellipse([margin, margin, size - margin, size - margin], fill=primary_color)
+
+    # 내부 원 (밝은 색상)
+    inner_margin = size // 4
+    draw.ellipse([inner_margin, inner_margin, size - inner_margin, size - inner_margin], fill=light_color)
+
+    # 중앙 점
+    center_size = size // 3
+    center_margin = (size - center_size) // 2
+    draw.ellipse([center_margin, center_margin, center_margin + center_size, center_margin + center_size],
+                 fill=dark_color)
+
+    return img
+
+
+def downsample(master, size):
+    """마스터를 목표 크기로 축소"""
+    return master.resize((size, size), Image.Resampling.LANCZOS, reducing_gap=3.0)
+
+
+def flatten(img, color):
+    """투명 아이콘을 단색 배경 위에 합성 (apple-touch/maskable 용)"""
+    background = Image.new('RGBA', img.size, color)
+    background.alpha_composite(img)
+    return background.convert('RGB')
+
+
+def build_icons(master):
+    """마스터에서 모든 출력 이미지를 메모리에서 생성 → {파일명: (이미지, 포맷, 옵션)}"""
+    sizes = sorted(set(ICO_SIZES + PWA_SIZES + MASKABLE_SIZES + [APPLE_TOUCH_SIZE, FAVICON_PNG_SIZE]))
+    scaled = {size: downsample(master, size) for size in sizes}
+
+    outputs = {
+        'favicon.png': (scaled[FAVICON_PNG_SIZE], 'PNG', {'optimize': True}),
+        'favicon.ico': (scaled[max(ICO_SIZES)], 'ICO', {
+            'sizes': [(s, s) for s in ICO_SIZES],
+            'append_images': [scaled[s] for s in ICO_SIZES if s != max(ICO_SIZES)],
+        }),
+        'apple-touch-icon.png': (flatten(scaled[APPLE_TOUCH_SIZE], background_color), 'PNG', {'optimize': True}),
+    }
+    for size in PWA_SIZES:
+        outputs[f'icon-{size}x{size}.png'] = (scaled[size], 'PNG', {'optimize': True})
+    for size in MASKABLE_SIZES:
+        # 바깥 원이 지름 75%라 maskable 안전 영역(80%) 안에 들어가므로 배경만 채움
+        outputs[f'icon-maskable-{size}x{size}.png'] = (flatten(scaled[size], background_color), 'PNG', {'optimize': True})
+
+    return outputs
+
+
+def manifest_icons():
+    """manifest.json icons 항목 생성"""
+    icons = [
+        {
+            "src": f"/assets/img/icon-{size}x{size}.png",
+            "sizes": f"{size}x{size}",
+            "type": "image/png",
+            "purpose": "any"
+        }
+        for size in PWA_SIZES
+    ]
+    icons += [
+        {
+            "src": f"/assets/img/icon-maskable-{size}x{size}.png",
+            "sizes": f"{size}x{size}",
+            "type": "image/png",
+            "purpose": "maskable"
+        }
+        for size in MASKABLE_SIZES
+    ]
+    return icons
+
+
+def update_manifest(manifest_path):
+    """manifest.json 의 icons 목록 갱신 (다른 항목은 유지, 바뀐 경우에만 저장)"""
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+
+    icons = manifest_icons()
+    if manifest.get('icons') == icons:
+        return False
+
+    manifest['icons'] = icons
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+        f.write('\n')
+    return True
+
+
+def create_favicon(workspace=None, force=False):
+    workspace = Path(workspace or os.path.dirname(os.path.abspath(__file__)))
+    output_dir = workspace / "assets" / "img"
+    output_dir.mkdir(parents=True, exist_ok=True)
+    state_file = workspace / ".thumbnail_cache" / "icon_build.json"
+
+    master = render_master()
+
+    # 마스터 픽셀 + 출력 사양으로 빌드 해시 계산
+    digest = hashlib.sha256(master.tobytes())
+    digest.update(json.dumps([ICO_SIZES, PWA_SIZES, MASKABLE_SIZES, APPLE_TOUCH_SIZE,
+                              FAVICON_PNG_SIZE, background_color]).encode())
+    build_hash = digest.hexdigest()
+
+    previous = {}
+    if state_file.exists():
+        with open(state_file, 'r', encoding='utf-8') as f:
+            previous = json.load(f)
+
+    outputs_exist = all((output_dir / name).exists() for name in previous.get('outputs', []))
+    if not force and previous.get('hash') == build_hash and outputs_exist:
+        print("ℹ️ 마스터 아이콘이 바뀌지 않아 빌드를 건너뜁니다 (--force 로 강제 빌드)")
+        return False
+
+    # 모든 출력을 메모리에서 만든 뒤 한 번씩만 저장 (디스크에서 다시 읽지 않음)
+    outputs = build_icons(master)
+    for name, (img, fmt, options) in outputs.items():
+        img.save(output_dir / name, fmt, **options)
+        print(f"Created {name} ({img.width}x{img.height})")
+
+    if update_manifest(workspace / "manifest.json"):
+        print("Updated manifest.json icons")
+
+    state_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(state_file, 'w', encoding='utf-8') as f:
+        json.dump({'hash': build_hash, 'outputs': sorted(outputs)}, f, indent=2)
 
-def create_favicon():
-    # 아이콘 크기들 (다양한 해상도를 위해)
-    sizes = [16, 32, 48, 64, 128, 256]
-    
-    # 사이트 테마 색상
-    primary_color = "#8b7ab8"
-    light_color = "#b8a9d9"
-    dark_color = "#6b5b95"
-    
-    for size in sizes:
-        # 새 이미지 생성 (투명 배경)
-        img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(img)
-        
-        # 원형 배경
-        margin = size // 8
-        circle_coords = [margin, margin, size - margin, size - margin]
-        
-        # 그라디언트 효과를 위한 원형 배경
-        draw.ellipse(circle_coords, fill=primary_color)
-        
-        # 내부 원 (밝은 색상)
-        inner_margin = size // 4
-        inner_coords = [inner_margin, inner_margin, size - inner_margin, size - inner_margin]
-        draw.ellipse(inner_coords, fill=light_color)
-        
-        # 중앙에 "U" 또는 점
-        center_size = size // 3
-        center_margin = (size - center_size) // 2
-        center_coords = [center_margin, center_margin, center_margin + center_size, center_margin + center_size]
-        draw.ellipse(center_coords, fill=dark_color)
-        
-        # 파일 저장
-        filename = f'favicon_{size}x{size}.png'
-        img.save(filename, 'PNG')
-        print(f"Created {filename}")
-    
-    # 기본 favicon.png (32x32)
-    img_32 = Image.open('favicon_32x32.png')
-    img_32.save('favicon.png', 'PNG')
-    print("Created favicon.png (32x32)")
-    
-    # favicon.ico 생성 (여러 크기 포함)
-    images = []
-    for size in [16, 32, 48]:
-        img = Image.open(f'favicon_{size}x{size}.png')
-        images.append(img)
-    
-    images[0].save('favicon.ico', format='ICO', sizes=[(16,16), (32,32), (48,48)])
-    print("Created favicon.ico")
-    
-    # Apple touch icon (180x180)
-    img_180 = Image.new('RGBA', (180, 180), (0, 0, 0, 0))
-    draw_180 = ImageDraw.Draw(img_180)
-    
-    # 큰 원형 배경
-    margin_180 = 10
-    circle_coords_180 = [margin_180, margin_180, 170, 170]
-    draw_180.ellipse(circle_coords_180, fill=primary_color)
-    
-    # 내부 원
-    inner_margin_180 = 40
-    inner_coords_180 = [inner_margin_180, inner_margin_180, 140, 140]
-    draw_180.ellipse(inner_coords_180, fill=light_color)
-    
-    # 중앙 원
-    center_margin_180 = 70
-    center_coords_180 = [center_margin_180, center_margin_180, 110, 110]
-    draw_180.ellipse(center_coords_180, fill=dark_color)
-    
-    img_180.save('apple-touch-icon.png', 'PNG')
-    print("Created apple-touch-icon.png")
-    
-    # 임시 파일들 정리
-    for size in sizes:
-        try:
-            os.remove(f'favicon_{size}x{size}.png')
-        except:
-            pass
-    
     print("\nFavicon 생성 완료!")
     print("생성된 파일들:")
     print("- favicon.png (32x32)")
     print("- favicon.ico (멀티 사이즈)")
     print("- apple-touch-icon.png (180x180)")
+    print(f"- icon-*.png (PWA {len(PWA_SIZES)}종, maskable {len(MASKABLE_SIZES)}종)")
+    return True
+
 
 if __name__ == "__main__":
-    create_favicon()
+    import argparse
+
+    parser = argparse.ArgumentParser(description='favicon/PWA 아이콘 생성')
+    parser.add_argument('--force', action='store_true', help='마스터 해시와 관계없이 다시 빌드')
+    parser.add_argument('--workspace', '-w', default=None, help='작업 공간 경로 (기본값: 스크립트 디렉토리)')
+    args = parser.parse_args()
+
+    create_favicon(args.workspace, force=args.force)
@@ -121,9 +121,9 @@ output_dir = Path('/home/lleague/projects/updaun.github.io/assets/images/aws-ri'
 output_dir.mkdir(parents=True, exist_ok=True)
 
 img = create_post_hero_image()
-img.save(output_dir / 'post-hero.png', 'PNG', quality=95)
+img.save(output_dir / 'post-hero.png', 'PNG', optimize=True)
 print("✓ Post hero image created: post-hero.png")
 
 # 블로그 메인 이미지도 생성 (1200x630 OG 이미지 형식)
-img.save('/home/lleague/projects/updaun.github.io/assets/img/2025-07-28-aws-reserved-instances-strategy-best-practices.png', 'PNG', quality=95)
+img.save('/home/lleague/projects/updaun.github.io/assets/img/2025-07-28-aws-reserved-instances-strategy-best-practices.png', 'PNG', optimize=True)
 print("✓ Blog thumbnail created: 2025-07-28-aws-reserved-instances-strategy-best-practices.png")
@@ -215,11 +215,11 @@ def main():
     img = add_text_overlay(img)
     
     # 이미지 저장
-    img.save(output_dir / 'post-hero-web.png', 'PNG', quality=95)
+    img.save(output_dir / 'post-hero-web.png', 'PNG', optimize=True)
     print("✓ Post hero image created: post-hero-web.png")
     
     # 블로그 메인 이미지도 생성
-    img.save('/home/lleague/projects/updaun.github.io/assets/img/2025-07-28-aws-reserved-instances-strategy-best-practices.png', 'PNG', quality=95)
+    img.save('/home/lleague/projects/updaun.github.io/assets/img/2025-07-28-aws-reserved-instances-strategy-best-practices.png', 'PNG', optimize=True)
     print("✓ Blog thumbnail created: 2025-07-28-aws-reserved-instances-strategy-best-practices.png")
 
 if __name__ == "__main__":
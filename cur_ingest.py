@@ -0,0 +1,460 @@
+#!/usr/bin/env python3
+"""
+AWS Cost and Usage Report(CUR) 스트리밍 집계
+
+CUR CSV(.csv, .csv.gz)/Parquet 파일을 청크 단위로 읽어 pandas group-by 로 누적 집계하고,
+차트 스펙(_charts/)이 data_file 로 읽는 작은 JSON 파일을 씁니다.
+청크 하나와 누적 집계(월 x 서비스 수준의 작은 Series)만 메모리에 있으므로
+수 GB 내보내기도 --memory-mb 로 정한 상한 안에서 처리됩니다.
+(Parquet 은 row group 단위로 읽히므로 row group 하나의 크기가 하한이 됩니다.)
+
+CUR 1.0(lineItem/UnblendedCost)과 CUR 2.0(line_item_unblended_cost) 열 이름을 모두 지원합니다.
+
+출력 키는 _charts/aws-ri 스펙의 data 이름과 맞춰져 있어
+스펙에 `data_file: ../data/cur_aggregates.json` 을 추가하고 리터럴 값을 지우면 실제 청구 데이터로 그려집니다.
+cost-explorer 스펙은 이미 이 파일을 읽습니다 (저장소의 파일은 기존 예시 수치이며, 기본 출력 경로로
+집계하면 덮어써집니다):
+    months, ondemand_cost, ri_cost        월별 RI 미적용 환산 비용 / 실제 비용 (cost-explorer)
+    monthly_util, utilization             월별/전체 RI 활용률 % (ri-utilization)
+    instance_types, utilization_rates     인스턴스 타입별 RI 활용률 %
+    monthly_coverage, coverage            월별 / 환경 태그별 RI 커버리지 %
+    services, service_totals              서비스별 월 비용 / 합계
+
+사용법:
+    python cur_ingest.py exports/*.csv.gz --env-tag Environment
+    python cur_ingest.py exports/cur.parquet -o _charts/data/cur_aggregates.json --memory-mb 256
+    python cur_ingest.py --make-synthetic /tmp/cur.csv --rows 2000000
+"""
+
+import os
+import json
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+# 표준 열 이름 → (CUR 1.0, CUR 2.0)
+CUR_COLUMNS = {
+    'usage_start': ('lineItem/UsageStartDate', 'line_item_usage_start_date'),
+    'line_item_type': ('lineItem/LineItemType', 'line_item_line_item_type'),
+    'service': ('lineItem/ProductCode', 'line_item_product_code'),
+    'usage_type': ('lineItem/UsageType', 'line_item_usage_type'),
+    'usage_amount': ('lineItem/UsageAmount', 'line_item_usage_amount'),
+    'unblended_cost': ('lineItem/UnblendedCost', 'line_item_unblended_cost'),
+    'public_cost': ('pricing/publicOnDemandCost', 'pricing_public_on_demand_cost'),
+    'instance_type': ('product/instanceType', 'product_instance_type'),
+    'ri_effective_cost': ('reservation/EffectiveCost', 'reservation_effective_cost'),
+    'ri_unused_quantity': ('reservation/UnusedQuantity', 'reservation_unused_quantity'),
+    'ri_unused_recurring_fee': ('reservation/UnusedRecurringFee', 'reservation_unused_recurring_fee'),
+    'ri_unused_upfront_fee': ('reservation/UnusedAmortizedUpfrontFeeForBillingPeriod',
+                              'reservation_unused_amortized_upfront_fee_for_billing_period'),
+}
+REQUIRED_COLUMNS = ('usage_start', 'line_item_type', 'service', 'unblended_cost')
+NUMERIC_COLUMNS = ('usage_amount', 'unblended_cost', 'public_cost', 'ri_effective_cost', 'ri_unused_quantity',
+                   'ri_unused_recurring_fee', 'ri_unused_upfront_fee')
+
+# RI 적용 대상 사용량 (EC2 BoxUsage, RDS InstanceUsage, ElastiCache NodeUsage)
+RI_ELIGIBLE_USAGE = r'BoxUsage|InstanceUsage|NodeUsage'
+
+DEFAULT_OUTPUT = Path('_charts') / 'data' / 'cur_aggregates.json'
+DEFAULT_MEMORY_MB = 256
+SAMPLE_ROWS = 10_000
+MIN_CHUNK_ROWS = 10_000
+MAX_CHUNK_ROWS = 2_000_000
+# 샘플 DataFrame 메모리 대비 청크 파싱/group-by 중 실제 최대 사용량 배수 (합성 CUR 측정치 약 6배)
+CHUNK_OVERHEAD = 10
+TOP_SERVICES = 8
+TOP_INSTANCE_TYPES = 8
+
+
+def _tag_columns(tag: str) -> tuple:
+    return (f'resourceTags/user:{tag}', f'resource_tags_user_{tag.lower()}')
+
+
+def resolve_columns(header: List[str], env_tag: Optional[str] = None) -> Dict[str, str]:
+    """파일 헤더에서 표준 이름 → 실제 열 이름 매핑 (필수 열이 없으면 ValueError)"""
+    present = set(header)
+    candidates = dict(CUR_COLUMNS)
+    if env_tag:
+        candidates['env'] = _tag_columns(env_tag)
+
+    mapping = {}
+    for name, aliases in candidates.items():
+        for alias in aliases:
+            if alias in present:
+                mapping[name] = alias
+                break
+
+    missing = [name for name in REQUIRED_COLUMNS if name not in mapping]
+    if missing:
+        raise ValueError(f"CUR 필수 열이 없습니다: {', '.join(CUR_COLUMNS[name][0] for name in missing)}")
+    if env_tag and 'env' not in mapping:
+        print(f"⚠️ 태그 열이 없습니다: {_tag_columns(env_tag)[0]} (환경별 커버리지 생략)")
+    return mapping
+
+
+def _is_parquet(path: Path) -> bool:
+    return path.suffix == '.parquet'
+
+
+def read_header(path: Path) -> List[str]:
+    """데이터를 읽지 않고 열 이름만 조회"""
+    if _is_parquet(path):
+        import pyarrow.parquet as pq
+        return pq.ParquetFile(path).schema_arrow.names
+
+    import pandas as pd
+    return list(pd.read_csv(path, nrows=0).columns)
+
+
+def _csv_dtypes(mapping: Dict[str, str]) -> Dict[str, str]:
+    """숫자 열은 float64, 나머지는 category (반복 문자열 메모리 절약)"""
+    return {column: ('float64' if name in NUMERIC_COLUMNS else 'category')
+            for name, column in mapping.items() if name != 'usage_start'}
+
+
+def estimate_chunk_rows(path: Path, mapping: Dict[str, str], memory_mb: int) -> int:
+    """앞부분 샘플의 행당 메모리로 메모리 예산에 맞는 청크 행 수 계산"""
+    import pandas as pd
+
+    if _is_parquet(path):
+        import pyarrow.parquet as pq
+        batch = next(pq.ParquetFile(path).iter_batches(batch_size=SAMPLE_ROWS, columns=list(mapping.values())), None)
+        sample = batch.to_pandas() if batch is not None else pd.DataFrame()
+    else:
+        sample = pd.read_csv(path, usecols=list(mapping.values()), dtype=_csv_dtypes(mapping), nrows=SAMPLE_ROWS)
+
+    if sample.empty:
+        return MIN_CHUNK_ROWS
+    bytes_per_row = sample.memory_usage(deep=True).sum() / len(sample)
+    rows = int(memory_mb * 1024 * 1024 / (bytes_per_row * CHUNK_OVERHEAD))
+    return max(MIN_CHUNK_ROWS, min(MAX_CHUNK_ROWS, rows))
+
+
+def iter_chunks(path: Path, mapping: Dict[str, str], chunk_rows: int) -> Iterator:
+    """필요한 열만 청크 단위로 읽어 표준 열 이름의 DataFrame 으로 반환"""
+    rename = {column: name for name, column in mapping.items()}
+
+    if _is_parquet(path):
+        import pyarrow.parquet as pq
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_rows, columns=list(mapping.values())):
+            yield batch.to_pandas().rename(columns=rename)
+        return
+
+    import pandas as pd
+    reader = pd.read_csv(path, usecols=list(mapping.values()), dtype=_csv_dtypes(mapping), chunksize=chunk_rows)
+    with reader:
+        for chunk in reader:
+            yield chunk.rename(columns=rename)
+
+
+def _text(chunk, name: str, missing: str = ''):
+    """category 문자열 열 (없거나 빈 값은 missing)
+
+    CSV 의 빈 칸은 NaN 으로 읽히므로 채워서 비교합니다. 행마다 문자열을 만들지 않고
+    category 를 유지해 비교/.str 연산이 고유값 수만큼만 일어나게 합니다.
+    """
+    import pandas as pd
+
+    if name not in chunk:
+        return pd.Series(missing, index=chunk.index, dtype='category')
+    column = chunk[name]
+    if not isinstance(column.dtype, pd.CategoricalDtype):
+        column = column.astype('string').astype('category')
+    if missing not in column.cat.categories:
+        column = column.cat.add_categories([missing])
+    return column.fillna(missing)
+
+
+def _month(chunk):
+    """사용 시작 시각 → YYYY-MM (Parquet 은 timestamp, CSV 는 ISO 8601 문자열)"""
+    import pandas as pd
+
+    column = chunk['usage_start']
+    if pd.api.types.is_datetime64_any_dtype(column):
+        return column.dt.strftime('%Y-%m').astype('category')
+    # ISO 8601 문자열의 앞 7자리 - 날짜 파싱보다 훨씬 빠름 (category 라 고유값만 자름)
+    import numpy as np
+
+    column = _text(chunk, 'usage_start')
+    months, codes = np.unique(np.asarray(column.cat.categories.str.slice(0, 7)), return_inverse=True)
+    return pd.Series(pd.Categorical.from_codes(codes[column.cat.codes], months), index=chunk.index)
+
+
+class CurAggregator:
+    """청크별 group-by 결과를 작은 Series 로 누적"""
+
+    def __init__(self):
+        self.totals = {}
+        self.rows = 0
+
+    def _add(self, name: str, series) -> None:
+        import pandas as pd
+
+        if series.empty:
+            return
+        # 청크마다 category 가 달라도 정렬되도록 인덱스를 일반 문자열로
+        if isinstance(series.index, pd.MultiIndex):
+            series.index = pd.MultiIndex.from_arrays(
+                [series.index.get_level_values(i).astype(str) for i in range(series.index.nlevels)])
+        else:
+            series.index = series.index.astype(str)
+        current = self.totals.get(name)
+        self.totals[name] = series if current is None else current.add(series, fill_value=0)
+
+    def add_chunk(self, chunk) -> None:
+        """청크 하나 집계"""
+        import pandas as pd
+
+        self.rows += len(chunk)
+        for name in NUMERIC_COLUMNS:
+            if name not in chunk:
+                chunk[name] = 0.0
+            elif chunk[name].dtype != 'float64':
+                # Parquet decimal/문자열 열만 변환 (CSV 는 읽을 때 float64)
+                chunk[name] = pd.to_numeric(chunk[name], errors='coerce')
+            chunk[name] = chunk[name].fillna(0.0)
+
+        chunk['month'] = _month(chunk)
+        chunk['service'] = _text(chunk, 'service')
+        line_type = _text(chunk, 'line_item_type')
+        usage_type = _text(chunk, 'usage_type')
+        has_env = 'env' in chunk
+        if has_env:
+            chunk['env'] = _text(chunk, 'env', missing='(untagged)')
+
+        self._add('service_cost', chunk.groupby(['month', 'service'], observed=True)['unblended_cost'].sum())
+
+        usage_types = usage_type.cat.categories
+        eligible = usage_type.isin(usage_types[usage_types.str.contains(RI_ELIGIBLE_USAGE, regex=True)])
+        on_demand = chunk[(line_type == 'Usage') & eligible]
+        covered = chunk[line_type == 'DiscountedUsage']
+
+        self._add('ondemand_hours', on_demand.groupby('month', observed=True)['usage_amount'].sum())
+        self._add('ondemand_public', on_demand.groupby('month', observed=True)['public_cost'].sum())
+        self._add('ondemand_unblended', on_demand.groupby('month', observed=True)['unblended_cost'].sum())
+        self._add('covered_hours', covered.groupby('month', observed=True)['usage_amount'].sum())
+        self._add('covered_public', covered.groupby('month', observed=True)['public_cost'].sum())
+        self._add('covered_effective', covered.groupby('month', observed=True)['ri_effective_cost'].sum())
+        if has_env:
+            self._add('env_ondemand_hours', on_demand.groupby('env', observed=True)['usage_amount'].sum())
+            self._add('env_covered_hours', covered.groupby('env', observed=True)['usage_amount'].sum())
+
+        # RIFee: 사용량 = 청구 기간의 예약 시간, UnusedQuantity = 쓰지 않은 시간
+        fee_mask = line_type == 'RIFee'
+        fees = chunk[fee_mask].copy()
+        if not fees.empty:
+            # RIFee 는 행이 적으므로 일반 문자열로 처리 (instanceType 이 비면 UsageType 의 접미사)
+            fee_type = _text(fees, 'instance_type').astype(str)
+            fees['ri_type'] = fee_type.where(fee_type != '', usage_type[fee_mask].astype(str).str.split(':').str[-1])
+            fees['unused_fee'] = fees['ri_unused_recurring_fee'] + fees['ri_unused_upfront_fee']
+            self._add('reserved_hours', fees.groupby('month', observed=True)['usage_amount'].sum())
+            self._add('unused_hours', fees.groupby('month', observed=True)['ri_unused_quantity'].sum())
+            self._add('unused_fee', fees.groupby('month', observed=True)['unused_fee'].sum())
+            self._add('type_reserved_hours', fees.groupby('ri_type')['usage_amount'].sum())
+            self._add('type_unused_hours', fees.groupby('ri_type')['ri_unused_quantity'].sum())
+
+    def _series(self, name: str):
+        import pandas as pd
+        return self.totals.get(name, pd.Series(dtype='float64'))
+
+    def result(self) -> Dict:
+        """누적 집계 → 차트용 딕셔너리"""
+        import numpy as np
+
+        service_cost = self._series('service_cost')
+        months = sorted(service_cost.index.get_level_values(0).unique()) if not service_cost.empty else []
+
+        def monthly(name):
+            return self._series(name).reindex(months, fill_value=0.0)
+
+        def percent(numerator, denominator):
+            with np.errstate(divide='ignore', invalid='ignore'):
+                values = np.where(denominator > 0, numerator / denominator * 100, 0.0)
+            return [round(float(v), 1) for v in values]
+
+        ondemand_hours = monthly('ondemand_hours').to_numpy()
+        covered_hours = monthly('covered_hours').to_numpy()
+        reserved = monthly('reserved_hours').to_numpy()
+        unused = monthly('unused_hours').to_numpy()
+
+        ondemand_cost = monthly('ondemand_public') + monthly('covered_public')
+        ri_cost = monthly('ondemand_unblended') + monthly('covered_effective') + monthly('unused_fee')
+
+        type_reserved = self._series('type_reserved_hours').sort_values(ascending=False).head(TOP_INSTANCE_TYPES)
+        type_unused = self._series('type_unused_hours').reindex(type_reserved.index, fill_value=0.0)
+
+        by_service = service_cost.unstack(fill_value=0.0).reindex(months, fill_value=0.0) if months else None
+        service_totals = by_service.sum().sort_values(ascending=False) if by_service is not None else None
+        services = {}
+        if service_totals is not None:
+            top = list(service_totals.index[:TOP_SERVICES])
+            services = {name: [round(float(v), 2) for v in by_service[name]] for name in top}
+            rest = [name for name in service_totals.index if name not in top]
+            if rest:
+                services['Other'] = [round(float(v), 2) for v in by_service[rest].sum(axis=1)]
+
+        result = {
+            'rows': self.rows,
+            'months': months,
+            'ondemand_cost': [round(float(v), 2) for v in ondemand_cost],
+            'ri_cost': [round(float(v), 2) for v in ri_cost],
+            'monthly_util': percent(reserved - unused, reserved),
+            'utilization': percent(np.array([reserved.sum() - unused.sum()]), np.array([reserved.sum()]))[0],
+            'instance_types': list(type_reserved.index),
+            'utilization_rates': percent((type_reserved - type_unused).to_numpy(), type_reserved.to_numpy()),
+            'monthly_coverage': percent(covered_hours, covered_hours + ondemand_hours),
+            'services': services,
+            'service_totals': ({name: round(float(v), 2) for name, v in service_totals.items()}
+                               if service_totals is not None else {}),
+        }
+
+        if 'env_covered_hours' in self.totals or 'env_ondemand_hours' in self.totals:
+            env_covered = self._series('env_covered_hours')
+            env_ondemand = self._series('env_ondemand_hours')
+            envs = sorted(set(env_covered.index) | set(env_ondemand.index))
+            env_covered = env_covered.reindex(envs, fill_value=0.0).to_numpy()
+            env_ondemand = env_ondemand.reindex(envs, fill_value=0.0).to_numpy()
+            result['coverage'] = dict(zip(envs, percent(env_covered, env_covered + env_ondemand)))
+
+        return result
+
+
+def _peak_rss_mb() -> Optional[float]:
+    """프로세스 최대 RSS (MB, 지원하지 않는 플랫폼에서는 None)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    import sys
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def ingest(paths: List[Path], memory_mb: int = DEFAULT_MEMORY_MB, env_tag: Optional[str] = None,
+           chunk_rows: Optional[int] = None) -> Dict:
+    """CUR 파일들을 차례로 스트리밍 집계"""
+    aggregator = CurAggregator()
+
+    for path in paths:
+        path = Path(path)
+        mapping = resolve_columns(read_header(path), env_tag)
+        rows = chunk_rows or estimate_chunk_rows(path, mapping, memory_mb)
+        print(f"📥 {path.name}: {rows:,}행 단위 청크")
+
+        start = time.perf_counter()
+        before = aggregator.rows
+        for chunk in iter_chunks(path, mapping, rows):
+            aggregator.add_chunk(chunk)
+        elapsed = time.perf_counter() - start
+        processed = aggregator.rows - before
+        print(f"   {processed:,}행 처리 ({elapsed:.1f}s, {processed / max(elapsed, 1e-9):,.0f}행/s)")
+
+    result = aggregator.result()
+    result['sources'] = [Path(path).name for path in paths]
+    return result
+
+
+def write_synthetic_cur(path: Path, rows: int = 100_000, months: int = 12, seed: int = 0,
+                        chunk_rows: int = 100_000) -> None:
+    """테스트용 합성 CUR 1.0 CSV 생성 (청크 단위로 써서 큰 파일도 메모리 일정)"""
+    import numpy as np
+    import pandas as pd
+
+    rng = np.random.default_rng(seed)
+    services = np.array(['AmazonEC2', 'AmazonRDS', 'AmazonS3', 'AWSLambda', 'AmazonCloudFront'])
+    instance_types = np.array(['m5.large', 'm5.xlarge', 'c5.large', 'r5.large', 't3.medium'])
+    line_types = np.array(['Usage', 'DiscountedUsage', 'RIFee'])
+    envs = np.array(['Production', 'Staging', 'Development'])
+    hourly = {'m5.large': 0.096, 'm5.xlarge': 0.192, 'c5.large': 0.085, 'r5.large': 0.126, 't3.medium': 0.0416}
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    written = 0
+    header = True
+    while written < rows:
+        n = min(chunk_rows, rows - written)
+        month = rng.integers(1, months + 1, n)
+        start = [f"{2024 + (m - 1) // 12}-{(m - 1) % 12 + 1:02d}-01T00:00:00Z" for m in month]
+        line_type = rng.choice(line_types, n, p=[0.6, 0.398, 0.002])
+        instance = rng.choice(instance_types, n)
+        price = np.vectorize(hourly.get)(instance)
+        service = np.where(line_type == 'Usage', rng.choice(services, n, p=[0.5, 0.2, 0.15, 0.1, 0.05]), 'AmazonEC2')
+        is_instance = np.isin(service, ['AmazonEC2', 'AmazonRDS']) | (line_type != 'Usage')
+        hours = np.round(rng.uniform(1, 24, n), 2)
+        reserved = np.where(line_type == 'RIFee', 744.0, hours)
+        unused = np.where(line_type == 'RIFee', np.round(744 * rng.uniform(0, 0.25, n), 2), 0.0)
+        public = np.round(reserved * price, 4)
+        unblended = np.where(line_type == 'Usage', public, np.where(line_type == 'RIFee', public * 0.6, 0.0))
+
+        frame = pd.DataFrame({
+            'lineItem/UsageStartDate': start,
+            'lineItem/LineItemType': line_type,
+            'lineItem/ProductCode': service,
+            'lineItem/UsageType': np.where(
+                line_type == 'RIFee', np.char.add('HeavyUsage:', instance),
+                np.where(is_instance, np.char.add('BoxUsage:', instance), 'Requests-Tier1')),
+            'lineItem/UsageAmount': reserved,
+            'lineItem/UnblendedCost': unblended,
+            'pricing/publicOnDemandCost': np.where(line_type == 'RIFee', 0.0, public),
+            'product/instanceType': np.where(is_instance & (line_type != 'RIFee'), instance, ''),
+            'reservation/EffectiveCost': np.where(line_type == 'DiscountedUsage', np.round(public * 0.6, 4), 0.0),
+            'reservation/UnusedQuantity': unused,
+            'reservation/UnusedRecurringFee': np.round(unused * price * 0.6, 4),
+            'reservation/UnusedAmortizedUpfrontFeeForBillingPeriod': 0.0,
+            'resourceTags/user:Environment': rng.choice(envs, n, p=[0.6, 0.25, 0.15]),
+        })
+        frame.to_csv(path, mode='w' if header else 'a', header=header, index=False)
+        header = False
+        written += n
+
+    print(f"🧪 합성 CUR {rows:,}행 생성: {path} ({path.stat().st_size / 1024 / 1024:.1f} MB)")
+
+
+def main():
+    """메인 실행 함수"""
+    import argparse
+
+    workspace = os.path.dirname(os.path.abspath(__file__))
+
+    parser = argparse.ArgumentParser(description='AWS CUR 스트리밍 집계 (차트용 JSON 생성)')
+    parser.add_argument('inputs', nargs='*', help='CUR CSV(.csv, .csv.gz) 또는 Parquet 파일')
+    parser.add_argument('--output', '-o', default=os.path.join(workspace, DEFAULT_OUTPUT),
+                        help='집계 JSON 경로 (기본값: _charts/data/cur_aggregates.json)')
+    parser.add_argument('--memory-mb', type=int, default=DEFAULT_MEMORY_MB,
+                        help=f'메모리 상한 (MB, 청크 크기 계산에 사용, 기본값: {DEFAULT_MEMORY_MB})')
+    parser.add_argument('--chunk-rows', type=int, default=None, help='청크 행 수 직접 지정 (기본값: --memory-mb 로 계산)')
+    parser.add_argument('--env-tag', default=None, help='환경별 커버리지에 쓸 리소스 태그 이름 (예: Environment)')
+    parser.add_argument('--make-synthetic', metavar='PATH', default=None, help='합성 CUR CSV 를 생성하고 종료')
+    parser.add_argument('--rows', type=int, default=100_000, help='--make-synthetic 행 수 (기본값: 100000)')
+    args = parser.parse_args()
+
+    if args.make_synthetic:
+        write_synthetic_cur(Path(args.make_synthetic), rows=args.rows)
+        return 0
+
+    if not args.inputs:
+        parser.error('CUR 파일을 하나 이상 지정하세요')
+
+    import pandas  # noqa: F401 - 라이브러리 로드분을 기준선에서 제외
+    if any(Path(p).suffix == '.parquet' for p in args.inputs):
+        import pyarrow.parquet  # noqa: F401
+    baseline = _peak_rss_mb()
+    result = ingest([Path(p) for p in args.inputs], memory_mb=args.memory_mb, env_tag=args.env_tag,
+                    chunk_rows=args.chunk_rows)
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+        f.write('\n')
+
+    peak = _peak_rss_mb()
+    print(f"\n✅ {result['rows']:,}행 → {output} ({output.stat().st_size / 1024:.1f} KB, "
+          f"{len(result['months'])}개월, 전체 RI 활용률 {result['utilization']}%)")
+    if peak is not None:
+        print(f"   최대 RSS {peak:.0f} MB (라이브러리 로드 후 {baseline:.0f} MB 대비 +{peak - baseline:.0f} MB, 상한 {args.memory_mb} MB)")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -3,59 +3,18 @@
 블로그 포스트 대표이미지 다운로드 및 변환기
 """
 
-from PIL import Image
 import os
 import re
-import requests
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-import io
 
-def download_and_convert_image(url, output_path, size=(1200, 630)):
-    """웹에서 이미지를 다운로드하고 webp로 변환"""
-    try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        
-        response = requests.get(url, headers=headers, timeout=30)
-        response.raise_for_status()
-        
-        # 이미지 열기
-        img = Image.open(io.BytesIO(response.content))
-        
-        # RGB로 변환 (RGBA나 다른 형식일 경우)
-        if img.mode != 'RGB':
-            img = img.convert('RGB')
-        
-        # 크기 조정 (비율 유지하며 크롭)
-        img_ratio = img.width / img.height
-        target_ratio = size[0] / size[1]
-        
-        if img_ratio > target_ratio:
-            # 이미지가 더 넓음 - 높이를 맞추고 좌우 크롭
-            new_height = size[1]
-            new_width = int(new_height * img_ratio)
-            img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-            # 중앙에서 크롭
-            left = (new_width - size[0]) // 2
-            img = img.crop((left, 0, left + size[0], size[1]))
-        else:
-            # 이미지가 더 높음 - 너비를 맞추고 상하 크롭
-            new_width = size[0]
-            new_height = int(new_width / img_ratio)
-            img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-            # 중앙에서 크롭
-            top = (new_height - size[1]) // 2
-            img = img.crop((0, top, size[0], top + size[1]))
-        
-        # WebP로 저장
-        img.save(output_path, 'WEBP', quality=85, optimize=True)
-        print(f"✅ 이미지 다운로드 및 변환 완료: {output_path}")
-        return True
-        
-    except Exception as e:
-        print(f"❌ 이미지 다운로드 실패 ({url}): {e}")
-        return False
+import image_pipeline
+from batch_manifest import Checkpoint, default_checkpoint_path, load_manifest, run_manifest
+from image_pipeline import download_and_convert_image
+
+RACE_CONNECT_TIMEOUT = 10  # 후보 연결 대기 상한 (느린 후보가 스레드를 오래 붙잡지 않도록)
+
 
 def extract_post_info(file_path):
     """포스트 파일에서 제목과 카테고리 추출"""
@@ -82,61 +41,156 @@ def extract_post_info(file_path):
     
     return title, categories
 
-def main():
-    """최근 포스트들의 대표이미지 다운로드 및 변환"""
-    posts_dir = Path("/home/lleague/projects/updaun.github.io/_posts")
-    images_dir = Path("/home/lleague/projects/updaun.github.io/assets/img/posts")
+def _fetch_and_decode(url, size, timeout, cancel_event, on_response=None):
+    """후보 URL 하나를 받아 목표 크기로 디코딩 (취소 이벤트 확인)"""
+    with image_pipeline.fetch_stream(url, timeout=timeout, cancel_event=cancel_event,
+                                     on_response=on_response) as stream:
+        img = image_pipeline.process_image(image_pipeline.open_image(stream), size)
+    if cancel_event.is_set():
+        raise image_pipeline.DownloadCancelled(url)
+    return img
+
+def race_candidate_urls(image_urls, output_path, size=(1200, 630), timeout=30, executor=None):
+    """모든 후보 URL을 동시에 요청해 가장 먼저 디코딩에 성공한 이미지를 저장
+
+    승자가 정해지면 나머지 후보는 취소 이벤트를 설정하고 받는 중인 응답의 연결을 끊어
+    읽기에서 기다리던 스레드까지 바로 끝냅니다 (연결 중인 후보는 RACE_CONNECT_TIMEOUT 까지).
+    executor 를 넘기면 배치 전체가 한 스레드 풀을 공유하고, 호출자가 배치 끝에 한 번 종료합니다.
+    """
+    own_executor = executor is None
+    if own_executor:
+        executor = ThreadPoolExecutor(max_workers=len(image_urls))
     
-    # 이미지 디렉토리 생성
-    images_dir.mkdir(parents=True, exist_ok=True)
+    cancel_event = threading.Event()
+    responses = []
+    responses_lock = threading.Lock()
+    
+    def track(response):
+        with responses_lock:
+            if not cancel_event.is_set():
+                responses.append(response)
+                return
+        image_pipeline.abort_response(response)
     
-    # 최근 포스트들과 해당 이미지 URL들
-    posts_images = {
-        "2025-07-23-aws-sqs-to-stepfunctions-delayed-push-messaging.md": [
-            "https://images.unsplash.com/photo-1558494949-ef010cbdcc31?w=1200&h=630&fit=crop&crop=center",
-            "https://images.unsplash.com/photo-1451187580459-43490279c0fa?w=1200&h=630&fit=crop&crop=center"
-        ],
-        "2025-07-22-firebase-admin-python-messaging-guide.md": [
-            "https://images.unsplash.com/photo-1556075798-4825dfaaf498?w=1200&h=630&fit=crop&crop=center",
-            "https://images.unsplash.com/photo-1563206767-5b18f218e8de?w=1200&h=630&fit=crop&crop=center"
-        ],
-        "2025-07-20-yolo-v10-complete-guide.md": [
-            "https://images.unsplash.com/photo-1555255707-c07966088b7b?w=1200&h=630&fit=crop&crop=center",
-            "https://images.unsplash.com/photo-1507003211169-0a1dd7228f2d?w=1200&h=630&fit=crop&crop=center"
-        ]
+    request_timeout = (min(timeout, RACE_CONNECT_TIMEOUT), timeout)
+    futures = {
+        executor.submit(_fetch_and_decode, url, size, request_timeout, cancel_event, track): url
+        for url in image_urls
     }
     
-    for post_file, image_urls in posts_images.items():
-        post_path = posts_dir / post_file
-        if not post_path.exists():
-            print(f"❌ 파일을 찾을 수 없습니다: {post_path}")
-            continue
-        
-        # 포스트 정보 추출
-        title, categories = extract_post_info(post_path)
-        if not title:
-            print(f"❌ 제목을 추출할 수 없습니다: {post_file}")
-            continue
-        
-        # 출력 파일명 생성
-        image_name = post_file.replace('.md', '.webp')
-        output_path = images_dir / image_name
-        
-        print(f"🎨 이미지 다운로드 중: {title}")
-        print(f"📂 카테고리: {categories}")
-        
-        # 이미지 다운로드 시도
+    winner = None
+    try:
+        for future in as_completed(futures):
+            url = futures[future]
+            try:
+                winner = (url, future.result())
+                break
+            except image_pipeline.DownloadCancelled:
+                continue
+            except Exception as e:
+                print(f"❌ 이미지 다운로드 실패 ({url}): {e}")
+    finally:
+        # 아직 시작하지 않은 후보는 실행하지 않고, 받는 중인 후보는 연결을 끊어 바로 끝냄
+        cancel_event.set()
+        for future in futures:
+            future.cancel()
+        with responses_lock:
+            for response in responses:
+                image_pipeline.abort_response(response)
+        if own_executor:
+            executor.shutdown(wait=True)
+    
+    if winner is None:
+        return False
+    
+    url, img = winner
+    image_pipeline.save_image(img, output_path)
+    print(f"✅ 이미지 다운로드 및 변환 완료: {output_path} ({url})")
+    return True
+
+def process_post(post_file, image_urls, posts_dir, images_dir, race=True, executor=None):
+    """포스트 하나의 대표이미지 다운로드 (executor: 경쟁 요청에 쓸 공유 스레드 풀)"""
+    post_path = posts_dir / post_file
+    if not post_path.exists():
+        print(f"❌ 파일을 찾을 수 없습니다: {post_path}")
+        return False
+    
+    # 포스트 정보 추출
+    title, categories = extract_post_info(post_path)
+    if not title:
+        print(f"❌ 제목을 추출할 수 없습니다: {post_file}")
+        return False
+    
+    # 출력 파일명 생성
+    image_name = post_file.replace('.md', '.webp')
+    output_path = images_dir / image_name
+    
+    if not image_urls:
+        print(f"❌ 후보 URL이 없습니다: {post_file}")
+        return False
+    
+    print(f"🎨 이미지 다운로드 중: {title}")
+    print(f"📂 카테고리: {categories}")
+    
+    if race:
+        # 후보 URL 동시 요청 - 가장 빠른 성공 응답 사용
+        print(f"🏁 후보 {len(image_urls)}개 동시 요청: {post_file}")
+        success = race_candidate_urls(image_urls, str(output_path), executor=executor)
+    else:
+        # 후보 URL 순차 시도
         success = False
         for i, url in enumerate(image_urls):
             print(f"🔄 시도 {i+1}: {url}")
             if download_and_convert_image(url, str(output_path)):
                 success = True
                 break
-        
-        if not success:
-            print(f"❌ 모든 이미지 다운로드 실패: {post_file}")
-        
-        print("-" * 50)
+    
+    if not success:
+        print(f"❌ 모든 이미지 다운로드 실패: {post_file}")
+    
+    return success
+
+def main():
+    """매니페스트에 나열된 포스트들의 대표이미지 다운로드 및 변환"""
+    import argparse
+    
+    workspace = os.path.dirname(os.path.abspath(__file__))
+    
+    parser = argparse.ArgumentParser(description='블로그 포스트 대표이미지 다운로드 및 변환')
+    parser.add_argument('--manifest', '-m', default=os.path.join(workspace, '_manifests', 'download_blog_images.jsonl'),
+                        help='포스트/후보 URL 매니페스트 (JSONL 또는 YAML)')
+    parser.add_argument('--workspace', '-w', default=workspace, help='작업 공간 경로 (기본값: 스크립트 디렉토리)')
+    parser.add_argument('--workers', type=int, default=4, help='동시에 처리할 포스트 수 (기본값: 4)')
+    parser.add_argument('--sequential', action='store_true', help='후보 URL을 경쟁 요청 대신 순서대로 시도')
+    parser.add_argument('--checkpoint', help='체크포인트 파일 (기본값: .thumbnail_cache/<매니페스트>.checkpoint.jsonl)')
+    parser.add_argument('--reset', action='store_true', help='체크포인트를 지우고 처음부터 다시 처리')
+    args = parser.parse_args()
+    
+    posts_dir = Path(args.workspace) / "_posts"
+    images_dir = Path(args.workspace) / "assets" / "img" / "posts"
+    
+    # 이미지 디렉토리 생성
+    images_dir.mkdir(parents=True, exist_ok=True)
+    
+    entries = load_manifest(Path(args.manifest))
+    checkpoint = Checkpoint(Path(args.checkpoint) if args.checkpoint
+                            else default_checkpoint_path(args.workspace, args.manifest))
+    if args.reset:
+        checkpoint.reset()
+    
+    # 후보 요청은 배치 전체가 한 풀을 공유하고 마지막에 한 번만 종료
+    fanout = max((len(entry.get('urls', [])) for entry in entries), default=1)
+    race_executor = ThreadPoolExecutor(max_workers=max(1, args.workers * fanout), thread_name_prefix='race')
+    
+    def worker(entry):
+        return process_post(entry['post'], entry.get('urls', []), posts_dir, images_dir, not args.sequential,
+                            executor=race_executor)
+    
+    try:
+        result = run_manifest(entries, worker, checkpoint, workers=args.workers)
+    finally:
+        race_executor.shutdown(wait=True, cancel_futures=True)
+    return 1 if result['failed'] else 0
 
 if __name__ == "__main__":
-    main()
+    exit(main())
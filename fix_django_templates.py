@@ -1,55 +1,196 @@
 #!/usr/bin/env python3
 """
 Jekyll에서 Django 템플릿 태그 충돌을 해결하는 스크립트
+
+포스트를 한 번 훑으면서 펜스 코드 블록(```/~~~, 언어 태그 무관)과 인라인 코드(`...`) 중
+Liquid 로 해석될 {{ }} / {% %} 가 들어 있는 부분을 {% raw %} ... {% endraw %} 로 감쌉니다.
+이미 raw 로 감싼 영역, front matter, 본문의 의도된 Liquid 태그({% post_url %} 등)는 그대로 둡니다.
+내용이 실제로 바뀐 파일만 다시 쓰므로 mtime 이 바뀌지 않아 Jekyll 증분 빌드가 유지됩니다.
+
+사용법:
+    python fix_django_templates.py                 # _posts 전체 (병렬)
+    python fix_django_templates.py _posts/2025-07-30-django-*.md
+    python fix_django_templates.py --check         # 수정이 필요한 파일이 있으면 종료 코드 1 (pre-commit 용)
+    python fix_django_templates.py --since origin/main --check   # 기준 ref 이후 바뀐 포스트만
 """
+import os
 import re
-import glob
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from changed_posts import changed_posts
+
+LIQUID_PATTERN = re.compile(r'\{\{|\{%')
+RAW_TAG_PATTERN = re.compile(r'\{%-?\s*(end)?raw\s*-?%\}')
+FENCE_OPEN_PATTERN = re.compile(r'^ {0,3}(`{3,}(?=[^`]*$)|~{3,})')
+INLINE_CODE_PATTERN = re.compile(r'(?<!`)(`+)(?!`)(.+?)(?<!`)\1(?!`)')
+
+RAW_OPEN = '{% raw %}'
+RAW_CLOSE = '{% endraw %}'
+
+
+def _raw_state(text: str, in_raw: bool) -> bool:
+    """text 안의 raw/endraw 태그를 순서대로 반영한 raw 영역 상태"""
+    for match in RAW_TAG_PATTERN.finditer(text):
+        in_raw = match.group(1) is None
+    return in_raw
+
+
+def _is_fence_close(line: str, fence: str) -> bool:
+    """여는 펜스와 같은 문자, 같거나 긴 길이, 뒤에 공백만 있는 줄"""
+    stripped = line.strip()
+    return (len(line) - len(line.lstrip(' ')) <= 3 and stripped.startswith(fence)
+            and set(stripped) == {fence[0]})
+
+
+def _wrap_inline_code(line: str) -> Tuple[str, int]:
+    """Liquid 구문이 든 인라인 코드를 raw 로 감쌈 → (새 줄, 감싼 개수)"""
+    count = 0
+
+    def wrap(match):
+        nonlocal count
+        if not LIQUID_PATTERN.search(match.group(2)):
+            return match.group(0)
+        count += 1
+        return f'{RAW_OPEN}{match.group(0)}{RAW_CLOSE}'
+
+    return INLINE_CODE_PATTERN.sub(wrap, line), count
+
+
+def fix_content(content: str) -> Tuple[str, int]:
+    """마크다운 본문을 한 번 훑어 raw 로 감싼 결과와 수정 개수 반환
+
+    줄 단위 토크나이저로 front matter / 펜스 블록 / 일반 줄을 구분하고
+    조각을 리스트에 모아 마지막에 한 번만 join 합니다.
+    """
+    lines = content.splitlines(keepends=True)
+    out: List[str] = []
+    fixes = 0
+    in_raw = False
+    i = 0
+    n = len(lines)
+
+    # front matter 는 그대로 복사
+    if n and lines[0].rstrip('\r\n') == '---':
+        end = next((j for j in range(1, n) if lines[j].rstrip('\r\n') in ('---', '...')), None)
+        if end is not None:
+            out.extend(lines[:end + 1])
+            i = end + 1
+
+    while i < n:
+        line = lines[i]
+        fence = FENCE_OPEN_PATTERN.match(line)
+
+        if fence:
+            marker = fence.group(1)
+            close = next((j for j in range(i + 1, n) if _is_fence_close(lines[j], marker)), n)
+            body = ''.join(lines[i + 1:close])
+            closing = lines[close] if close < n else ''
+
+            if not in_raw and LIQUID_PATTERN.search(body) and not RAW_TAG_PATTERN.search(body):
+                if body and not body.endswith('\n'):
+                    body += '\n'
+                out.extend([line, RAW_OPEN + '\n', body, RAW_CLOSE + '\n', closing])
+                fixes += 1
+            else:
+                out.extend([line, body, closing])
+                in_raw = _raw_state(body, in_raw)
+            i = close + 1
+            continue
 
-def fix_django_templates_in_file(file_path):
-    """파일에서 Django 템플릿 태그를 raw 태그로 감싸기"""
-    
-    with open(file_path, 'r', encoding='utf-8') as f:
+        if in_raw or RAW_TAG_PATTERN.search(line):
+            out.append(line)
+            in_raw = _raw_state(line, in_raw)
+        else:
+            line, count = _wrap_inline_code(line)
+            out.append(line)
+            fixes += count
+        i += 1
+
+    return ''.join(out), fixes
+
+
+def fix_django_templates_in_file(file_path, check=False):
+    """파일에서 Django 템플릿 태그를 raw 태그로 감싸기 → 수정 개수
+
+    내용이 바뀐 경우에만 파일을 씁니다. check=True 면 쓰지 않고 개수만 반환합니다.
+    """
+    with open(file_path, 'r', encoding='utf-8', newline='') as f:
         content = f.read()
-    
-    # HTML 코드 블록을 찾아서 Django 템플릿 태그가 있는지 확인
-    html_code_blocks = re.finditer(r'```html\n(.*?)```', content, re.DOTALL)
-    
-    new_content = content
-    offset = 0
-    
-    for match in html_code_blocks:
-        block_content = match.group(1)
-        
-        # Django 템플릿 태그가 있는지 확인
-        if '{%' in block_content and '{% raw %}' not in block_content:
-            # raw 태그로 감싸기
-            wrapped_content = f'```html\n{{% raw %}}\n{block_content}{{% endraw %}}\n```'
-            
-            # 원본 블록을 새로운 내용으로 교체
-            start = match.start() + offset
-            end = match.end() + offset
-            
-            new_content = new_content[:start] + wrapped_content + new_content[end:]
-            
-            # 길이 차이만큼 오프셋 조정
-            offset += len(wrapped_content) - (end - start)
-            
-            print(f"Fixed HTML block at position {start}")
-    
-    # 파일에 쓰기
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write(new_content)
-    
-    print(f"Fixed Django template tags in {file_path}")
+
+    new_content, fixes = fix_content(content)
+    if new_content == content:
+        return 0
+
+    if not check:
+        with open(file_path, 'w', encoding='utf-8', newline='') as f:
+            f.write(new_content)
+    return fixes
+
+
+def _process(args):
+    file_path, check = args
+    return file_path, fix_django_templates_in_file(file_path, check=check)
+
+
+def collect_posts(paths: List[str], since: Optional[str] = None) -> List[str]:
+    """파일/디렉토리 인자 → 마크다운 파일 목록 (디렉토리는 하위 .md 전체)
+
+    since 가 주어지면 디렉토리에서는 git 기준 ref 이후 바뀐 파일만 고릅니다.
+    """
+    files = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            posts = changed_posts(path, since) if since else sorted(path.rglob('*.md'))
+            files.extend(str(p) for p in posts)
+        elif path.suffix in ('.md', '.markdown') and path.exists():
+            files.append(str(path))
+    return files
+
+
+def main():
+    """메인 실행 함수"""
+    import argparse
+
+    workspace = os.path.dirname(os.path.abspath(__file__))
+
+    parser = argparse.ArgumentParser(description='코드 블록/인라인 코드의 Liquid 구문을 raw 태그로 감싸기')
+    parser.add_argument('paths', nargs='*', default=[os.path.join(workspace, '_posts')],
+                        help='처리할 포스트 파일 또는 디렉토리 (기본값: _posts 전체)')
+    parser.add_argument('--check', action='store_true', help='파일을 쓰지 않고 수정이 필요한 파일만 보고 (있으면 종료 코드 1)')
+    parser.add_argument('--since', metavar='REF', default=None,
+                        help='git 기준 ref 이후 변경/스테이징/추가된 포스트만 처리 (예: HEAD, origin/main)')
+    parser.add_argument('--workers', type=int, default=None, help='워커 프로세스 수 (기본값: CPU 수)')
+    args = parser.parse_args()
+
+    try:
+        files = collect_posts(args.paths, args.since)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 2
+    if not files:
+        print("처리할 포스트가 없습니다.")
+        return 0
+
+    workers = args.workers or os.cpu_count() or 1
+    jobs = [(file_path, args.check) for file_path in files]
+    if workers == 1 or len(files) == 1:
+        results = list(map(_process, jobs))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_process, jobs, chunksize=max(1, len(jobs) // (workers * 4))))
+
+    changed = [(file_path, fixes) for file_path, fixes in results if fixes]
+    for file_path, fixes in changed:
+        action = "Needs fix" if args.check else "Fixed"
+        print(f"{action}: {file_path} ({fixes}개 블록)")
+
+    verb = "수정 필요" if args.check else "수정"
+    print(f"\n{len(files)}개 파일 확인, {len(changed)}개 파일 {verb} (블록 {sum(f for _, f in changed)}개)")
+    return 1 if args.check and changed else 0
+
 
 if __name__ == "__main__":
-    # 모든 Django 관련 포스트 파일 찾기
-    file_patterns = [
-        "/home/lleague/projects/updaun.github.io/_posts/*django*.md",
-        "/home/lleague/projects/updaun.github.io/_posts/*yolo*.md"
-    ]
-    
-    for pattern in file_patterns:
-        for file_path in glob.glob(pattern):
-            print(f"Processing {file_path}")
-            fix_django_templates_in_file(file_path)
+    sys.exit(main())
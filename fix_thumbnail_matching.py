@@ -6,6 +6,8 @@
 1. 포스트 파일과 썸네일 이미지 파일을 매칭하여 상태를 확인합니다
 2. 포스트의 front matter에 올바른 image 경로를 추가/수정합니다
 3. 썸네일이 없는 포스트를 자동으로 생성할 수 있는 목록을 제공합니다
+
+--since <ref> 를 주면 git 기준 ref 이후 바뀐 포스트(또는 썸네일이 바뀐 포스트)만 점검합니다.
 """
 
 import os
@@ -14,6 +16,8 @@ from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 import yaml
 
+from changed_posts import changed_posts, git_changed_paths
+
 
 class PostThumbnailMatcher:
     """포스트와 썸네일 매칭 관리자"""
@@ -22,6 +26,7 @@ class PostThumbnailMatcher:
         self.workspace_path = Path(workspace_path)
         self.posts_dir = self.workspace_path / "_posts"
         self.images_dir = self.workspace_path / "assets" / "img" / "posts"
+        self.selected_posts = None  # None 이면 모든 포스트
         
         if not self.posts_dir.exists():
             raise FileNotFoundError(f"포스트 디렉토리를 찾을 수 없습니다: {self.posts_dir}")
@@ -31,9 +36,23 @@ class PostThumbnailMatcher:
             self.images_dir.mkdir(parents=True, exist_ok=True)
 
     def get_post_files(self) -> List[Path]:
-        """모든 포스트 파일 가져오기"""
+        """점검할 포스트 파일 가져오기 (select_changed_posts 로 좁히지 않았으면 모든 포스트)"""
+        if self.selected_posts is not None:
+            return list(self.selected_posts)
         return list(self.posts_dir.glob("*.md"))
 
+    def select_changed_posts(self, since: Optional[str] = None) -> List[Path]:
+        """git 기준 ref 이후 바뀐 포스트와 썸네일이 바뀐 포스트만 점검 대상으로 선택"""
+        posts = set(changed_posts(self.posts_dir, since))
+        for image in git_changed_paths(self.images_dir, since, [self.images_dir]):
+            post_file = self.posts_dir / f"{image.stem}.md"
+            if post_file.exists():
+                posts.add(post_file.resolve())
+
+        self.selected_posts = sorted(posts)
+        print(f"🔀 {since or 'HEAD'} 이후 변경된 포스트 {len(self.selected_posts)}개만 점검합니다")
+        return self.selected_posts
+
     def get_thumbnail_files(self) -> Dict[str, Path]:
         """썸네일 파일들을 파일명을 키로 하는 딕셔너리로 반환"""
         thumbnails = {}
@@ -83,11 +102,11 @@ class PostThumbnailMatcher:
             'incorrect_paths': []   # 잘못된 경로를 가진 포스트
         }
         
-        post_names = set()
+        # 고아 썸네일 판단은 점검 대상과 관계없이 모든 포스트 이름 기준 (파일을 읽지 않음)
+        post_names = {post_file.stem for post_file in self.posts_dir.glob("*.md")}
         
         for post_file in posts:
             post_name, current_image, metadata = self.extract_post_metadata(post_file)
-            post_names.add(post_name)
             
             # 썸네일 파일 존재 확인
             if post_name in thumbnails:
@@ -306,10 +325,20 @@ class PostThumbnailMatcher:
 
 def main():
     """메인 실행 함수"""
-    workspace_path = "/home/lleague/projects/updaun.github.io"
+    import argparse
+
+    parser = argparse.ArgumentParser(description='포스트-썸네일 매칭 점검 및 수정')
+    parser.add_argument('--workspace', '-w', default=None, help='작업 공간 경로 (기본값: 스크립트 디렉토리)')
+    parser.add_argument('--since', metavar='REF', default=None,
+                        help='git 기준 ref 이후 변경/스테이징/추가된 포스트만 점검 (예: HEAD, origin/main)')
+    args = parser.parse_args()
+
+    workspace_path = args.workspace or os.path.dirname(os.path.abspath(__file__))
     
     try:
         matcher = PostThumbnailMatcher(workspace_path)
+        if args.since:
+            matcher.select_changed_posts(args.since)
         matcher.run_fix()
         
     except Exception as e:
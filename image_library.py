@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+로컬 스톡 이미지 라이브러리 (키워드 역색인 + 지각 메타데이터)
+
+source.unsplash.com 은 느리고 호출 제한이 있어 CI 에서 썸네일을 만들 수 없습니다.
+사용 허가를 받은 이미지를 디렉토리(기본값 _stock_images/, Jekyll 빌드에서 제외됨)에 두고
+이미지마다 같은 이름의 사이드카 파일(photo.yml / photo.yaml / photo.json)에 키워드를 적어 두면
+    - 역색인: 키워드 구절 → 이미지 번호, 키워드 단어 → 이미지 번호
+    - 지각 메타데이터: 크기, 평균 색, 64비트 dHash (거의 같은 사진을 한 번만 추천)
+를 만들어 search_unsplash_images 와 같은 키워드 목록으로 수 µs 안에 후보를 돌려줍니다.
+
+사이드카 형식:
+    keywords: [cloud computing, server, data center]
+    description: 서버실 랙 사진      # 선택
+    license: Unsplash License        # 선택
+    author: Jane Doe                 # 선택
+(키워드 목록만 적어도 됩니다.)
+
+분석 결과는 파일 수정 시각/크기별로 .thumbnail_cache/stock_index.json 에 저장해
+다음 실행에서는 바뀐 이미지만 다시 읽습니다.
+
+사용법:
+    python image_library.py                                   # 색인 갱신 + 통계
+    python image_library.py --query "cloud computing" server  # 검색 결과와 조회 시간
+"""
+
+import json
+import os
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Union
+
+import numpy as np
+import yaml
+from PIL import Image
+
+from image_palette import rgb_to_hex, sample_pixels
+from image_pipeline import DEFAULT_SIZE
+
+DEFAULT_LIBRARY_DIR = Path('_stock_images')
+DEFAULT_INDEX_PATH = Path('.thumbnail_cache/stock_index.json')
+IMAGE_SUFFIXES = ('.jpg', '.jpeg', '.png', '.webp')
+SIDECAR_SUFFIXES = ('.yml', '.yaml', '.json')
+
+HASH_SIZE = 8
+# dHash 해밍 거리가 이 값 이하면 같은 사진으로 보고 검색 결과에서 한 장만 남김
+DUPLICATE_DISTANCE = 6
+# 키워드 구절 전체가 일치하면 단어 일치(구절 길이로 나눈 1점)보다 크게 가산
+PHRASE_WEIGHT = 3.0
+# 출력 비율/해상도 적합도 가중치 (0 ~ 1 점수에 곱함, 키워드 점수가 같을 때 순서 결정)
+FIT_WEIGHT = 0.5
+STOP_WORDS = frozenset({'a', 'an', 'and', 'the', 'of', 'for', 'in', 'on', 'to', 'with'})
+
+WORD_PATTERN = re.compile(r'\w+')
+
+
+def _words(text: str) -> List[str]:
+    return [word for word in WORD_PATTERN.findall(text.lower()) if word not in STOP_WORDS]
+
+
+def dhash(pixels: np.ndarray, size: int = HASH_SIZE) -> int:
+    """(h, w, 3) 축소본의 차이 해시 (가로로 이웃한 밝기 비교, size² 비트)"""
+    gray = Image.fromarray(pixels).convert('L').resize((size + 1, size), Image.BOX)
+    values = np.asarray(gray, dtype=np.int16)
+    bits = (values[:, 1:] > values[:, :-1]).ravel()
+    return int(np.packbits(bits).tobytes().hex(), 16)
+
+
+def hamming(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+
+def fit_score(width: int, height: int, size=DEFAULT_SIZE) -> float:
+    """출력 크기 적합도 (0 ~ 1): 비율이 가까울수록, 출력보다 작게 확대할 일이 없을수록 높음"""
+    aspect = min(width / height, size[0] / size[1]) / max(width / height, size[0] / size[1])
+    scale = min(1.0, width / size[0], height / size[1])
+    return aspect * scale
+
+
+def analyse_image(path: Path) -> Dict:
+    """크기, 평균 색, dHash (JPEG 은 draft 로 축소 디코딩)"""
+    with Image.open(path) as img:
+        width, height = img.size
+        pixels = sample_pixels(img)
+    return {
+        'width': width,
+        'height': height,
+        'color': rgb_to_hex(pixels.reshape(-1, 3).mean(axis=0)),
+        'dhash': f"{dhash(pixels):0{HASH_SIZE * HASH_SIZE // 4}x}",
+    }
+
+
+def read_sidecar(path: Path) -> Dict:
+    """사이드카 → {'keywords': [...], 'description', 'license', 'author'} (키워드 목록만 있어도 됨)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f) if path.suffix == '.json' else yaml.safe_load(f)
+    if isinstance(data, list):
+        data = {'keywords': data}
+    if not isinstance(data, dict):
+        raise ValueError(f"사이드카 형식이 올바르지 않습니다: {path}")
+    keywords = data.get('keywords', data.get('tags')) or []
+    if isinstance(keywords, str):
+        keywords = [keyword.strip() for keyword in keywords.split(',')]
+    keywords = [str(keyword).strip() for keyword in keywords if str(keyword).strip()]
+    if not keywords:
+        raise ValueError(f"사이드카에 keywords 가 없습니다: {path}")
+    return {
+        'keywords': keywords,
+        'description': data.get('description') or '',
+        'license': data.get('license') or '',
+        'author': data.get('author') or '',
+    }
+
+
+def find_sidecar(image_path: Path) -> Optional[Path]:
+    for suffix in SIDECAR_SUFFIXES:
+        candidate = image_path.with_suffix(suffix)
+        if candidate.exists():
+            return candidate
+    return None
+
+
+class StockLibrary:
+    """로컬 이미지 디렉토리의 키워드 역색인
+
+    library = StockLibrary('_stock_images', '.thumbnail_cache/stock_index.json')
+    library.search(['cloud computing', 'server'], count=5)
+    """
+
+    def __init__(self, root: Union[str, Path], index_path: Union[str, Path, None] = None):
+        self.root = Path(root)
+        self.index_path = Path(index_path) if index_path else None
+        self.entries: List[Dict] = []
+        self.phrases: Dict[str, List[int]] = {}
+        self.words: Dict[str, List[int]] = {}
+        self.skipped: List[str] = []
+        self.analysed = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _load_cache(self) -> Dict[str, Dict]:
+        if self.index_path is None or not self.index_path.exists():
+            return {}
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"⚠️ 스톡 이미지 색인 로드 실패: {e}")
+            return {}
+
+    def _save_cache(self, cache: Dict[str, Dict]) -> None:
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.index_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, ensure_ascii=False, indent=2, sort_keys=True)
+        tmp_path.replace(self.index_path)
+
+    def scan(self) -> 'StockLibrary':
+        """디렉토리를 훑어 바뀐 이미지만 다시 분석하고 역색인을 만듦"""
+        cached = self._load_cache()
+        cache: Dict[str, Dict] = {}
+        self.skipped = []
+        self.analysed = 0
+
+        image_paths = sorted(path for path in self.root.rglob('*')
+                             if path.suffix.lower() in IMAGE_SUFFIXES) if self.root.is_dir() else []
+        for image_path in image_paths:
+            key = image_path.relative_to(self.root).as_posix()
+            sidecar = find_sidecar(image_path)
+            if sidecar is None:
+                self.skipped.append(f"{key}: 사이드카 없음")
+                continue
+
+            stat, sidecar_stat = image_path.stat(), sidecar.stat()
+            stamp = [stat.st_mtime_ns, stat.st_size, sidecar_stat.st_mtime_ns]
+            entry = cached.get(key)
+            if entry is None or entry.get('stamp') != stamp:
+                try:
+                    entry = {'stamp': stamp, **read_sidecar(sidecar), **analyse_image(image_path)}
+                except Exception as e:
+                    self.skipped.append(f"{key}: {e}")
+                    continue
+                self.analysed += 1
+            cache[key] = entry
+
+        if self.index_path is not None and cache != cached:
+            self._save_cache(cache)
+        self._build_index(cache)
+        return self
+
+    def _build_index(self, cache: Dict[str, Dict]) -> None:
+        self.entries, self.phrases, self.words = [], {}, {}
+        for key in sorted(cache):
+            entry = dict(cache[key], path=key, hash=int(cache[key]['dhash'], 16),
+                         fit=fit_score(cache[key]['width'], cache[key]['height']))
+            index = len(self.entries)
+            self.entries.append(entry)
+            phrases = {' '.join(_words(keyword)) for keyword in entry['keywords']} - {''}
+            for phrase in phrases:
+                self.phrases.setdefault(phrase, []).append(index)
+            for word in {word for phrase in phrases for word in phrase.split()}:
+                self.words.setdefault(word, []).append(index)
+
+    def search(self, keywords: Sequence[str], count: int = 5) -> List[Dict]:
+        """키워드 목록으로 검색 → search_unsplash_images 와 같은 형식의 image_info 목록
+
+        구절이 통째로 일치하면 PHRASE_WEIGHT, 단어가 일치하면 1/구절 단어 수를 더하고,
+        점수가 같으면 출력 비율/해상도에 맞는 이미지를 먼저 고릅니다.
+        dHash 가 거의 같은 이미지는 한 장만 남깁니다.
+        """
+        scores: Dict[int, float] = {}
+        matched: Dict[int, str] = {}
+        for keyword in keywords:
+            words = _words(keyword)
+            if not words:
+                continue
+            hits = [(index, PHRASE_WEIGHT) for index in self.phrases.get(' '.join(words), ())]
+            share = 1 / len(words)
+            hits.extend((index, share) for word in set(words) for index in self.words.get(word, ()))
+            for index, score in hits:
+                scores[index] = scores.get(index, 0.0) + score
+                matched.setdefault(index, keyword)
+
+        ranked = sorted(scores, key=lambda index: (-(scores[index] + FIT_WEIGHT * self.entries[index]['fit']),
+                                                   index))
+        results: List[Dict] = []
+        picked: List[int] = []
+        for index in ranked:
+            if len(results) >= count:
+                break
+            entry = self.entries[index]
+            if any(hamming(entry['hash'], other) <= DUPLICATE_DISTANCE for other in picked):
+                continue
+            picked.append(entry['hash'])
+            results.append({
+                'url': str(self.root / entry['path']),
+                'keyword': matched[index],
+                'width': entry['width'],
+                'height': entry['height'],
+                'description': entry['description'] or f"Image for {matched[index]}",
+                'provider': 'local',
+                'license': entry['license'],
+                'author': entry['author'],
+                'color': entry['color'],
+            })
+        return results
+
+
+def main():
+    """메인 실행 함수"""
+    import argparse
+    import time
+
+    workspace = os.path.dirname(os.path.abspath(__file__))
+
+    parser = argparse.ArgumentParser(description='로컬 스톡 이미지 라이브러리 색인/검색')
+    parser.add_argument('--dir', '-d', default=os.path.join(workspace, DEFAULT_LIBRARY_DIR),
+                        help=f'이미지 디렉토리 (기본값: {DEFAULT_LIBRARY_DIR})')
+    parser.add_argument('--index', default=os.path.join(workspace, DEFAULT_INDEX_PATH),
+                        help=f'색인 캐시 파일 (기본값: {DEFAULT_INDEX_PATH})')
+    parser.add_argument('--query', '-q', nargs='+', metavar='KEYWORD', help='검색 키워드 목록')
+    parser.add_argument('--count', '-n', type=int, default=5, help='검색 결과 수 (기본값: 5)')
+    args = parser.parse_args()
+
+    if not Path(args.dir).is_dir():
+        print(f"❌ 이미지 디렉토리를 찾을 수 없습니다: {args.dir}")
+        return 1
+
+    start = time.perf_counter()
+    library = StockLibrary(args.dir, args.index).scan()
+    elapsed = time.perf_counter() - start
+    print(f"📚 {args.dir}: 이미지 {len(library)}장 (새로 분석 {library.analysed}장, {elapsed:.2f}s),"
+          f" 구절 {len(library.phrases)}개, 단어 {len(library.words)}개")
+    for reason in library.skipped:
+        print(f"⚠️ 건너뜀 {reason}")
+
+    if args.query:
+        repeat = 1000
+        start = time.perf_counter()
+        for _ in range(repeat):
+            results = library.search(args.query, args.count)
+        elapsed = (time.perf_counter() - start) / repeat * 1e6
+        print(f"🔍 {args.query} → {len(results)}장 ({elapsed:.1f}µs/검색)")
+        for image in results:
+            print(f"   {image['url']} [{image['keyword']}] {image['width']}x{image['height']}"
+                  f" {image['color']} {image['license']}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+썸네일 원본의 대표 색 팔레트 추출과 오버레이 색상 선택
+
+원본을 64px 안팎 너비로 박스 평균 축소한 뒤 NumPy k-means 로 대표 색 5개를 뽑습니다 (이미지당 수 ms).
+overlay_scheme 은 이 팔레트로 하단 그라데이션 색, 제목/카테고리 글자색을 골라
+제목 영역이 WCAG AA 대비(4.5:1)를 넘도록 합니다. 키워드로 고른 색상 스키마는
+팔레트가 없을 때(폴백 이미지)와 accent/gradient 기본값으로만 쓰입니다.
+
+사용법:
+    python image_palette.py photo.jpg [photo2.webp ...]
+"""
+
+import colorsys
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from PIL import Image
+
+from image_pipeline import to_rgb
+
+PALETTE_SIZE = 5
+SAMPLE_WIDTH = 64
+KMEANS_ITERATIONS = 12
+SEED = 42
+
+# 제목/카테고리가 놓이는 하단 영역 (1200x630 기준 하단 160px)
+TEXT_REGION_FRACTION = 0.25
+# 제목 영역의 평균 그라데이션 불투명도 / 최대 불투명도 (하단 200px 선형 그라데이션 기준)
+TEXT_REGION_ALPHA = 0.6
+# 대비가 모자라면 순서대로 그라데이션을 진하게 함
+GRADIENT_ALPHAS = (150, 170, 190, 210, 230)
+SHADE_STEPS = 10
+MIN_TEXT_CONTRAST = 4.5
+MIN_LABEL_CONTRAST = 3.0
+
+WHITE = (255, 255, 255)
+DARK = (17, 24, 39)
+
+RGB = Tuple[int, int, int]
+
+
+def hex_to_rgb(hex_color: str) -> RGB:
+    hex_color = hex_color.lstrip('#')
+    return tuple(int(hex_color[i:i + 2], 16) for i in (0, 2, 4))
+
+
+def rgb_to_hex(rgb: Sequence[float]) -> str:
+    return '#{:02x}{:02x}{:02x}'.format(*(int(round(c)) for c in rgb))
+
+
+def relative_luminance(rgb: Sequence[float]) -> float:
+    """WCAG 상대 휘도"""
+    channels = np.asarray(rgb, dtype=np.float64) / 255
+    linear = np.where(channels <= 0.04045, channels / 12.92, ((channels + 0.055) / 1.055) ** 2.4)
+    return float(linear @ (0.2126, 0.7152, 0.0722))
+
+
+def contrast_ratio(a: Sequence[float], b: Sequence[float]) -> float:
+    """WCAG 대비율 (1 ~ 21)"""
+    la, lb = sorted((relative_luminance(a), relative_luminance(b)), reverse=True)
+    return (la + 0.05) / (lb + 0.05)
+
+
+def _mix(a: Sequence[float], b: Sequence[float], t: float) -> Tuple[float, float, float]:
+    """a 위에 b 를 불투명도 t 로 합성"""
+    return tuple(x * (1 - t) + y * t for x, y in zip(a, b))
+
+
+def _nearest_center(samples: np.ndarray, centers: np.ndarray) -> np.ndarray:
+    """가장 가까운 중심 번호 (|x - c|² 에서 x 마다 같은 |x|² 항을 빼고 |c|² - 2x·c 만 비교)"""
+    return ((centers ** 2).sum(axis=1) - 2 * samples @ centers.T).argmin(axis=1)
+
+
+def kmeans_palette(pixels: np.ndarray, k: int = PALETTE_SIZE, iterations: int = KMEANS_ITERATIONS,
+                   seed: int = SEED) -> List[Tuple[RGB, float]]:
+    """(..., 3) 픽셀 배열의 k-means 대표 색 → [(rgb, 비율), ...] 비율 내림차순"""
+    samples = pixels.reshape(-1, 3).astype(np.float32)
+    rng = np.random.RandomState(seed)
+
+    # k-means++ 초기화 (같은 이미지는 항상 같은 팔레트). 남은 거리가 0 이면 색이 k 개보다 적은 것
+    centers = samples[[rng.randint(len(samples))]]
+    nearest = ((samples - centers[0]) ** 2).sum(axis=1)
+    while len(centers) < k and nearest.max() > 0:
+        center = samples[rng.choice(len(samples), p=nearest / nearest.sum())]
+        centers = np.vstack([centers, center])
+        nearest = np.minimum(nearest, ((samples - center) ** 2).sum(axis=1))
+    k = len(centers)
+
+    labels = None
+    for _ in range(iterations):
+        new_labels = _nearest_center(samples, centers)
+        if labels is not None and np.array_equal(labels, new_labels):
+            break
+        labels = new_labels
+        counts = np.bincount(labels, minlength=k)
+        filled = counts > 0
+        for channel in range(3):
+            sums = np.bincount(labels, weights=samples[:, channel], minlength=k)
+            centers[filled, channel] = sums[filled] / counts[filled]
+
+    counts = np.bincount(labels, minlength=k)
+    order = np.argsort(-counts, kind='stable')
+    return [(tuple(int(round(c)) for c in centers[i]), float(counts[i] / len(samples)))
+            for i in order if counts[i]]
+
+
+def sample_pixels(img: Image.Image, width: int = SAMPLE_WIDTH) -> np.ndarray:
+    """팔레트용 (h, w, 3) 축소본: JPEG draft 디코딩 + Image.reduce 박스 평균 (정수 배율)
+
+    아직 로드하지 않은 JPEG 은 제자리에서 draft 가 설정됩니다.
+    """
+    img.draft('RGB', (width, max(1, img.height * width // img.width)))
+    img = to_rgb(img)
+    factor = img.width // width
+    if factor > 1:
+        img = img.reduce(factor)
+    return np.asarray(img)
+
+
+def extract_palette(img: Image.Image, k: int = PALETTE_SIZE) -> Dict:
+    """{'colors': [[hex, 비율], ...], 'text_region': 제목 영역 평균 hex}
+
+    JSON 으로 그대로 캐시할 수 있는 형태입니다.
+    """
+    small = sample_pixels(img)
+    text_top = int(small.shape[0] * (1 - TEXT_REGION_FRACTION))
+    return {
+        'colors': [[rgb_to_hex(rgb), round(weight, 4)] for rgb, weight in kmeans_palette(small, k)],
+        'text_region': rgb_to_hex(small[text_top:].reshape(-1, 3).mean(axis=0)),
+    }
+
+
+def _saturation(rgb: Sequence[float]) -> float:
+    return colorsys.rgb_to_hsv(*(c / 255 for c in rgb))[1]
+
+
+def overlay_scheme(palette: Dict, base: Optional[Dict] = None) -> Dict:
+    """팔레트로 오버레이 색상 스키마 구성 (base 의 나머지 키는 유지)
+
+    - primary: 가장 넓은 대표 색을 글자색 쪽과 반대로 어둡게/밝게 조정한 그라데이션 색
+    - text: 흰색/진회색 중 그라데이션 조정이 덜 필요한 쪽
+    - secondary: 채도가 높은 대표 색 중 배경 대비 3:1 이상인 첫 색 (없으면 text)
+    - overlay_alpha: 그라데이션 최대 불투명도 (대비가 모자라면 150 보다 진하게)
+    """
+    colors = [hex_to_rgb(color) for color, _ in palette['colors']]
+    region = hex_to_rgb(palette['text_region'])
+    dominant = colors[0] if colors else region
+
+    best = None
+    for alpha in GRADIENT_ALPHAS:
+        opacity = alpha / 255 * TEXT_REGION_ALPHA
+        for text, target in ((WHITE, (0, 0, 0)), (DARK, WHITE)):
+            for step in range(SHADE_STEPS + 1):
+                shade = _mix(dominant, target, step / SHADE_STEPS)
+                background = _mix(region, shade, opacity)
+                if contrast_ratio(text, background) >= MIN_TEXT_CONTRAST:
+                    if best is None or step < best[0]:
+                        best = (step, alpha, text, shade, background)
+                    break
+        if best is not None:
+            break
+    if best is None:
+        alpha = GRADIENT_ALPHAS[-1]
+        shade = (0, 0, 0)
+        best = (SHADE_STEPS, alpha, WHITE, shade, _mix(region, shade, alpha / 255 * TEXT_REGION_ALPHA))
+    _, alpha, text, shade, background = best
+
+    label = next((color for color in sorted(colors, key=_saturation, reverse=True)
+                  if contrast_ratio(color, background) >= MIN_LABEL_CONTRAST), text)
+
+    scheme = dict(base or {})
+    scheme.update({
+        'primary': rgb_to_hex(shade),
+        'secondary': rgb_to_hex(label),
+        'text': rgb_to_hex(text),
+        'overlay_alpha': alpha,
+    })
+    return scheme
+
+
+def main():
+    """메인 실행 함수"""
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description='이미지 대표 색 팔레트와 오버레이 색상 출력')
+    parser.add_argument('images', nargs='+', help='이미지 파일')
+    parser.add_argument('--colors', '-k', type=int, default=PALETTE_SIZE,
+                        help=f'팔레트 색 수 (기본값: {PALETTE_SIZE})')
+    args = parser.parse_args()
+
+    if args.colors <= 0:
+        parser.error('--colors 는 0 보다 커야 합니다')
+
+    for path in args.images:
+        with Image.open(path) as img:
+            start = time.perf_counter()
+            palette = extract_palette(img, args.colors)
+            elapsed = (time.perf_counter() - start) * 1000
+        scheme = overlay_scheme(palette)
+        colors = ' '.join(f"{color}({weight:.0%})" for color, weight in palette['colors'])
+        print(f"🎨 {path} ({elapsed:.1f}ms): {colors}")
+        print(f"   그라데이션 {scheme['primary']} α{scheme['overlay_alpha']}, "
+              f"제목 {scheme['text']}, 카테고리 {scheme['secondary']}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+블로그 이미지 공통 처리 파이프라인
+
+download_blog_images.py, create_blog_images.py, auto_thumbnail_generator.py 가
+함께 사용하는 "다운로드 → RGB 변환 → 비율 크롭 → LANCZOS 리사이즈 → 인코딩" 모듈입니다.
+
+- JPEG는 draft 모드로 필요한 배율까지만 디코딩
+- 크롭 영역을 resize(box=...)에 넘겨 중간 리사이즈/크롭 복사본을 만들지 않음
+- reducing_gap 으로 큰 원본의 축소 속도 향상
+- WebP/JPEG/PNG/AVIF 출력 코덱 선택
+- 스트리밍 다운로드: 크기 제한, 헤더 사전 검사, 큰 본문은 임시 파일로 스풀
+"""
+
+import hashlib
+import io
+import math
+import tempfile
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple, Union
+
+import requests
+from PIL import Image, UnidentifiedImageError
+
+
+DEFAULT_SIZE = (1200, 630)
+DEFAULT_REDUCING_GAP = 3.0
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+MAX_DOWNLOAD_BYTES = 20 * 1024 * 1024   # 이보다 큰 응답은 거부
+MAX_IMAGE_PIXELS = 60_000_000           # 헤더 기준 최대 픽셀 수 (디코딩 폭탄 방지)
+SPOOL_MEMORY_BYTES = 1024 * 1024        # 이보다 큰 본문은 임시 파일로 넘김
+PROBE_BYTES = 64 * 1024                 # 헤더 검사에 사용할 앞부분 크기
+PROBE_MAX_BYTES = 1024 * 1024           # 헤더가 잘려 있으면 창을 두 배씩 늘려 이 크기까지 재검사
+
+# 이미지로 인정하는 Content-Type (비어 있으면 헤더 검사로 판단)
+ACCEPTED_CONTENT_TYPES = ('image/', 'application/octet-stream', 'binary/octet-stream')
+
+
+class DownloadCancelled(Exception):
+    """다른 후보가 먼저 성공해 다운로드가 중단됨"""
+
+
+class DownloadRejected(Exception):
+    """크기/형식 검사를 통과하지 못한 응답"""
+
+
+class NotModified(Exception):
+    """조건부 요청에 304 Not Modified 응답 (로컬 사본을 그대로 사용)"""
+
+
+# 코덱별 저장 옵션 (PIL save 포맷명, 기본 인자, 확장자)
+CODECS: Dict[str, Dict] = {
+    'webp': {'format': 'WEBP', 'options': {'quality': 85}, 'suffix': '.webp'},
+    'jpeg': {'format': 'JPEG', 'options': {'quality': 85, 'optimize': True, 'progressive': True}, 'suffix': '.jpg'},
+    'png': {'format': 'PNG', 'options': {'optimize': True}, 'suffix': '.png'},
+    'avif': {'format': 'AVIF', 'options': {'quality': 60}, 'suffix': '.avif'},
+}
+
+
+def crop_box_for_aspect(src_size: Tuple[int, int], size: Tuple[int, int]) -> Tuple[float, float, float, float]:
+    """원본에서 목표 비율에 맞는 중앙 크롭 영역 계산 (원본 좌표계)"""
+    src_w, src_h = src_size
+    target_ratio = size[0] / size[1]
+
+    if src_w / src_h > target_ratio:
+        # 이미지가 더 넓음 - 좌우 크롭
+        crop_w = src_h * target_ratio
+        left = (src_w - crop_w) / 2
+        return (left, 0, left + crop_w, src_h)
+
+    # 이미지가 더 높음 - 상하 크롭
+    crop_h = src_w / target_ratio
+    top = (src_h - crop_h) / 2
+    return (0, top, src_w, top + crop_h)
+
+
+def prepare_draft(img: Image.Image, size: Tuple[int, int]) -> Image.Image:
+    """JPEG 디코딩 전에 draft 모드 설정 (필요한 해상도까지만 DCT 축소 디코딩)
+
+    draft는 이미지 객체를 제자리에서 바꾸며, 로드 전에만 효과가 있습니다.
+    """
+    if img.format != 'JPEG':
+        return img
+
+    box = crop_box_for_aspect(img.size, size)
+    scale = size[0] / (box[2] - box[0])
+    requested = (math.ceil(img.width * scale), math.ceil(img.height * scale))
+    img.draft('RGB', requested)
+    return img
+
+
+def has_alpha(img: Image.Image) -> bool:
+    """투명 채널(또는 팔레트 투명색) 보유 여부"""
+    return img.mode in ('RGBA', 'LA', 'PA') or (img.mode == 'P' and 'transparency' in img.info)
+
+
+def is_opaque(img: Image.Image) -> bool:
+    """실제로 투명한 픽셀이 없는지 확인 (RGBA/LA 알파 채널 최솟값 검사)"""
+    if not has_alpha(img):
+        return True
+    if img.mode in ('RGBA', 'LA'):
+        return img.getchannel('A').getextrema()[0] == 255
+    return False
+
+
+def to_rgb(img: Image.Image) -> Image.Image:
+    """RGB로 변환 (이미 RGB면 복사하지 않음, 투명 영역은 흰 배경으로 합성)"""
+    if img.mode == 'RGB':
+        return img
+
+    if has_alpha(img):
+        rgba = img if img.mode == 'RGBA' else img.convert('RGBA')
+        background = Image.new('RGB', rgba.size, (255, 255, 255))
+        background.paste(rgba, mask=rgba.getchannel('A'))
+        return background
+
+    return img.convert('RGB')
+
+
+def resize_and_crop(img: Image.Image, size: Tuple[int, int] = DEFAULT_SIZE,
+                    box: Optional[Tuple[float, float, float, float]] = None,
+                    reducing_gap: Optional[float] = DEFAULT_REDUCING_GAP) -> Image.Image:
+    """비율 유지 크롭 + LANCZOS 리사이즈를 한 번의 resize 호출로 처리
+
+    box를 생략하면 중앙 크롭 영역을 사용합니다.
+    """
+    if box is None:
+        box = crop_box_for_aspect(img.size, size)
+
+    if img.size == tuple(size) and box == (0, 0, img.width, img.height):
+        # 리사이즈가 필요 없어도 픽셀을 읽어 둠 (호출자가 원본 스트림을 닫은 뒤에 저장할 수 있음)
+        img.load()
+        return img
+
+    return img.resize(tuple(size), Image.Resampling.LANCZOS, box=box, reducing_gap=reducing_gap)
+
+
+def probe_image_header(head: bytes, partial: bool = False) -> Optional[Tuple[str, Tuple[int, int]]]:
+    """본문 앞부분만으로 이미지 형식과 크기 확인 (픽셀 디코딩 없음)
+
+    partial=True 이면 형식은 인식했지만 헤더가 잘린 경우(큰 ICC/XMP 세그먼트 등)
+    거부하지 않고 None 을 반환해 더 받은 뒤 다시 검사하게 합니다.
+    """
+    try:
+        with Image.open(io.BytesIO(head)) as probe:
+            fmt, size = probe.format, probe.size
+    except UnidentifiedImageError as e:
+        raise DownloadRejected(f"이미지 헤더를 인식할 수 없습니다: {e}")
+    except Exception as e:
+        if partial:
+            return None
+        raise DownloadRejected(f"이미지 헤더를 인식할 수 없습니다: {e}")
+
+    if size[0] * size[1] > MAX_IMAGE_PIXELS:
+        raise DownloadRejected(f"이미지가 너무 큽니다: {size[0]}x{size[1]}")
+    return fmt, size
+
+
+def conditional_headers(validators: Optional[Dict]) -> Dict[str, str]:
+    """저장된 검증자(ETag/Last-Modified)로 조건부 요청 헤더 생성"""
+    if not validators:
+        return {}
+
+    result = {}
+    if validators.get('etag'):
+        result['If-None-Match'] = validators['etag']
+    if validators.get('last_modified'):
+        result['If-Modified-Since'] = validators['last_modified']
+    return result
+
+
+def abort_response(response: requests.Response) -> None:
+    """다른 스레드에서 읽는 중인 응답의 연결을 끊음 (막혀 있던 읽기가 즉시 예외로 끝남)
+
+    close() 만으로는 소켓 읽기에서 기다리는 스레드가 깨어나지 않으므로
+    urllib3 2.3+ 의 shutdown() 으로 소켓을 먼저 닫습니다.
+    """
+    shutdown = getattr(response.raw, 'shutdown', None)
+    try:
+        if shutdown is not None:
+            shutdown()
+        response.close()
+    except Exception:
+        pass
+
+
+def fetch_stream(url: str, timeout: Union[float, Tuple[float, float]] = 30, headers: Optional[Dict] = None,
+                 cancel_event: Optional[threading.Event] = None,
+                 max_bytes: int = MAX_DOWNLOAD_BYTES, validators: Optional[Dict] = None,
+                 response_info: Optional[Dict] = None,
+                 on_response: Optional[Callable[[requests.Response], None]] = None) -> tempfile.SpooledTemporaryFile:
+    """URL 본문을 스트리밍으로 받아 스풀 임시 파일로 반환 (위치 0)
+
+    - Content-Length/Content-Type을 먼저 확인해 명백히 잘못된 응답은 본문을 받지 않음
+    - 앞부분 PROBE_BYTES를 받으면 이미지 헤더를 검사한 뒤에만 나머지를 받음
+      (헤더가 잘려 있으면 검사 창을 두 배씩 늘려 PROBE_MAX_BYTES까지 다시 검사)
+    - max_bytes를 넘으면 즉시 중단
+    - SPOOL_MEMORY_BYTES를 넘는 본문은 메모리 대신 임시 파일에 보관
+    - cancel_event가 설정되면 즉시 연결을 끊고 DownloadCancelled 발생
+    - validators(etag/last_modified)가 있으면 조건부 요청을 보내고, 304면 NotModified 발생
+    - response_info 딕셔너리에 응답의 검증자(etag/last_modified)를 기록
+    - on_response는 응답 헤더를 받은 직후 응답 객체로 호출 (취소 시 abort_response로 끊을 수 있게)
+    """
+    if cancel_event is not None and cancel_event.is_set():
+        raise DownloadCancelled(url)
+
+    request_headers = dict(headers or DEFAULT_HEADERS)
+    request_headers.update(conditional_headers(validators))
+
+    with requests.get(url, headers=request_headers, timeout=timeout, stream=True) as response:
+        if response.status_code == 304:
+            raise NotModified(url)
+        response.raise_for_status()
+
+        if on_response is not None:
+            on_response(response)
+
+        if response_info is not None:
+            response_info['etag'] = response.headers.get('ETag')
+            response_info['last_modified'] = response.headers.get('Last-Modified')
+
+        content_type = response.headers.get('Content-Type', '').split(';')[0].strip().lower()
+        if content_type and not content_type.startswith(ACCEPTED_CONTENT_TYPES):
+            raise DownloadRejected(f"이미지가 아닌 응답입니다: {content_type}")
+
+        content_length = response.headers.get('Content-Length')
+        if content_length and content_length.isdigit() and int(content_length) > max_bytes:
+            raise DownloadRejected(f"응답이 너무 큽니다: {int(content_length):,} bytes")
+
+        spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MEMORY_BYTES)
+        try:
+            received = 0
+            head = bytearray()
+            probed = False
+            probe_at = PROBE_BYTES
+
+            for chunk in response.iter_content(DOWNLOAD_CHUNK_SIZE):
+                if cancel_event is not None and cancel_event.is_set():
+                    raise DownloadCancelled(url)
+
+                received += len(chunk)
+                if received > max_bytes:
+                    raise DownloadRejected(f"응답이 {max_bytes:,} bytes 제한을 넘었습니다")
+
+                spool.write(chunk)
+                if not probed:
+                    head.extend(chunk)
+                    if len(head) >= probe_at:
+                        partial = len(head) < PROBE_MAX_BYTES
+                        if probe_image_header(bytes(head), partial=partial) is not None:
+                            probed = True
+                            head = bytearray()
+                        else:
+                            probe_at *= 2
+
+            if not probed:
+                probe_image_header(bytes(head))
+
+            spool.seek(0)
+            return spool
+        except (DownloadCancelled, DownloadRejected):
+            spool.close()
+            raise
+        except BaseException:
+            spool.close()
+            # abort_response 로 끊긴 연결의 읽기 오류는 취소로 보고
+            if cancel_event is not None and cancel_event.is_set():
+                raise DownloadCancelled(url)
+            raise
+
+
+def fetch_bytes(url: str, timeout: int = 30, headers: Optional[Dict] = None,
+                cancel_event: Optional[threading.Event] = None,
+                max_bytes: int = MAX_DOWNLOAD_BYTES) -> bytes:
+    """URL에서 원본 바이트 다운로드 (fetch_stream과 같은 검사 적용)"""
+    with fetch_stream(url, timeout=timeout, headers=headers, cancel_event=cancel_event,
+                      max_bytes=max_bytes) as stream:
+        return stream.read()
+
+
+def stream_digest(stream: io.IOBase) -> str:
+    """탐색 가능한 스트림 내용의 해시 (읽은 뒤 위치 0으로 되돌림)"""
+    digest = hashlib.blake2b(digest_size=16)
+    stream.seek(0)
+    for chunk in iter(lambda: stream.read(DOWNLOAD_CHUNK_SIZE), b''):
+        digest.update(chunk)
+    stream.seek(0)
+    return digest.hexdigest()
+
+
+def open_image(source: Union[bytes, str, Path, io.IOBase]) -> Image.Image:
+    """바이트/경로/파일 객체에서 이미지 열기 (디코딩은 지연됨)"""
+    if isinstance(source, (bytes, bytearray)):
+        source = io.BytesIO(source)
+    return Image.open(source)
+
+
+def process_image(img: Image.Image, size: Tuple[int, int] = DEFAULT_SIZE,
+                  reducing_gap: Optional[float] = DEFAULT_REDUCING_GAP,
+                  box: Optional[Tuple[float, float, float, float]] = None) -> Image.Image:
+    """열린 이미지를 목표 크기의 RGB 이미지로 변환
+
+    실제로 투명한 RGBA 이미지만 RGBA 상태로 축소한 뒤 흰 배경에 합성하고,
+    나머지는 3채널로 바꿔 축소합니다 (4채널 LANCZOS는 약 2배 느림).
+    """
+    if box is None:
+        prepare_draft(img, size)
+    if img.mode != 'RGB':
+        img = img.convert('RGB') if is_opaque(img) else img.convert('RGBA')
+    img = resize_and_crop(img, size, box=box, reducing_gap=reducing_gap)
+    return to_rgb(img)
+
+
+def save_image(img: Image.Image, output_path: Union[str, Path], codec: str = 'webp', **options) -> Path:
+    """지정한 코덱으로 저장 (options 로 코덱 기본값 덮어쓰기)"""
+    if codec not in CODECS:
+        raise ValueError(f"지원하지 않는 코덱입니다: {codec} (가능: {', '.join(CODECS)})")
+
+    spec = CODECS[codec]
+    save_options = dict(spec['options'])
+    save_options.update(options)
+
+    output_path = Path(output_path)
+    img.save(output_path, spec['format'], **save_options)
+    return output_path
+
+
+def download_and_convert_image(url: str, output_path: Union[str, Path], size: Tuple[int, int] = DEFAULT_SIZE,
+                               codec: str = 'webp', reducing_gap: Optional[float] = DEFAULT_REDUCING_GAP,
+                               timeout: int = 30, **options) -> bool:
+    """웹에서 이미지를 다운로드하고 목표 크기/코덱으로 변환"""
+    try:
+        with fetch_stream(url, timeout=timeout) as stream:
+            img = process_image(open_image(stream), size, reducing_gap=reducing_gap)
+        save_image(img, output_path, codec=codec, **options)
+        print(f"✅ 이미지 다운로드 및 변환 완료: {output_path}")
+        return True
+
+    except Exception as e:
+        print(f"❌ 이미지 다운로드 실패 ({url}): {e}")
+        return False
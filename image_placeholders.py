@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+썸네일 저화질 플레이스홀더(LQIP) 생성
+
+썸네일마다 16px 너비의 WebP data URI(약 100~200 bytes)와 평균 색을 만들어
+_data/placeholders.json 에 page.path 키로 모아 둡니다. index.html 포스트 카드는 이 값을
+배경으로 인라인해 실제 썸네일이 도착하기 전에도 흐린 미리보기를 보여 줍니다.
+
+축소는 Image.reduce 로 정수 배율까지 줄인 뒤 NumPy 영역 평균으로 처리해 이미지당 수 ms 입니다.
+auto_thumbnail_generator.py 는 썸네일을 만들 때 자동으로 기록하고,
+이 스크립트는 이미 있는 썸네일로 데이터 파일을 채울 때 사용합니다.
+
+썸네일 대부분이 front matter image 의 CDN(R2) URL 이라 저장소만으로는 만들 수 없으므로
+_data/placeholders.json 은 커밋하지 않고 Pages 워크플로가 빌드마다 --remote 로 만듭니다.
+이전 빌드의 파일을 캐시에서 복원해 두면 새 포스트나 image URL 이 바뀐 포스트만 받습니다
+(원격 항목은 받은 URL 을 image 키로 기록해 비교).
+
+사용법:
+    python image_placeholders.py                 # assets/img/posts/*.webp → 같은 이름의 포스트
+    python image_placeholders.py --remote        # front matter image 의 원격 URL 도 받아서 생성
+"""
+
+import base64
+import io
+import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+import numpy as np
+import yaml
+from PIL import Image
+
+import image_pipeline
+
+DATA_PATH = Path('_data/placeholders.json')
+PLACEHOLDER_WIDTH = 16
+PLACEHOLDER_QUALITY = 40
+# 영역 평균 전에 Image.reduce 로 줄여 둘 최소 크기 (목표 너비의 배수)
+REDUCE_MARGIN = 8
+
+FRONT_MATTER_PATTERN = re.compile(r'\A---\s*\n(.*?)\n---', re.DOTALL)
+
+
+def post_key(post_file: Union[str, Path]) -> str:
+    """Liquid page.path 와 같은 키 (_posts/<파일명>)"""
+    return f"_posts/{Path(post_file).name}"
+
+
+def area_downsample(img: Image.Image, width: int = PLACEHOLDER_WIDTH) -> np.ndarray:
+    """영역 평균으로 width 너비까지 축소한 (h, w, 3) uint8 배열 (비율 유지)"""
+    draft_w = width * REDUCE_MARGIN
+    image_pipeline.prepare_draft(img, (draft_w, max(1, img.height * draft_w // img.width)))
+    img = image_pipeline.to_rgb(img)
+
+    factor = img.width // (width * REDUCE_MARGIN)
+    if factor > 1:
+        img = img.reduce(factor)
+
+    pixels = np.asarray(img, dtype=np.float32)
+    h, w = pixels.shape[:2]
+    target_w = min(width, w)
+    target_h = max(1, min(h, round(target_w * h / w)))
+    block_h, block_w = h // target_h, w // target_w
+    pixels = pixels[:target_h * block_h, :target_w * block_w]
+    blocks = pixels.reshape(target_h, block_h, target_w, block_w, 3).mean(axis=(1, 3))
+    return blocks.round().astype(np.uint8)
+
+
+def make_placeholder(img: Image.Image, width: int = PLACEHOLDER_WIDTH) -> Dict[str, str]:
+    """{'src': WebP data URI, 'color': 평균 색 #rrggbb}"""
+    small = area_downsample(img, width)
+    buffer = io.BytesIO()
+    Image.fromarray(small).save(buffer, 'WEBP', quality=PLACEHOLDER_QUALITY, method=6)
+    mean = small.reshape(-1, 3).mean(axis=0).round().astype(int)
+    return {
+        'src': 'data:image/webp;base64,' + base64.b64encode(buffer.getvalue()).decode('ascii'),
+        'color': '#{:02x}{:02x}{:02x}'.format(*mean),
+    }
+
+
+def placeholder_for_file(path: Union[str, Path, io.IOBase, bytes]) -> Dict[str, str]:
+    with image_pipeline.open_image(path) as img:
+        return make_placeholder(img)
+
+
+class PlaceholderStore:
+    """_data/placeholders.json 읽기/쓰기 ({page.path: {'src', 'color'}})"""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.data: Dict[str, Dict[str, str]] = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            self.data = {}
+
+    def __contains__(self, post_file) -> bool:
+        return post_key(post_file) in self.data
+
+    def set(self, post_file, placeholder: Dict[str, str]) -> None:
+        self.data[post_key(post_file)] = placeholder
+
+    def record(self, post_file, image_path: Union[str, Path]) -> Optional[Dict[str, str]]:
+        """이미지 파일로 플레이스홀더를 만들어 기록 (읽을 수 없으면 None)"""
+        try:
+            placeholder = placeholder_for_file(image_path)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ 플레이스홀더 생성 실패 ({image_path}): {e}")
+            return None
+        self.set(post_file, placeholder)
+        return placeholder
+
+    def prune(self, post_files) -> int:
+        """목록에 없는 포스트의 항목 삭제 → 삭제 개수"""
+        keep = {post_key(post_file) for post_file in post_files}
+        stale = [key for key in self.data if key not in keep]
+        for key in stale:
+            del self.data[key]
+        return len(stale)
+
+    def save(self) -> bool:
+        """내용이 바뀐 경우에만 저장 → 저장 여부"""
+        payload = json.dumps(dict(sorted(self.data.items())), ensure_ascii=False, indent=2) + '\n'
+        if self.path.exists() and self.path.read_text(encoding='utf-8') == payload:
+            return False
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(payload, encoding='utf-8')
+        return True
+
+
+def front_matter_image(post_path: Path) -> Optional[str]:
+    """포스트 front matter 의 image 값"""
+    match = FRONT_MATTER_PATTERN.match(post_path.read_text(encoding='utf-8'))
+    if not match:
+        return None
+    try:
+        metadata = yaml.safe_load(match.group(1)) or {}
+    except yaml.YAMLError:
+        return None
+    return metadata.get('image')
+
+
+def main():
+    """메인 실행 함수"""
+    import argparse
+
+    workspace = Path(os.path.dirname(os.path.abspath(__file__)))
+
+    parser = argparse.ArgumentParser(description='썸네일 저화질 플레이스홀더 데이터 생성')
+    parser.add_argument('--images', default=str(workspace / 'assets' / 'img' / 'posts'),
+                        help='썸네일 디렉토리 (기본값: assets/img/posts)')
+    parser.add_argument('--remote', action='store_true', help='로컬 썸네일이 없으면 front matter image URL 에서 받기')
+    parser.add_argument('--force', action='store_true', help='이미 있는 항목도 다시 생성')
+    parser.add_argument('--workers', type=int, default=8, help='원격 다운로드 스레드 수 (기본값: 8)')
+    args = parser.parse_args()
+
+    store = PlaceholderStore(workspace / DATA_PATH)
+    posts = sorted((workspace / '_posts').glob('*.md'))
+    images_dir = Path(args.images)
+
+    def source_for(post_path: Path):
+        local = images_dir / f"{post_path.stem}.webp"
+        if local.exists():
+            return local
+        image = front_matter_image(post_path)
+        if not image:
+            return None
+        if image.startswith('/'):
+            path = workspace / image.lstrip('/')
+            return path if path.exists() else None
+        return image if args.remote and image.startswith('http') else None
+
+    def needs_update(post_path: Path, source) -> bool:
+        entry = store.data.get(post_key(post_path))
+        if args.force or entry is None:
+            return True
+        # 원격 이미지 URL 이 바뀐 포스트는 다시 생성
+        return isinstance(source, str) and entry.get('image', source) != source
+
+    jobs = [(post_path, source_for(post_path)) for post_path in posts]
+    jobs = [(post_path, source) for post_path, source in jobs if source and needs_update(post_path, source)]
+
+    def build(job):
+        post_path, source = job
+        try:
+            if not isinstance(source, str):
+                return post_path, placeholder_for_file(source)
+            return post_path, dict(placeholder_for_file(image_pipeline.fetch_bytes(source)), image=source)
+        except Exception as e:
+            print(f"⚠️ {post_path.name}: {e}")
+            return post_path, None
+
+    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as executor:
+        results = list(executor.map(build, jobs))
+
+    created = 0
+    for post_path, placeholder in results:
+        if placeholder:
+            store.set(post_path, placeholder)
+            created += 1
+    removed = store.prune(posts)
+    saved = store.save()
+
+    print(f"✅ 플레이스홀더 {created}개 생성, {removed}개 삭제, 총 {len(store.data)}개"
+          f"{'' if saved else ' (변경 없음)'} → {store.path}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+일괄 이미지 처리의 메모리 한도와 사용량 보고
+
+한 장의 썸네일을 만드는 동안 원본 응답 바이트, 디코딩된 원본, 리사이즈 사본, RGBA 오버레이,
+RGBA 합성본이 동시에 살아 있어 큰 원본이 여러 장 겹치면 빌드 컨테이너가 OOM 으로 죽을 수 있습니다.
+
+    - estimate_image_bytes: 헤더만 읽어(JPEG 은 draft 배율 반영) 한 장 처리에 필요한 메모리 추정
+      (스트림을 넘기면 본문을 메모리로 읽기 전에 예약할 수 있음)
+    - MemoryBudget: 추정치 합이 한도를 넘지 않도록 동시에 처리 중인 이미지 수를 제한
+      (한도보다 큰 이미지도 혼자서는 처리되도록 처리 중인 항목이 없으면 바로 통과)
+    - MemoryMonitor: 실행 동안 tracemalloc 으로 할당 위치를 추적하고
+      끝나면 최대 RSS(본 프로세스/자식 프로세스)와 상위 할당 위치를 출력
+
+Pillow 이미지 버퍼는 tracemalloc 에 잡히지 않으므로 상위 할당 위치는 응답 바이트/NumPy 배열 등
+Python 쪽 할당만 보여 줍니다. 전체 사용량은 최대 RSS 로 확인합니다.
+"""
+
+import io
+import sys
+import threading
+import time
+import tracemalloc
+from typing import IO, Optional, Tuple, Union
+
+from PIL import Image
+
+import image_pipeline
+
+MB = 1024 * 1024
+DEFAULT_BUDGET_MB = 1024
+TOP_ALLOCATIONS = 5
+
+# 출력 크기 기준 중간 이미지: 리사이즈 RGB + RGBA 오버레이 + RGBA 변환본 + RGBA 합성본 + 최종 RGB
+OUTPUT_INTERMEDIATE_BANDS = 3 + 4 + 4 + 4 + 3
+
+
+def estimate_image_bytes(source: Union[bytes, IO[bytes]],
+                         size: Tuple[int, int] = image_pipeline.DEFAULT_SIZE) -> int:
+    """원본으로 썸네일 한 장 처리에 필요한 메모리 추정 (원본 + 디코딩본 + 중간 이미지)
+
+    원본은 바이트 또는 탐색 가능한 스트림이며, 스트림은 크기와 헤더만 읽고 위치를 0 으로 되돌립니다.
+    JPEG 은 draft 로 줄어드는 디코딩 크기를 반영합니다.
+    """
+    if isinstance(source, (bytes, bytearray)):
+        length, stream = len(source), io.BytesIO(source)
+    else:
+        length, stream = source.seek(0, io.SEEK_END), source
+        stream.seek(0)
+
+    output = size[0] * size[1] * OUTPUT_INTERMEDIATE_BANDS
+    try:
+        with Image.open(stream) as probe:
+            image_pipeline.prepare_draft(probe, size)
+            bands = 4 if image_pipeline.has_alpha(probe) else 3
+            decoded = probe.width * probe.height * bands
+    except Exception:
+        # 헤더를 읽을 수 없으면 출력 크기 원본으로 가정 (디코딩 단계에서 실패 처리됨)
+        decoded = size[0] * size[1] * 3
+    finally:
+        stream.seek(0)
+    return length + decoded + output
+
+
+class MemoryBudget:
+    """추정 메모리 합이 limit_bytes 를 넘지 않도록 처리 중인 항목 수를 제한 (스레드 안전)"""
+
+    def __init__(self, limit_bytes: int):
+        if limit_bytes <= 0:
+            raise ValueError(f"메모리 한도는 0 보다 커야 합니다: {limit_bytes}")
+        self.limit = limit_bytes
+        self.in_use = 0
+        self.in_flight = 0
+        self.peak = 0
+        self.peak_in_flight = 0
+        self.waits = 0
+        self.wait_seconds = 0.0
+        self._condition = threading.Condition()
+
+    def acquire(self, nbytes: int) -> int:
+        """nbytes 를 예약할 수 있을 때까지 대기 → 예약한 바이트 (release 에 그대로 넘김)"""
+        with self._condition:
+            if self.in_flight and self.in_use + nbytes > self.limit:
+                self.waits += 1
+                start = time.perf_counter()
+                self._condition.wait_for(lambda: not self.in_flight or self.in_use + nbytes <= self.limit)
+                self.wait_seconds += time.perf_counter() - start
+            self.in_use += nbytes
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_use)
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        return nbytes
+
+    def release(self, nbytes: int) -> None:
+        with self._condition:
+            self.in_use -= nbytes
+            self.in_flight -= 1
+            self._condition.notify_all()
+
+    def report(self) -> None:
+        print(f"🧮 메모리 한도 {self.limit / MB:,.0f}MB: 최대 예약 {self.peak / MB:,.1f}MB,"
+              f" 최대 동시 처리 {self.peak_in_flight}개, 대기 {self.waits}회 ({self.wait_seconds:.2f}s)")
+
+
+def peak_rss_bytes() -> Tuple[Optional[int], Optional[int]]:
+    """(본 프로세스, 가장 큰 자식 프로세스) 최대 RSS 바이트. resource 모듈이 없으면 None"""
+    try:
+        import resource
+    except ImportError:
+        return None, None
+    # ru_maxrss 단위: Linux 는 KB, macOS 는 바이트
+    unit = 1 if sys.platform == 'darwin' else 1024
+    return (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * unit,
+            resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * unit)
+
+
+class MemoryMonitor:
+    """with 블록 동안 tracemalloc 으로 할당을 추적하고 끝나면 보고
+
+    처리 중간에 sample() 을 부르면 추적 중인 메모리가 가장 컸던 시점의 스냅숏을 보관해
+    그 시점의 상위 할당 위치를 보여 줍니다 (부르지 않으면 종료 시점 기준).
+
+    with MemoryMonitor() as monitor:
+        ...  # 일괄 처리, 항목마다 monitor.sample()
+    """
+
+    def __init__(self, top: int = TOP_ALLOCATIONS, frames: int = 1):
+        self.top = top
+        self.frames = frames
+        self.snapshot: Optional[tracemalloc.Snapshot] = None
+        self.snapshot_bytes = 0
+        self.traced_peak = 0
+        self._started = False
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._started = True
+        tracemalloc.reset_peak()
+        return self
+
+    def sample(self) -> None:
+        """지금 추적 중인 메모리가 지금까지보다 크면 스냅숏 갱신"""
+        if not tracemalloc.is_tracing():
+            return
+        with self._lock:
+            current = tracemalloc.get_traced_memory()[0]
+            if current > self.snapshot_bytes:
+                self.snapshot = tracemalloc.take_snapshot()
+                self.snapshot_bytes = current
+
+    def __exit__(self, exc_type, exc, tb):
+        if self.snapshot is None:
+            self.sample()
+        self.traced_peak = tracemalloc.get_traced_memory()[1]
+        if self._started:
+            tracemalloc.stop()
+        self.report()
+        return False
+
+    def report(self) -> None:
+        rss, children = peak_rss_bytes()
+        if rss is not None:
+            print(f"📈 최대 RSS {rss / MB:,.1f}MB (자식 프로세스 최대 {children / MB:,.1f}MB),"
+                  f" Python 할당 최대 {self.traced_peak / MB:,.1f}MB")
+        if self.snapshot is None:
+            return
+        snapshot = self.snapshot.filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap*>'),
+            tracemalloc.Filter(False, '<unknown>'),
+        ))
+        stats = snapshot.statistics('lineno')[:self.top]
+        if stats:
+            print(f"   할당이 가장 많던 시점({self.snapshot_bytes / MB:,.1f}MB)의 상위 할당 위치:")
+        for stat in stats:
+            frame = stat.traceback[0]
+            print(f"   {stat.size / 1024:>10,.1f}KB {stat.count:>7,}개  {frame.filename}:{frame.lineno}")
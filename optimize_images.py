@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+"""
+저장소 전체 이미지 무손실 최적화
+
+저장소를 훑어 PNG/JPEG 를 워커 프로세스로 병렬 처리하고 디렉토리별 절감 바이트를 출력합니다.
+
+- JPEG: 엔트로피 코딩 데이터는 건드리지 않고 EXIF/XMP/IPTC/주석 세그먼트만 제거 (무손실)
+        jpegtran 이 설치되어 있으면 허프만 테이블 최적화까지 적용 (역시 무손실)
+        ICC 프로파일, Adobe 색공간 정보, 회전이 필요한 EXIF 는 남김
+- PNG:  텍스트/시간/dpi 청크를 빼고 optimize=True 로 다시 인코딩, 색이 256개 이하면 팔레트로 변환
+        다시 읽은 픽셀이 원본과 같을 때만 채택
+- 결과가 원본보다 작을 때만 파일을 씀
+- --webp / --avif 로 같은 이름의 WebP/AVIF 사본 생성
+- 처리한 파일의 내용 해시를 .thumbnail_cache/image_optimize_cache.json 에 기록해
+  다음 실행에서는 바뀐 파일만 다시 처리
+
+사용법:
+    python optimize_images.py                      # 저장소 전체
+    python optimize_images.py assets neon_1.jpg --webp
+    python optimize_images.py --check              # 쓰지 않고 절감량만 보고
+"""
+
+import hashlib
+import io
+import json
+import os
+import shutil
+import subprocess
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from PIL import Image, ImageOps
+
+import image_pipeline
+
+CACHE_PATH = Path('.thumbnail_cache/image_optimize_cache.json')
+SOURCE_SUFFIXES = {'.png': 'png', '.jpg': 'jpeg', '.jpeg': 'jpeg'}
+SIBLING_CODECS = ('webp', 'avif')
+SKIP_DIRS = {'.git', '_site', '.jekyll-cache', '.sass-cache', '.thumbnail_cache', 'node_modules',
+             'vendor', '.venv', 'venv', '__pycache__'}
+
+# JPEG 마커
+SOI, SOS, EOI = 0xD8, 0xDA, 0xD9
+APP0, APP1, APP2, APP14, COM = 0xE0, 0xE1, 0xE2, 0xEE, 0xFE
+STANDALONE_MARKERS = {0x01, *range(0xD0, 0xD8)}
+EXIF_ORIENTATION = 0x0112
+
+# PNG 재인코딩 때 남길 info 키 (색 표현에 영향을 주는 것만)
+PNG_KEEP_INFO = ('transparency', 'icc_profile', 'gamma')
+
+
+def file_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _needs_orientation(data: bytes) -> bool:
+    """EXIF 회전 정보가 있어 APP1 을 지우면 보이는 방향이 바뀌는지"""
+    with Image.open(io.BytesIO(data)) as img:
+        return img.getexif().get(EXIF_ORIENTATION, 1) != 1
+
+
+def strip_jpeg_metadata(data: bytes) -> bytes:
+    """JPEG 마커 세그먼트 중 메타데이터만 제거 (픽셀 데이터는 바이트 그대로)"""
+    if data[:2] != bytes((0xFF, SOI)):
+        raise ValueError("JPEG 파일이 아닙니다")
+
+    keep_exif = _needs_orientation(data)
+    out = [data[:2]]
+    i = 2
+    while i < len(data) - 1:
+        if data[i] != 0xFF:
+            raise ValueError(f"잘못된 JPEG 마커 위치: {i}")
+        marker = data[i + 1]
+        if marker == 0xFF:  # 채움 바이트
+            i += 1
+            continue
+        if marker in (SOS, EOI):
+            # 스캔 데이터부터 끝까지는 그대로 복사
+            out.append(data[i:])
+            break
+        if marker in STANDALONE_MARKERS:
+            out.append(data[i:i + 2])
+            i += 2
+            continue
+
+        end = i + 2 + int.from_bytes(data[i + 2:i + 4], 'big')
+        segment = data[i:end]
+        is_metadata = marker == COM or (APP0 <= marker <= 0xEF and marker not in (APP0, APP2, APP14))
+        if marker == APP1 and keep_exif and segment[4:10] == b'Exif\0\0':
+            is_metadata = False
+        if marker == APP2 and not segment[4:16] == b'ICC_PROFILE\0':
+            is_metadata = True
+        if not is_metadata:
+            out.append(segment)
+        i = end
+
+    return b''.join(out)
+
+
+def _jpegtran(data: bytes) -> Optional[bytes]:
+    """jpegtran 으로 허프만 테이블 최적화 (설치되어 있지 않거나 실패하면 None)"""
+    binary = shutil.which('jpegtran')
+    if not binary:
+        return None
+    try:
+        result = subprocess.run([binary, '-copy', 'all', '-optimize', '-progressive'],
+                                input=data, capture_output=True, check=True, timeout=120)
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
+        return None
+    return result.stdout or None
+
+
+def optimize_jpeg(data: bytes) -> bytes:
+    """무손실 JPEG 최적화 결과 (원본보다 작지 않으면 원본)"""
+    stripped = strip_jpeg_metadata(data)
+    optimized = _jpegtran(stripped)
+    candidates = [data, stripped] + ([optimized] if optimized else [])
+    return min(candidates, key=len)
+
+
+def _palette_image(img: Image.Image) -> Optional[Image.Image]:
+    """색이 256개 이하인 RGB/RGBA 이미지를 같은 픽셀의 팔레트 이미지로 (아니면 None)"""
+    if img.mode not in ('RGB', 'RGBA'):
+        return None
+    colors = img.getcolors(256)
+    if not colors:
+        return None
+
+    colors = [color for _, color in colors]
+    if img.mode == 'RGBA':
+        # 투명도가 있는 색을 앞에 두어 tRNS 청크 길이를 줄임
+        colors.sort(key=lambda color: color[3] == 255)
+    lut = {color: index for index, color in enumerate(colors)}
+
+    # Pillow 12 부터 getdata 대신 get_flattened_data
+    pixels = img.get_flattened_data() if hasattr(img, 'get_flattened_data') else img.getdata()
+    palette = Image.new('P', img.size)
+    palette.putdata([lut[pixel] for pixel in pixels])
+    palette.putpalette([channel for color in colors for channel in color[:3]])
+    if img.mode == 'RGBA':
+        alphas = bytes(color[3] for color in colors)
+        palette.info['transparency'] = alphas.rstrip(b'\xff') or b'\xff'
+    return palette
+
+
+def _same_pixels(a: Image.Image, b: Image.Image) -> bool:
+    mode = 'RGBA' if image_pipeline.has_alpha(a) or image_pipeline.has_alpha(b) else 'RGB'
+    if a.mode == b.mode and a.mode not in ('P', 'PA'):
+        return a.tobytes() == b.tobytes()
+    return a.convert(mode).tobytes() == b.convert(mode).tobytes()
+
+
+def optimize_png(data: bytes) -> bytes:
+    """메타데이터 청크를 빼고 다시 인코딩한 PNG 중 가장 작은 것 (픽셀이 같을 때만)"""
+    with Image.open(io.BytesIO(data)) as img:
+        if getattr(img, 'is_animated', False):
+            return data
+        img.load()
+
+        candidates = [img]
+        palette = _palette_image(img)
+        if palette is not None:
+            candidates.append(palette)
+
+        best = data
+        for candidate in candidates:
+            options = {key: candidate.info[key] for key in PNG_KEEP_INFO if key in candidate.info}
+            buffer = io.BytesIO()
+            candidate.save(buffer, 'PNG', optimize=True, **options)
+            encoded = buffer.getvalue()
+            if len(encoded) >= len(best):
+                continue
+            with Image.open(io.BytesIO(encoded)) as check:
+                if _same_pixels(img, check):
+                    best = encoded
+    return best
+
+
+def write_siblings(path: Path, data: bytes, codecs: Iterable[str]) -> Dict[str, int]:
+    """WebP/AVIF 사본 생성 → {사본 경로: 바이트}"""
+    sizes = {}
+    codecs = list(codecs)
+    if not codecs:
+        return sizes
+
+    with Image.open(io.BytesIO(data)) as img:
+        img = ImageOps.exif_transpose(img)
+        if img.mode not in ('RGB', 'RGBA'):
+            img = img.convert('RGBA' if image_pipeline.has_alpha(img) else 'RGB')
+        for codec in codecs:
+            sibling = path.with_suffix(image_pipeline.CODECS[codec]['suffix'])
+            image_pipeline.save_image(img, sibling, codec=codec)
+            sizes[str(sibling)] = sibling.stat().st_size
+    return sizes
+
+
+def optimize_file(path: Path, codecs: Iterable[str] = (), check: bool = False) -> Dict:
+    """파일 하나 최적화 → 결과 (before/after 바이트, 최종 해시, 사본 크기)"""
+    path = Path(path)
+    data = path.read_bytes()
+    kind = SOURCE_SUFFIXES[path.suffix.lower()]
+    try:
+        optimized = optimize_jpeg(data) if kind == 'jpeg' else optimize_png(data)
+    except (ValueError, OSError) as e:
+        return {'path': str(path), 'error': str(e)}
+
+    if not check and len(optimized) < len(data):
+        path.write_bytes(optimized)
+    siblings = {} if check else write_siblings(path, optimized, codecs)
+
+    return {
+        'path': str(path),
+        'before': len(data),
+        'after': len(optimized),
+        'sha256': file_hash(optimized),
+        'siblings': siblings,
+    }
+
+
+def _process(args):
+    path, codecs, check = args
+    return optimize_file(path, codecs, check)
+
+
+def collect_images(paths: List[Path]) -> List[Path]:
+    """파일/디렉토리 인자 → PNG/JPEG 목록 (빌드 산출물/캐시/의존성 디렉토리 제외)"""
+    files = []
+    for path in paths:
+        if path.is_file():
+            if path.suffix.lower() in SOURCE_SUFFIXES:
+                files.append(path)
+            continue
+        for root, dirs, names in os.walk(path):
+            dirs[:] = sorted(d for d in dirs if d not in SKIP_DIRS)
+            files.extend(Path(root) / name for name in sorted(names)
+                         if Path(name).suffix.lower() in SOURCE_SUFFIXES)
+    return files
+
+
+def load_cache(cache_path: Path) -> Dict[str, Dict]:
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def save_cache(cache_path: Path, cache: Dict[str, Dict]) -> None:
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(cache_path, 'w', encoding='utf-8') as f:
+        json.dump(cache, f, ensure_ascii=False, indent=2, sort_keys=True)
+
+
+def is_cached(path: Path, entry: Optional[Dict], codecs: Iterable[str]) -> bool:
+    """이전 실행의 최종 해시와 같고 요청한 사본이 모두 있으면 건너뜀"""
+    if not entry or entry.get('sha256') != file_hash(path.read_bytes()):
+        return False
+    return all(path.with_suffix(image_pipeline.CODECS[codec]['suffix']).exists() for codec in codecs)
+
+
+def directory_report(results: List[Dict], workspace: Path) -> List[Tuple[str, int, int, int, int]]:
+    """디렉토리별 (경로, 파일 수, before, after, 사본 바이트) 목록, 절감량 큰 순서"""
+    totals = defaultdict(lambda: [0, 0, 0, 0])
+    for result in results:
+        path = Path(result['path'])
+        try:
+            directory = str(path.parent.resolve().relative_to(workspace)) or '.'
+        except ValueError:
+            directory = str(path.parent)
+        row = totals[directory]
+        row[0] += 1
+        row[1] += result['before']
+        row[2] += result['after']
+        row[3] += sum(result['siblings'].values())
+    rows = [(directory, *values) for directory, values in totals.items()]
+    return sorted(rows, key=lambda row: (row[2] - row[3], row[0]), reverse=True)
+
+
+def main():
+    """메인 실행 함수"""
+    import argparse
+
+    workspace = Path(os.path.dirname(os.path.abspath(__file__)))
+
+    parser = argparse.ArgumentParser(description='저장소 PNG/JPEG 무손실 최적화와 절감량 보고')
+    parser.add_argument('paths', nargs='*', default=[str(workspace)],
+                        help='처리할 파일 또는 디렉토리 (기본값: 저장소 전체)')
+    parser.add_argument('--webp', action='store_true', help='같은 이름의 .webp 사본 생성')
+    parser.add_argument('--avif', action='store_true', help='같은 이름의 .avif 사본 생성')
+    parser.add_argument('--check', action='store_true', help='파일을 쓰지 않고 절감 가능한 바이트만 보고')
+    parser.add_argument('--force', action='store_true', help='해시 캐시를 무시하고 모두 다시 처리')
+    parser.add_argument('--workers', type=int, default=None, help='워커 프로세스 수 (기본값: CPU 수)')
+    args = parser.parse_args()
+
+    codecs = [codec for codec in SIBLING_CODECS if getattr(args, codec)]
+    cache_path = workspace / CACHE_PATH
+    cache = load_cache(cache_path)
+
+    def cache_key(path: Path) -> str:
+        try:
+            return str(path.resolve().relative_to(workspace))
+        except ValueError:
+            return str(path.resolve())
+
+    files = collect_images([Path(p) for p in args.paths])
+    pending = [path for path in files
+               if args.force or args.check or not is_cached(path, cache.get(cache_key(path)), codecs)]
+    print(f"🖼️  이미지 {len(files)}개 중 {len(pending)}개 처리 ({len(files) - len(pending)}개는 해시가 같아 건너뜀)")
+    if not pending:
+        return 0
+
+    workers = args.workers or os.cpu_count() or 1
+    jobs = [(path, codecs, args.check) for path in pending]
+    if workers == 1 or len(jobs) == 1:
+        results = list(map(_process, jobs))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_process, jobs, chunksize=max(1, len(jobs) // (workers * 4))))
+
+    failed = [result for result in results if 'error' in result]
+    done = [result for result in results if 'error' not in result]
+    for result in failed:
+        print(f"❌ {result['path']}: {result['error']}")
+
+    if not args.check:
+        for result in done:
+            cache[cache_key(Path(result['path']))] = {'sha256': result['sha256']}
+        save_cache(cache_path, cache)
+
+    rows = directory_report(done, workspace.resolve())
+    print(f"\n{'디렉토리':<40} {'파일':>5} {'before':>12} {'after':>12} {'절감':>12} {'%':>6} {'사본':>12}")
+    print("-" * 106)
+    for directory, count, before, after, siblings in rows:
+        saved = before - after
+        print(f"{directory:<40} {count:>5} {before:>12,} {after:>12,} {saved:>12,} "
+              f"{saved / before * 100 if before else 0:>5.1f}% {siblings:>12,}")
+    before = sum(row[2] for row in rows)
+    after = sum(row[3] for row in rows)
+    print("-" * 106)
+    print(f"{'합계':<40} {len(done):>5} {before:>12,} {after:>12,} {before - after:>12,} "
+          f"{(before - after) / before * 100 if before else 0:>5.1f}% {sum(row[4] for row in rows):>12,}")
+    verb = "절감 가능" if args.check else "절감"
+    print(f"\n✅ {before - after:,} bytes {verb}" + (f", 실패 {len(failed)}개" if failed else ""))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+단계별 파이프라인 실행기 (크기 제한 큐 + 단계별 사용률 통계)
+
+항목 하나를 처음부터 끝까지 한 워커가 붙잡고 있으면 네트워크 대기와 CPU 작업이 겹치지 않습니다.
+Pipeline 은 단계마다 워커를 따로 두고 단계 사이를 크기 제한 큐로 이어
+    - I/O 단계(kind='thread'): 스레드 워커
+    - CPU 단계(kind='process'): 프로세스 풀 (단계 함수는 모듈 최상위 함수여야 함)
+가 동시에 돌게 합니다. 다음 단계가 밀리면 큐가 차서 앞 단계가 멈추므로(backpressure)
+처리 중인 항목 수가 제한되고, 전체 처리량은 가장 느린 단계의 처리량에 수렴합니다.
+
+단계 함수는 항목 하나를 받아 다음 단계의 입력을 반환합니다. None 을 반환하면 항목을 버리고,
+예외가 나면 그 항목만 실패로 기록합니다. 버려지거나 실패한 항목은 on_discard(입력 항목) 로 알려
+예약해 둔 자원을 돌려줄 수 있게 합니다.
+
+사용 예:
+    pipeline = Pipeline([
+        Stage('fetch', fetch, workers=8),
+        Stage('render', render, workers=4, kind='process'),
+        Stage('write', write),
+    ], queue_size=4)
+    results = pipeline.run(items)
+    pipeline.report()
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Iterable, List, Optional, Sequence
+
+STAGE_KINDS = ('thread', 'process')
+DEFAULT_QUEUE_SIZE = 4
+
+_DONE = object()
+
+
+class Stage:
+    """파이프라인 단계 정의"""
+
+    def __init__(self, name: str, func: Callable[[Any], Any], workers: int = 1, kind: str = 'thread',
+                 initializer: Optional[Callable] = None, initargs: tuple = ()):
+        if kind not in STAGE_KINDS:
+            raise ValueError(f"지원하지 않는 단계 종류입니다: {kind} (가능: {', '.join(STAGE_KINDS)})")
+        if workers <= 0:
+            raise ValueError(f"단계 워커 수는 0 보다 커야 합니다: {name}={workers}")
+        self.name = name
+        self.func = func
+        self.workers = workers
+        self.kind = kind
+        # 프로세스 단계의 워커 초기화 함수 (ProcessPoolExecutor initializer)
+        self.initializer = initializer
+        self.initargs = initargs
+
+
+class StageStats:
+    """단계별 처리 통계
+
+    busy    단계 함수 실행 시간 합 (프로세스 단계는 전달/직렬화 포함)
+    idle    입력 큐가 비어 기다린 시간 합 (앞 단계가 느림)
+    blocked 출력 큐가 차서 기다린 시간 합 (뒤 단계가 느림)
+    """
+
+    def __init__(self, name: str, kind: str, workers: int):
+        self.name = name
+        self.kind = kind
+        self.workers = workers
+        self.processed = 0
+        self.dropped = 0
+        self.failed = 0
+        self.busy = 0.0
+        self.idle = 0.0
+        self.blocked = 0.0
+        self._lock = threading.Lock()
+
+    def add(self, **values):
+        with self._lock:
+            for key, value in values.items():
+                setattr(self, key, getattr(self, key) + value)
+
+    def utilisation(self, wall: float) -> float:
+        """워커가 실제로 일한 시간 비율 (0 ~ 1)"""
+        return self.busy / (self.workers * wall) if wall > 0 else 0.0
+
+
+class Pipeline:
+    """Stage 목록을 크기 제한 큐로 연결해 실행"""
+
+    def __init__(self, stages: Sequence[Stage], queue_size: int = DEFAULT_QUEUE_SIZE,
+                 on_discard: Optional[Callable[[Any], None]] = None):
+        if not stages:
+            raise ValueError("단계가 하나 이상 필요합니다")
+        if queue_size <= 0:
+            raise ValueError(f"큐 크기는 0 보다 커야 합니다: {queue_size}")
+        self.stages = list(stages)
+        self.queue_size = queue_size
+        self.on_discard = on_discard
+        self.stats: List[StageStats] = []
+        self.wall = 0.0
+        self.source_blocked = 0.0
+
+    def run(self, items: Iterable) -> List:
+        """모든 항목을 처리하고 마지막 단계 결과를 완료 순서대로 반환"""
+        self.stats = [StageStats(stage.name, stage.kind, stage.workers) for stage in self.stages]
+        self.source_blocked = 0.0
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in self.stages]
+        results: List = []
+        results_lock = threading.Lock()
+        remaining = [stage.workers for stage in self.stages]
+        remaining_lock = threading.Lock()
+
+        pools = {i: ProcessPoolExecutor(max_workers=stage.workers, initializer=stage.initializer,
+                                        initargs=stage.initargs)
+                 for i, stage in enumerate(self.stages) if stage.kind == 'process'}
+
+        def discard(item):
+            if self.on_discard is not None:
+                try:
+                    self.on_discard(item)
+                except Exception as e:
+                    print(f"⚠️ on_discard 처리 중 오류: {e}")
+
+        def work(index: int):
+            stage, stats, inbox = self.stages[index], self.stats[index], queues[index]
+            last = index == len(self.stages) - 1
+            pool = pools.get(index)
+
+            while True:
+                # 다음 입력을 기다리는 동안 이미 넘긴 항목을 붙잡고 있지 않도록 참조를 놓음
+                item = result = None
+                start = time.perf_counter()
+                item = inbox.get()
+                stats.add(idle=time.perf_counter() - start)
+                if item is _DONE:
+                    break
+
+                start = time.perf_counter()
+                try:
+                    result = pool.submit(stage.func, item).result() if pool else stage.func(item)
+                except Exception as e:
+                    stats.add(busy=time.perf_counter() - start, failed=1)
+                    print(f"❌ [{stage.name}] 처리 중 오류: {e}")
+                    discard(item)
+                    continue
+                stats.add(busy=time.perf_counter() - start)
+
+                if result is None:
+                    stats.add(dropped=1)
+                    discard(item)
+                    continue
+                stats.add(processed=1)
+
+                if last:
+                    with results_lock:
+                        results.append(result)
+                else:
+                    start = time.perf_counter()
+                    queues[index + 1].put(result)
+                    stats.add(blocked=time.perf_counter() - start)
+
+            # 단계의 마지막 워커가 끝나면 다음 단계 워커 수만큼 종료 신호 전달
+            with remaining_lock:
+                remaining[index] -= 1
+                finished = remaining[index] == 0
+            if finished and not last:
+                for _ in range(self.stages[index + 1].workers):
+                    queues[index + 1].put(_DONE)
+
+        threads = [threading.Thread(target=work, args=(index,), name=f"{stage.name}-{n}", daemon=True)
+                   for index, stage in enumerate(self.stages) for n in range(stage.workers)]
+
+        started = time.perf_counter()
+        try:
+            for thread in threads:
+                thread.start()
+            for item in items:
+                start = time.perf_counter()
+                queues[0].put(item)
+                self.source_blocked += time.perf_counter() - start
+            for _ in range(self.stages[0].workers):
+                queues[0].put(_DONE)
+            for thread in threads:
+                thread.join()
+        finally:
+            for pool in pools.values():
+                pool.shutdown()
+            self.wall = time.perf_counter() - started
+
+        return results
+
+    def report(self) -> None:
+        """단계별 처리량/사용률 표 출력 (사용률이 가장 높은 단계가 병목)"""
+        if not self.stats:
+            return
+        print(f"{'단계':<10} {'종류':<8} {'워커':>4} {'처리':>6} {'버림':>5} {'실패':>5}"
+              f" {'busy s':>8} {'사용률':>7} {'입력대기 s':>10} {'출력대기 s':>10} {'개/s':>7}")
+        print("-" * 92)
+        for stats in self.stats:
+            rate = stats.processed / self.wall if self.wall > 0 else 0.0
+            print(f"{stats.name:<10} {stats.kind:<8} {stats.workers:>4} {stats.processed:>6} {stats.dropped:>5}"
+                  f" {stats.failed:>5} {stats.busy:>8.2f} {stats.utilisation(self.wall):>7.0%}"
+                  f" {stats.idle:>10.2f} {stats.blocked:>10.2f} {rate:>7.2f}")
+        bottleneck = max(self.stats, key=lambda stats: stats.utilisation(self.wall))
+        print(f"⏱️ 전체 {self.wall:.2f}s, 병목 단계: {bottleneck.name}"
+              f" (사용률 {bottleneck.utilisation(self.wall):.0%}), 입력 투입 대기 {self.source_blocked:.2f}s")
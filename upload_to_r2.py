@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Cloudflare R2 이미지 CDN 증분 동기화 도구
+
+assets/ 아래 파일의 콘텐츠 해시를 로컬 매니페스트에 기록해 두고,
+새로 추가되었거나 변경된 파일만 R2(S3 호환 스토리지)에 업로드합니다.
+
+- 병렬 업로드 (스레드 풀)
+- 큰 파일은 멀티파트 업로드
+- 실패 시 자동 재시도
+- --endpoint-url 로 MinIO, moto 등 임의의 S3 호환 엔드포인트 사용 가능
+"""
+
+import os
+import json
+import hashlib
+import mimetypes
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple
+
+
+# 오브젝트 키가 콘텐츠 해시 없는 고정 경로라 같은 키로 내용이 바뀔 수 있으므로
+# 짧게 캐시하고 만료 후에는 ETag 로 재검증 (immutable 은 해시가 들어간 키에만 사용)
+DEFAULT_CACHE_CONTROL = "public, max-age=3600, must-revalidate"
+MULTIPART_THRESHOLD = 8 * 1024 * 1024  # 8MB 이상은 멀티파트 업로드
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# mimetypes 기본 테이블에 없는 확장자 보완
+mimetypes.add_type('image/webp', '.webp')
+mimetypes.add_type('image/avif', '.avif')
+mimetypes.add_type('image/svg+xml', '.svg')
+
+
+def load_env_file(env_path: Path):
+    """.env 파일의 KEY=VALUE 항목을 환경변수로 로드 (이미 설정된 값은 유지)"""
+    if not env_path.exists():
+        return
+
+    with open(env_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#') or '=' not in line:
+                continue
+            key, value = line.split('=', 1)
+            os.environ.setdefault(key.strip(), value.strip().strip('"\''))
+
+
+def file_sha256(path: Path) -> str:
+    """파일 내용의 SHA-256 해시 계산 (청크 단위로 읽어 메모리 사용 최소화)"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class R2AssetSync:
+    """콘텐츠 해시 매니페스트 기반 R2 증분 동기화"""
+
+    def __init__(self, workspace_path: str, bucket: str, source_dir: str = "assets",
+                 key_prefix: str = "assets", endpoint_url: Optional[str] = None,
+                 access_key_id: Optional[str] = None, secret_access_key: Optional[str] = None,
+                 cache_control: str = DEFAULT_CACHE_CONTROL, workers: int = 8,
+                 max_attempts: int = 5):
+        self.workspace_path = Path(workspace_path)
+        self.source_dir = self.workspace_path / source_dir
+        self.key_prefix = key_prefix.strip('/')
+        self.bucket = bucket
+        self.endpoint_url = endpoint_url
+        self.access_key_id = access_key_id
+        self.secret_access_key = secret_access_key
+        self.cache_control = cache_control
+        self.workers = max(1, workers)
+        self.max_attempts = max_attempts
+
+        self.cache_dir = self.workspace_path / ".thumbnail_cache"
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.manifest_file = self.cache_dir / "r2_manifest.json"
+        self.manifest = self._load_manifest()
+
+        self._client = None
+        self._transfer_config = None
+
+    def _load_manifest(self) -> Dict:
+        """업로드 매니페스트 로드 (버킷이 바뀌었으면 빈 매니페스트로 시작)"""
+        if self.manifest_file.exists():
+            try:
+                with open(self.manifest_file, 'r', encoding='utf-8') as f:
+                    manifest = json.load(f)
+                if manifest.get('bucket') == self.bucket and manifest.get('endpoint') == self.endpoint_url:
+                    return manifest
+            except Exception as e:
+                print(f"⚠️ 매니페스트 로드 실패: {e}")
+
+        return {'bucket': self.bucket, 'endpoint': self.endpoint_url, 'files': {}}
+
+    def _save_manifest(self):
+        """업로드 매니페스트 저장 (임시 파일에 쓴 뒤 교체)"""
+        tmp_file = self.manifest_file.with_suffix('.json.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(self.manifest, f, ensure_ascii=False, indent=2, sort_keys=True)
+        tmp_file.replace(self.manifest_file)
+
+    def _get_client(self):
+        """S3 호환 클라이언트 생성 (boto3는 업로드가 필요할 때만 import)"""
+        if self._client is None:
+            try:
+                import boto3
+                from botocore.config import Config
+                from boto3.s3.transfer import TransferConfig
+            except ImportError:
+                raise RuntimeError("boto3가 설치되어 있지 않습니다: pip install boto3")
+
+            config = Config(
+                retries={'max_attempts': self.max_attempts, 'mode': 'standard'},
+                max_pool_connections=self.workers * 2,
+            )
+            self._client = boto3.client(
+                's3',
+                endpoint_url=self.endpoint_url,
+                aws_access_key_id=self.access_key_id,
+                aws_secret_access_key=self.secret_access_key,
+                region_name='auto' if self.endpoint_url and 'r2.cloudflarestorage.com' in self.endpoint_url else None,
+                config=config,
+            )
+            self._transfer_config = TransferConfig(
+                multipart_threshold=MULTIPART_THRESHOLD,
+                multipart_chunksize=MULTIPART_THRESHOLD,
+                max_concurrency=4,
+            )
+        return self._client
+
+    def object_key(self, path: Path) -> str:
+        """로컬 파일 경로를 버킷 오브젝트 키로 변환"""
+        relative = path.relative_to(self.source_dir).as_posix()
+        return f"{self.key_prefix}/{relative}" if self.key_prefix else relative
+
+    def scan_changes(self, force: bool = False) -> List[Tuple[Path, str, Dict]]:
+        """업로드가 필요한 파일 목록 계산
+
+        크기와 mtime이 매니페스트와 같으면 해시 계산을 생략하고,
+        다르면 해시를 다시 계산해 실제 내용 변경 여부를 판단합니다.
+        """
+        if not self.source_dir.exists():
+            raise FileNotFoundError(f"소스 디렉토리를 찾을 수 없습니다: {self.source_dir}")
+
+        files = self.manifest['files']
+        changed = []
+
+        for path in sorted(self.source_dir.rglob('*')):
+            if not path.is_file() or path.name.startswith('.'):
+                continue
+
+            key = self.object_key(path)
+            stat = path.stat()
+            entry = files.get(key)
+
+            if not force and entry and entry['size'] == stat.st_size and entry['mtime'] == stat.st_mtime:
+                continue
+
+            sha256 = file_sha256(path)
+            new_entry = {'sha256': sha256, 'size': stat.st_size, 'mtime': stat.st_mtime}
+
+            if not force and entry and entry['sha256'] == sha256:
+                # 내용은 같고 mtime만 바뀐 경우: 매니페스트만 갱신
+                files[key] = new_entry
+                continue
+
+            changed.append((path, key, new_entry))
+
+        return changed
+
+    def _upload_one(self, path: Path, key: str, entry: Dict) -> str:
+        """파일 하나 업로드 (멀티파트/재시도는 boto3 전송 설정이 처리)"""
+        client = self._get_client()
+        content_type = mimetypes.guess_type(path.name)[0] or 'application/octet-stream'
+        client.upload_file(
+            str(path), self.bucket, key,
+            ExtraArgs={
+                'ContentType': content_type,
+                'CacheControl': self.cache_control,
+                'Metadata': {'sha256': entry['sha256']},
+            },
+            Config=self._transfer_config,
+        )
+        return key
+
+    def sync(self, dry_run: bool = False, force: bool = False) -> Dict[str, int]:
+        """변경된 파일만 병렬 업로드하고 매니페스트 갱신"""
+        changed = self.scan_changes(force=force)
+        total_bytes = sum(entry['size'] for _, _, entry in changed)
+
+        print(f"📦 업로드 대상: {len(changed)}개 ({total_bytes / 1024:.1f} KB)")
+
+        if dry_run:
+            for path, key, _ in changed:
+                print(f"   • {path.relative_to(self.workspace_path)} -> {key}")
+            return {'uploaded': 0, 'failed': 0, 'pending': len(changed)}
+
+        if not changed:
+            self._save_manifest()
+            print("✅ 변경된 파일이 없습니다.")
+            return {'uploaded': 0, 'failed': 0, 'pending': 0}
+
+        self._get_client()
+        uploaded = 0
+        failed = 0
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = {
+                executor.submit(self._upload_one, path, key, entry): (key, entry)
+                for path, key, entry in changed
+            }
+            for future in as_completed(futures):
+                key, entry = futures[future]
+                try:
+                    future.result()
+                    self.manifest['files'][key] = entry
+                    uploaded += 1
+                    print(f"✅ 업로드 완료: {key}")
+                except Exception as e:
+                    failed += 1
+                    print(f"❌ 업로드 실패 ({key}): {e}")
+
+        # 성공한 항목만 기록되므로 실패한 파일은 다음 실행에서 다시 시도됨
+        self._save_manifest()
+
+        print(f"🎉 {uploaded}/{len(changed)}개 업로드 완료" + (f", {failed}개 실패" if failed else ""))
+        return {'uploaded': uploaded, 'failed': failed, 'pending': 0}
+
+
+def main():
+    """메인 실행 함수"""
+    import argparse
+
+    workspace = os.path.dirname(os.path.abspath(__file__))
+    load_env_file(Path(workspace) / ".env")
+
+    parser = argparse.ArgumentParser(description='assets/ 를 Cloudflare R2(S3 호환)에 증분 동기화')
+    parser.add_argument('--source-dir', default='assets', help='업로드할 로컬 디렉토리 (기본값: assets)')
+    parser.add_argument('--key-prefix', default=None, help='버킷 내 키 접두사 (기본값: --source-dir 과 동일)')
+    parser.add_argument('--bucket', default=os.environ.get('CF_R2_BUCKET'), help='버킷 이름 (기본값: CF_R2_BUCKET)')
+    parser.add_argument('--endpoint-url', default=os.environ.get('CF_R2_ENDPOINT_URL'),
+                        help='S3 호환 엔드포인트 (기본값: CF_R2_ACCOUNT_ID 로 R2 엔드포인트 구성)')
+    parser.add_argument('--cache-control', default=DEFAULT_CACHE_CONTROL, help=f'Cache-Control 헤더 (기본값: {DEFAULT_CACHE_CONTROL})')
+    parser.add_argument('--workers', type=int, default=8, help='동시 업로드 수 (기본값: 8)')
+    parser.add_argument('--retries', type=int, default=5, help='요청당 최대 시도 횟수 (기본값: 5)')
+    parser.add_argument('--force', action='store_true', help='매니페스트를 무시하고 전체 업로드')
+    parser.add_argument('--dry-run', action='store_true', help='실제 업로드 없이 대상만 확인')
+    parser.add_argument('--workspace', '-w', default=workspace, help='작업 공간 경로 (기본값: 스크립트 디렉토리)')
+
+    args = parser.parse_args()
+
+    if not args.bucket:
+        print("❌ 버킷이 지정되지 않았습니다. --bucket 또는 CF_R2_BUCKET 을 설정하세요.")
+        return 1
+
+    endpoint_url = args.endpoint_url
+    if not endpoint_url and os.environ.get('CF_R2_ACCOUNT_ID'):
+        endpoint_url = f"https://{os.environ['CF_R2_ACCOUNT_ID']}.r2.cloudflarestorage.com"
+
+    key_prefix = args.key_prefix if args.key_prefix is not None else args.source_dir
+
+    try:
+        syncer = R2AssetSync(
+            args.workspace,
+            bucket=args.bucket,
+            source_dir=args.source_dir,
+            key_prefix=key_prefix,
+            endpoint_url=endpoint_url,
+            access_key_id=os.environ.get('CF_R2_ACCESS_KEY_ID'),
+            secret_access_key=os.environ.get('CF_R2_SECRET_ACCESS_KEY'),
+            cache_control=args.cache_control,
+            workers=args.workers,
+            max_attempts=args.retries,
+        )
+        result = syncer.sync(dry_run=args.dry_run, force=args.force)
+    except Exception as e:
+        print(f"❌ 오류 발생: {e}")
+        return 1
+
+    return 1 if result['failed'] else 0
+
+
+if __name__ == "__main__":
+    exit(main())